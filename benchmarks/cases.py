@@ -0,0 +1,326 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from benchmarks.fixtures import (
+    Profile,
+    ProfileId,
+    SignedProfileAggregate,
+    create_profile_aggregate_list_factory,
+    create_profiles,
+)
+from dddesign.structure.applications import Application, ApplicationDependencyMapper, ApplicationFactory
+from dddesign.structure.domains.constants import BaseEnum
+from dddesign.structure.domains.dto import DataTransferObject
+from dddesign.structure.domains.errors import BaseError
+from dddesign.structure.domains.value_objects import ValueObject
+from dddesign.structure.infrastructure.adapters.external import ExternalAdapter
+from dddesign.utils.base_model import flatten_model_dump, flatten_model_dump_columns, iter_model_batches, wrap_error
+
+if TYPE_CHECKING:
+    from dddesign.structure.domains.entities import Entity
+
+# Every case accepts the size and prepares its data, the returned callable is the measured operation
+BenchmarkCase = Callable[[int], Callable[[], Any]]
+
+CASES: Dict[str, BenchmarkCase] = {}
+
+PROCESS_POOL_WORKERS = os.cpu_count() or 1
+
+
+def register(name: str) -> Callable[[BenchmarkCase], BenchmarkCase]:
+    def decorator(case: BenchmarkCase) -> BenchmarkCase:
+        CASES[name] = case
+        return case
+
+    return decorator
+
+
+@register('aggregate_list_factory.create_list')
+def create_list(size: int) -> Callable[[], Any]:
+    factory = create_profile_aggregate_list_factory()
+    profiles: List[Entity] = list(create_profiles(size))
+    return lambda: factory.create_list(profiles)
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool  # noqa: PLW0603
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=PROCESS_POOL_WORKERS)
+    return _process_pool
+
+
+@register('aggregate_list_factory.create_list_process_pool')
+def create_list_process_pool(size: int) -> Callable[[], Any]:
+    """Compare with `aggregate_list_factory.create_list` to find the size where the process pool pays off"""
+    factory = create_profile_aggregate_list_factory()
+    profiles: List[Entity] = list(create_profiles(size))
+    executor = get_process_pool()
+    chunk_size = max(-(-size // PROCESS_POOL_WORKERS), 1)
+    return lambda: factory.create_list(profiles, executor=executor, chunk_size=chunk_size)
+
+
+@register('aggregate_list_factory.create_list_signed')
+def create_list_signed(size: int) -> Callable[[], Any]:
+    factory = create_profile_aggregate_list_factory(SignedProfileAggregate)
+    profiles: List[Entity] = list(create_profiles(size))
+    return lambda: factory.create_list(profiles)
+
+
+@register('aggregate_list_factory.create_list_signed_process_pool')
+def create_list_signed_process_pool(size: int) -> Callable[[], Any]:
+    """Same as `aggregate_list_factory.create_list_process_pool` with an expensive validator"""
+    factory = create_profile_aggregate_list_factory(SignedProfileAggregate)
+    profiles: List[Entity] = list(create_profiles(size))
+    executor = get_process_pool()
+    chunk_size = max(-(-size // PROCESS_POOL_WORKERS), 1)
+    return lambda: factory.create_list(profiles, executor=executor, chunk_size=chunk_size)
+
+
+class Region(str, BaseEnum):
+    EU = 'eu'
+    US = 'us'
+
+
+class EuAdapter(ExternalAdapter): ...
+
+
+class UsAdapter(ExternalAdapter): ...
+
+
+class RegionApp(Application):
+    adapter: ExternalAdapter
+
+
+@register('application_factory.get')
+def application_factory_get(size: int) -> Callable[[], Any]:
+    factory: ApplicationFactory[RegionApp] = ApplicationFactory(
+        application_class=RegionApp,
+        dependency_mappers=(
+            ApplicationDependencyMapper(
+                application_attribute_name='adapter',
+                request_attribute_value_map={Region.EU: EuAdapter(), Region.US: UsAdapter()},
+            ),
+        ),
+    )
+    regions = [('eu', 'us')[index % 2] for index in range(size)]
+
+    def run():
+        for region in regions:
+            factory.get(region=region)
+
+    return run
+
+
+@register('track_changes_mixin.changed_data')
+def track_changes(size: int) -> Callable[[], Any]:
+    profiles = create_profiles(size)
+    for index, profile in enumerate(profiles):
+        if index % 2:
+            profile.name = 'changed'
+
+    def run():
+        for profile in profiles:
+            profile.changed_data  # noqa: B018
+
+    return run
+
+
+def create_profile_changes(size: int) -> List[Dict[str, Any]]:
+    return [
+        {'name': f'changed {index}', 'email': f'changed{index}@example.com', 'icon_id': None, 'tags': ['changed']}
+        for index in range(size)
+    ]
+
+
+@register('entity.setattr')
+def entity_setattr(size: int) -> Callable[[], Any]:
+    profiles = create_profiles(size)
+    changes = create_profile_changes(size)
+
+    def run():
+        for profile, values in zip(profiles, changes, strict=True):
+            for field_name, value in values.items():
+                setattr(profile, field_name, value)
+
+    return run
+
+
+@register('entity.bulk_assign')
+def entity_bulk_assign(size: int) -> Callable[[], Any]:
+    """Compare with `entity.setattr`"""
+    profiles = create_profiles(size)
+    changes = create_profile_changes(size)
+
+    def run():
+        for profile, values in zip(profiles, changes, strict=True):
+            profile.bulk_assign(**values)
+
+    return run
+
+
+class ProfileNotFoundError(BaseError):
+    message = 'Profile `{profile_id}` not found'
+    status_code = 404
+
+
+@register('base_error.init')
+def base_error_init(size: int) -> Callable[[], Any]:
+    profile_ids = [ProfileId() for _ in range(size)]
+    return lambda: [ProfileNotFoundError(profile_id=profile_id) for profile_id in profile_ids]
+
+
+@register('base_error.detail')
+def base_error_detail(size: int) -> Callable[[], Any]:
+    """Compare with `base_error.init` for the cost of non-raising error accumulation"""
+    profile_ids = [ProfileId() for _ in range(size)]
+    return lambda: [ProfileNotFoundError.detail(profile_id=profile_id) for profile_id in profile_ids]
+
+
+class Item(BaseModel):
+    email: str
+    quantity: int
+
+
+class Order(BaseModel):
+    items: List[Item]
+
+
+@register('wrap_error')
+def wrap_validation_error(size: int) -> Callable[[], Any]:
+    try:
+        Order(items=[{'email': index, 'quantity': 'invalid'} for index in range(size)])  # type: ignore[misc]
+    except ValidationError as error:
+        validation_error = error
+    return lambda: wrap_error(validation_error)
+
+
+class ItemDTO(DataTransferObject):
+    email: str
+    quantity: int
+
+
+def create_item_data(size: int) -> List[Dict[str, Any]]:
+    # every tenth item is invalid
+    return [{'email': f'user{index}@test', 'quantity': 'invalid' if index % 10 == 0 else index} for index in range(size)]
+
+
+@register('dto.validate_per_item')
+def dto_validate_per_item(size: int) -> Callable[[], Any]:
+    data = create_item_data(size)
+
+    def validate() -> Any:
+        items, errors = [], []
+        for index, item_data in enumerate(data):
+            try:
+                items.append(ItemDTO.model_validate(item_data))
+            except ValidationError as error:
+                errors.append(wrap_error(error, field_name_prefix=f'items.{index}'))
+        return items, errors
+
+    return validate
+
+
+@register('dto.validate_many')
+def dto_validate_many(size: int) -> Callable[[], Any]:
+    """Compare with `dto.validate_per_item`"""
+    data = create_item_data(size)
+    return lambda: ItemDTO.validate_many(data)
+
+
+def create_item_lines(size: int) -> bytes:
+    return b''.join(json.dumps(item_data).encode() + b'\n' for item_data in create_item_data(size))
+
+
+@register('json_lines.json_loads')
+def json_lines_json_loads(size: int) -> Callable[[], Any]:
+    content = create_item_lines(size)
+
+    def validate() -> Any:
+        items, errors = [], []
+        for line in content.splitlines():
+            try:
+                items.append(ItemDTO.model_validate(json.loads(line)))
+            except ValidationError as error:
+                errors.append(wrap_error(error))
+        return items, errors
+
+    return validate
+
+
+@register('json_lines.iter_model_batches')
+def json_lines_iter_model_batches(size: int) -> Callable[[], Any]:
+    """Compare with `json_lines.json_loads`"""
+    content = create_item_lines(size)
+    return lambda: list(iter_model_batches(ItemDTO, content))
+
+
+class Money(ValueObject):
+    amount: int
+    currency: str
+    country: str
+
+
+class CachedHashMoney(Money):
+    CACHE_HASH = True
+
+
+class InternedMoney(Money):
+    INTERN = True
+
+
+def create_money_data(size: int) -> List[Dict[str, Any]]:
+    # a few distinct values repeated many times, as currencies or units are
+    return [{'amount': index % 10, 'currency': 'USD', 'country': 'US'} for index in range(size)]
+
+
+@register('value_object.hash')
+def value_object_hash(size: int) -> Callable[[], Any]:
+    money = [Money.model_validate(data) for data in create_money_data(size)]
+    return lambda: [hash(item) for item in money for _ in range(10)]
+
+
+@register('value_object.hash_cached')
+def value_object_hash_cached(size: int) -> Callable[[], Any]:
+    """Compare with `value_object.hash`"""
+    money = [CachedHashMoney.model_validate(data) for data in create_money_data(size)]
+    return lambda: [hash(item) for item in money for _ in range(10)]
+
+
+@register('value_object.validate')
+def value_object_validate(size: int) -> Callable[[], Any]:
+    data = create_money_data(size)
+    return lambda: [Money.model_validate(item) for item in data]
+
+
+@register('value_object.validate_interned')
+def value_object_validate_interned(size: int) -> Callable[[], Any]:
+    """Compare with `value_object.validate`, the memory peak drops as equal instances are shared"""
+    data = create_money_data(size)
+    return lambda: [InternedMoney.model_validate(item) for item in data]
+
+
+@register('flatten_model_dump')
+def flatten(size: int) -> Callable[[], Any]:
+    profiles = create_profiles(size)
+    return lambda: [flatten_model_dump(profile) for profile in profiles]
+
+
+@register('flatten_model_dump_columns')
+def flatten_columns(size: int) -> Callable[[], Any]:
+    profiles: List[Profile] = create_profiles(size)
+    return lambda: flatten_model_dump_columns(profiles)
+
+
+@register('auto_uuid.generate')
+def auto_uuid(size: int) -> Callable[[], Any]:
+    return lambda: [ProfileId() for _ in range(size)]
+
+
+__all__ = ('CASES', 'BenchmarkCase')
@@ -0,0 +1,84 @@
+"""
+Runs the benchmark suite against several pydantic versions, each one in its own virtual environment,
+and prints the median time per operation relative to the first version:
+    python -m benchmarks.compare --pydantic-versions 2.1 2.12 -- --sizes 10 1000 --filter create_list
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import venv
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_PYDANTIC_VERSIONS = ('2.1', '2.10', '2.11', '2.12')
+DEFAULT_VENVS_DIR = ROOT_DIR / '.benchmarks' / 'venvs'
+
+
+def get_python(pydantic_version: str, venvs_dir: Path) -> Path:
+    venv_dir = venvs_dir / f'pydantic-{pydantic_version}'
+    python = venv_dir / 'bin' / 'python'
+    if not python.exists():
+        venv.create(venv_dir, with_pip=True)
+        subprocess.run(
+            (str(python), '-m', 'pip', 'install', '--quiet', f'pydantic=={pydantic_version}.*', 'ddutils<0.2.0'), check=True
+        )
+    return python
+
+
+def run_benchmarks(python: Path, runner_args: Sequence[str]) -> Dict:
+    with tempfile.TemporaryDirectory() as directory:
+        output_path = Path(directory) / 'results.json'
+        subprocess.run(
+            (str(python), '-m', 'benchmarks.runner', *runner_args, '--json', str(output_path)),
+            check=True,
+            cwd=ROOT_DIR,
+            env={**os.environ, 'PYTHONPATH': str(ROOT_DIR)},
+        )
+        with open(output_path) as file:
+            return json.load(file)
+
+
+def print_comparison(reports: List[Dict]):
+    medians: Dict[Tuple[str, int], Dict[str, float]] = {}
+    for report in reports:
+        for result in report['results']:
+            medians.setdefault((result['name'], result['size']), {})[report['pydantic']] = result['median']
+
+    versions = [report['pydantic'] for report in reports]
+    print(f'\n{"case":<40} {"size":>7}' + ''.join(f'{version:>22}' for version in versions))
+    for (name, size), version_medians in medians.items():
+        baseline = version_medians.get(versions[0])
+        cells = []
+        for version in versions:
+            median = version_medians.get(version)
+            if median is None:
+                cells.append(f'{"-":>22}')
+            else:
+                ratio = f' (x{median / baseline:.2f})' if baseline else ''
+                cells.append(f'{median * 1e3:>12.3f} ms{ratio:>8}')
+        print(f'{name:<40} {size:>7}' + ''.join(cells))
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pydantic-versions', nargs='+', default=DEFAULT_PYDANTIC_VERSIONS)
+    parser.add_argument('--venvs-dir', type=Path, default=DEFAULT_VENVS_DIR)
+    parser.add_argument('runner_args', nargs=argparse.REMAINDER, help='arguments passed to `benchmarks.runner` after `--`')
+    args = parser.parse_args(argv)
+
+    runner_args = args.runner_args[1:] if args.runner_args[:1] == ['--'] else args.runner_args
+    reports = []
+    for pydantic_version in args.pydantic_versions:
+        print(f'\npydantic {pydantic_version}', file=sys.stderr)
+        reports.append(run_benchmarks(get_python(pydantic_version, args.venvs_dir), runner_args))
+
+    print_comparison(reports)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Type
+
+from pydantic import BaseModel, model_validator
+
+from dddesign.components.domains.value_objects import AutoUUID
+from dddesign.structure.domains.aggregates import Aggregate
+from dddesign.structure.domains.aggregates.aggregate_list_factory import AggregateDependencyMapper, AggregateListFactory
+from dddesign.structure.domains.entities import Entity
+from dddesign.utils.base_model import TrackChangesMixin
+
+CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class ProfileId(AutoUUID): ...
+
+
+class Address(BaseModel):
+    country: str
+    city: str
+    street: str
+
+
+class Image(Entity):
+    image_id: int
+    url: str
+    width: int
+    height: int
+
+
+class Profile(Entity, TrackChangesMixin):
+    profile_id: ProfileId
+    name: str
+    email: str
+    icon_id: Optional[int]
+    address: Address
+    tags: List[str]
+    created_at: datetime
+
+
+class ProfileAggregate(Aggregate):
+    profile: Profile
+    icon: Optional[Image]
+
+
+class SignedProfileAggregate(Aggregate):
+    """Aggregate with a CPU-bound validator, the kind of work a process pool can parallelize"""
+
+    profile: Profile
+    icon: Optional[Image]
+
+    @model_validator(mode='after')
+    def validate_signature(self):
+        hashlib.pbkdf2_hmac('sha256', self.profile.email.encode(), b'salt', 200)
+        return self
+
+
+def create_profiles(size: int, icons_count: Optional[int] = None) -> List[Profile]:
+    icons_count = icons_count or max(size // 10, 1)
+    return [
+        Profile(
+            profile_id=ProfileId(),
+            name=f'name {index}',
+            email=f'user{index}@example.com',
+            icon_id=index % icons_count + 1 if index % 7 else None,
+            address=Address(country='country', city=f'city {index % 50}', street=f'street {index}'),
+            tags=['first', 'second'],
+            created_at=CREATED_AT,
+        )
+        for index in range(size)
+    ]
+
+
+def get_images(image_ids: List[int]) -> Dict[int, Image]:
+    return {
+        image_id: Image(image_id=image_id, url=f'https://example.com/{image_id}.png', width=64, height=64)
+        for image_id in image_ids
+    }
+
+
+def create_profile_aggregate_list_factory(
+    aggregate_class: Type[Aggregate] = ProfileAggregate,
+) -> AggregateListFactory[Aggregate]:
+    return AggregateListFactory(
+        aggregate_class=aggregate_class,
+        aggregate_entity_attribute_name='profile',
+        dependency_mappers=(
+            AggregateDependencyMapper(
+                entity_attribute_name='icon_id', aggregate_attribute_name='icon', method_getter=get_images
+            ),
+        ),
+    )
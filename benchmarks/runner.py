@@ -0,0 +1,110 @@
+"""
+Runs the benchmark cases and prints the time per operation and peak memory:
+    python -m benchmarks.runner --sizes 10 1000 100000 --filter create_list --json results.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import pydantic
+
+from benchmarks.cases import CASES
+
+DEFAULT_SIZES = (10, 1_000, 100_000)
+DEFAULT_REPEAT = 5
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    size: int
+    loops: int
+    best: float  # seconds per operation
+    median: float  # seconds per operation
+    peak_memory: Optional[int]  # bytes allocated at peak during one operation
+
+
+def measure_time(operation: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    timer = timeit.Timer(operation)
+    loops, _ = timer.autorange()
+    timings = [timing / loops for timing in timer.repeat(repeat=repeat, number=loops)]
+    return {'loops': loops, 'best': min(timings), 'median': statistics.median(timings)}
+
+
+def measure_peak_memory(operation: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        operation()
+        return tracemalloc.get_traced_memory()[1] - start_memory
+    finally:
+        tracemalloc.stop()
+
+
+def run(
+    sizes: Sequence[int] = DEFAULT_SIZES, name_filter: str = '', repeat: int = DEFAULT_REPEAT, memory: bool = True
+) -> List[BenchmarkResult]:
+    results = []
+    for name, case in CASES.items():
+        if name_filter not in name:
+            continue
+
+        for size in sizes:
+            operation = case(size)
+            result = BenchmarkResult(
+                name=name,
+                size=size,
+                peak_memory=measure_peak_memory(operation) if memory else None,
+                **measure_time(operation, repeat),
+            )
+            print(format_result(result), flush=True)
+            results.append(result)
+
+    return results
+
+
+def format_duration(seconds: float) -> str:
+    for unit, multiplier in (('s', 1), ('ms', 1e3), ('us', 1e6)):
+        if seconds * multiplier >= 1:
+            return f'{seconds * multiplier:.2f} {unit}'
+    return f'{seconds * 1e9:.0f} ns'
+
+
+def format_result(result: BenchmarkResult) -> str:
+    memory = '' if result.peak_memory is None else f'  peak memory {result.peak_memory / 1024:.1f} KiB'
+    return (
+        f'{result.name:<40} size {result.size:>7}  median {format_duration(result.median):>10}  '
+        f'best {format_duration(result.best):>10}  per item {format_duration(result.median / result.size):>10}{memory}'
+    )
+
+
+def get_environment() -> Dict[str, str]:
+    return {'python': platform.python_version(), 'pydantic': pydantic.VERSION}
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--filter', default='', help='run only cases which names contain the value')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--no-memory', action='store_true', help='skip peak memory measurements')
+    parser.add_argument('--json', help='path to save the results')
+    args = parser.parse_args(argv)
+
+    environment = get_environment()
+    print(f'python {environment["python"]}, pydantic {environment["pydantic"]}', file=sys.stderr)
+    results = run(sizes=args.sizes, name_filter=args.filter, repeat=args.repeat, memory=not args.no_memory)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({**environment, 'results': [result._asdict() for result in results]}, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,3 @@
-from . import structure, unittest, utils
+from dddesign.utils.lazy_import import lazy_import
 
-__all__ = ('structure', 'unittest', 'utils')
+__getattr__, __dir__, __all__ = lazy_import(__name__, submodules=('structure', 'unittest', 'utils'))
@@ -1,3 +1,3 @@
-from . import domains
+from dddesign.utils.lazy_import import lazy_import
 
-__all__ = ('domains',)
+__getattr__, __dir__, __all__ = lazy_import(__name__, submodules=('domains',))
@@ -1,3 +1,3 @@
-from . import dto, value_objects
+from dddesign.utils.lazy_import import lazy_import
 
-__all__ = ('dto', 'value_objects')
+__getattr__, __dir__, __all__ = lazy_import(__name__, submodules=('dto', 'value_objects'))
@@ -1 +1,8 @@
-from .errors import Errors
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .errors import Errors
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, attributes={'Errors': '.errors'})
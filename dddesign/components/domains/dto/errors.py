@@ -1,10 +1,10 @@
-from typing import Annotated, List
+from typing import Annotated, Iterable, List, Union
 
 from pydantic import Field
 
 from dddesign.components.domains.value_objects import Error
 from dddesign.structure.domains.dto import DataTransferObject
-from dddesign.structure.domains.errors import CollectionError
+from dddesign.structure.domains.errors import BaseError, CollectionError, ErrorAccumulator, ErrorDetail
 
 
 class Errors(DataTransferObject):
@@ -18,8 +18,13 @@ class Errors(DataTransferObject):
             return 400
 
     @classmethod
-    def factory(cls, errors: CollectionError) -> 'Errors':
-        return cls(errors=[Error(**error.__dict__) for error in errors])
+    def factory(cls, errors: Union[CollectionError, ErrorAccumulator, Iterable[Union[BaseError, ErrorDetail]]]) -> 'Errors':
+        return cls(
+            errors=[
+                Error(**(ErrorDetail.from_error(error) if isinstance(error, BaseError) else error)._asdict())
+                for error in errors
+            ]
+        )
 
 
 __all__ = ('Errors',)
@@ -1,2 +1,9 @@
-from .auto_uuid import AutoUUID
-from .error import Error
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .auto_uuid import AutoUUID
+    from .error import Error
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, attributes={'AutoUUID': '.auto_uuid', 'Error': '.error'})
@@ -1,7 +1,92 @@
-from uuid import UUID, SafeUUID, uuid4
+import os
+import threading
+import time
+from typing import Tuple
+from uuid import UUID, SafeUUID
 
 from pydantic_core import core_schema
 
+RANDOM_BUFFER_SIZE = 4096  # amount of random bytes read from `os.urandom` at once
+SUPPORTED_GENERATED_VERSIONS = (4, 7)
+
+_RANDOM_BITS_62 = (1 << 62) - 1
+_UUID7_COUNTER_MAX = 0xFFF
+
+
+class _RandomSource:
+    def __init__(self, buffer_size: int):
+        self._buffer_size = buffer_size
+        self._buffer = b''
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def reset(self):
+        self._buffer = b''
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def get_int(self) -> int:
+        with self._lock:
+            if self._offset + 16 > len(self._buffer):
+                self._buffer = os.urandom(self._buffer_size)
+                self._offset = 0
+            buffer, offset = self._buffer, self._offset
+            self._offset += 16
+        return int.from_bytes(buffer[offset : offset + 16], 'big')
+
+
+class _UUID7Counter:
+    def __init__(self):
+        self._timestamp_ms = 0
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def reset(self):
+        self._timestamp_ms = 0
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def get(self, random_int: int) -> Tuple[int, int]:
+        with self._lock:
+            timestamp_ms = time.time_ns() // 1_000_000
+            if timestamp_ms > self._timestamp_ms:
+                self._timestamp_ms = timestamp_ms
+                # the most significant bit stays zero to leave room for increments within the millisecond
+                self._counter = random_int >> 117
+            else:
+                self._counter += 1
+                if self._counter > _UUID7_COUNTER_MAX:
+                    self._timestamp_ms += 1
+                    self._counter = 0
+            return self._timestamp_ms, self._counter
+
+
+_random_source = _RandomSource(RANDOM_BUFFER_SIZE)
+_uuid7_counter = _UUID7Counter()
+
+if hasattr(os, 'register_at_fork'):
+    # child processes must not reuse random bytes buffered by the parent
+    os.register_at_fork(after_in_child=_random_source.reset)
+    os.register_at_fork(after_in_child=_uuid7_counter.reset)
+
+
+def _generate_uuid4_int() -> int:
+    value = _random_source.get_int()
+    value &= ~(0xC000 << 48)
+    value |= 0x8000 << 48  # variant RFC 4122
+    value &= ~(0xF000 << 64)
+    value |= 4 << 76
+    return value
+
+
+def _generate_uuid7_int() -> int:
+    random_int = _random_source.get_int()
+    timestamp_ms, counter = _uuid7_counter.get(random_int)
+    return (timestamp_ms << 80) | (7 << 76) | (counter << 64) | (0b10 << 62) | (random_int & _RANDOM_BITS_62)
+
+
+_GENERATORS = {4: _generate_uuid4_int, 7: _generate_uuid7_int}
+
 
 class AutoUUID(UUID):
     """
@@ -9,6 +94,9 @@ class AutoUUID(UUID):
     - AutoUUID() with no arguments -> generates a random UUID4.
     - AutoUUID(x) with arguments -> identical to UUID(x).
 
+    Set `GENERATED_VERSION = 7` on a subclass to generate time-ordered UUID7,
+    which keeps B-tree indexes on primary keys compact.
+
     Compatible with Pydantic (v1 and v2) for use as a field type.
 
     Example:
@@ -19,15 +107,23 @@ class AutoUUID(UUID):
             name: str
 
         Customer(name='John Doe')
+
+        class OrderId(AutoUUID):
+            GENERATED_VERSION = 7
     """
 
+    GENERATED_VERSION: int = 4
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.GENERATED_VERSION not in SUPPORTED_GENERATED_VERSIONS:
+            raise ValueError(f'`GENERATED_VERSION` must be one of {SUPPORTED_GENERATED_VERSIONS}')
+
     def __init__(self, *args, **kwargs):
-        # If no args/kwargs, generate a new random UUID4
+        # If no args/kwargs, generate a new UUID of `GENERATED_VERSION`
         if not args and not kwargs:
-            rand_uuid = uuid4()
-            object.__setattr__(self, 'int', rand_uuid.int)
-            # Preserve is_safe attribute if available (Python 3.7+)
-            object.__setattr__(self, 'is_safe', getattr(rand_uuid, 'is_safe', SafeUUID.unknown))
+            object.__setattr__(self, 'int', _GENERATORS[self.GENERATED_VERSION]())
+            object.__setattr__(self, 'is_safe', SafeUUID.unknown)
         # If a UUID instance is passed, convert it (not handled by base UUID)
         elif len(args) == 1 and isinstance(args[0], UUID):
             base_uuid = args[0]
@@ -74,10 +170,20 @@ class AutoUUID(UUID):
 
     # -------------------- Pydantic v2 --------------------
 
+    @classmethod
+    def _from_uuid(cls, value: UUID):
+        if isinstance(value, cls):
+            return value
+
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, 'int', value.int)
+        object.__setattr__(instance, 'is_safe', getattr(value, 'is_safe', SafeUUID.unknown))
+        return instance
+
     @classmethod
     def __get_pydantic_core_schema__(cls, source_type, handler):
         base_schema = handler(UUID)
-        return core_schema.no_info_after_validator_function(cls, base_schema)
+        return core_schema.no_info_after_validator_function(cls._from_uuid, base_schema)
 
     @classmethod
     def __get_pydantic_json_schema__(cls, core_schema, handler):
@@ -1,3 +1,3 @@
-from . import applications, domains, infrastructure, services
+from dddesign.utils.lazy_import import lazy_import
 
-__all__ = ('applications', 'domains', 'infrastructure', 'services')
+__getattr__, __dir__, __all__ = lazy_import(__name__, submodules=('applications', 'domains', 'infrastructure', 'services'))
@@ -1,2 +1,16 @@
-from .application import Application
-from .application_factory import ApplicationDependencyMapper, ApplicationFactory
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .application import Application
+    from .application_factory import ApplicationDependencyMapper, ApplicationFactory
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    attributes={
+        'Application': '.application',
+        'ApplicationDependencyMapper': '.application_factory',
+        'ApplicationFactory': '.application_factory',
+    },
+)
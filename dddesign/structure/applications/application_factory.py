@@ -1,3 +1,4 @@
+import time
 from typing import Any, Dict, Generic, NamedTuple, Optional, Tuple, Type, TypeVar, Union
 
 from ddutils.annotation_helpers import is_subclass
@@ -12,6 +13,7 @@ from dddesign.structure.infrastructure.adapters.internal import InternalAdapter
 from dddesign.structure.infrastructure.repositories import Repository
 from dddesign.structure.services.service import Service
 from dddesign.utils.base_model import create_pydantic_error_instance
+from dddesign.utils.instrumentation import Event, emit, has_observers
 
 ApplicationT = TypeVar('ApplicationT')
 
@@ -33,6 +35,8 @@ RequestAttributeName = str
 RequestAttributeValue = Any
 RequestAttributeValueCombination = Tuple[RequestAttributeValue, ...]
 
+IMPLEMENTATION_EVENT = 'application_factory.implementation'
+
 
 class RequestAttributeNotProvideError(BaseError):
     message = 'Request attribute `{attribute_name}` not provide'
@@ -202,12 +206,10 @@ class ApplicationFactory(BaseModel, Generic[ApplicationT]):
         request_attribute_value_combination = []
         for attribute in self._request_attributes:
             if attribute.name in kwargs:
-                try:
-                    request_attribute_value_combination.append(attribute.enum_class(kwargs[attribute.name]))
-                except ValueError as err:
-                    raise RequestAttributeValueError(
-                        attribute_name=attribute.name, attribute_value=kwargs[attribute.name]
-                    ) from err
+                request_attribute_value = attribute.enum_class.coerce(kwargs[attribute.name])
+                if request_attribute_value is None:
+                    raise RequestAttributeValueError(attribute_name=attribute.name, attribute_value=kwargs[attribute.name])
+                request_attribute_value_combination.append(request_attribute_value)
             else:
                 raise RequestAttributeNotProvideError(attribute_name=attribute.name)
 
@@ -217,8 +219,19 @@ class ApplicationFactory(BaseModel, Generic[ApplicationT]):
         request_attribute_value_combination = self._get_request_attribute_value_combination(**kwargs)
 
         if request_attribute_value_combination in self._application_implementations:
+            if has_observers(IMPLEMENTATION_EVENT):
+                emit(
+                    Event(
+                        name=IMPLEMENTATION_EVENT,
+                        source=self,
+                        attributes={'cache_hit': True, 'request_attribute_values': request_attribute_value_combination},
+                    )
+                )
             return self._application_implementations[request_attribute_value_combination]
 
+        observed = has_observers(IMPLEMENTATION_EVENT)
+        started_at = time.perf_counter() if observed else 0.0
+
         application_impl = self.application_class(
             **{
                 self.dependency_mappers[index].application_attribute_name: dependency_value
@@ -233,6 +246,16 @@ class ApplicationFactory(BaseModel, Generic[ApplicationT]):
         if self.reuse_implementations:
             self._application_implementations[request_attribute_value_combination] = application_impl
 
+        if observed:
+            emit(
+                Event(
+                    name=IMPLEMENTATION_EVENT,
+                    source=self,
+                    duration=time.perf_counter() - started_at,
+                    attributes={'cache_hit': False, 'request_attribute_values': request_attribute_value_combination},
+                )
+            )
+
         return application_impl
 
     @property
@@ -246,6 +269,7 @@ class ApplicationFactory(BaseModel, Generic[ApplicationT]):
 __all__ = (
     'ApplicationFactory',
     'ApplicationDependencyMapper',
+    'IMPLEMENTATION_EVENT',
     'RequestAttribute',
     'RequestAttributeValueError',
     'RequestAttributeNotProvideError',
@@ -1,3 +1,5 @@
-from . import aggregates, constants, dto, entities, errors, value_objects
+from dddesign.utils.lazy_import import lazy_import
 
-__all__ = ('aggregates', 'constants', 'dto', 'entities', 'errors', 'value_objects')
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__, submodules=('aggregates', 'constants', 'dto', 'entities', 'errors', 'value_objects')
+)
@@ -1,2 +1,16 @@
-from .aggregate import Aggregate
-from .aggregate_list_factory import AggregateDependencyMapper, AggregateListFactory
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .aggregate import Aggregate
+    from .aggregate_list_factory import AggregateDependencyMapper, AggregateListFactory
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    attributes={
+        'Aggregate': '.aggregate',
+        'AggregateDependencyMapper': '.aggregate_list_factory',
+        'AggregateListFactory': '.aggregate_list_factory',
+    },
+)
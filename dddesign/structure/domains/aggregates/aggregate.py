@@ -1,8 +1,101 @@
-from pydantic import BaseModel, ConfigDict
+from typing import TYPE_CHECKING, Any, Dict, Generator, Mapping, Protocol, Tuple, Type, TypeVar
 
+from pydantic import ConfigDict, PrivateAttr, ValidationError
 
-class Aggregate(BaseModel):
+from dddesign.utils.base_model import BulkAssignMixin
+from dddesign.utils.base_model.field_validation import validate_fields, validate_model
+
+AggregateT = TypeVar('AggregateT', bound='Aggregate')
+
+
+class LazyAttributeLoader(Protocol):
+    def load(self, aggregate: 'Aggregate') -> Any: ...
+
+
+class Aggregate(BulkAssignMixin):
     model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
 
+    # attributes that are not loaded yet, see `AggregateDependencyMapper.lazy`
+    _lazy_attribute_loaders: Dict[str, LazyAttributeLoader] = PrivateAttr(default_factory=dict)
+
+    if not TYPE_CHECKING:
+        # declared only at runtime, so type checkers still report unknown attributes
+
+        def __getattr__(self, name: str) -> Any:
+            try:
+                loader = object.__getattribute__(self, '__pydantic_private__')['_lazy_attribute_loaders'][name]
+            except (AttributeError, KeyError, TypeError):
+                return super().__getattr__(name)
+
+            value = validate_fields(self, {name: loader.load(self)})[0][name]
+            self.__dict__[name] = value
+            self.__pydantic_fields_set__.add(name)
+            self._lazy_attribute_loaders.pop(name, None)
+            return value
+
+    @classmethod
+    def model_validate_lazy(
+        cls: Type[AggregateT], data: Mapping[str, Any], lazy_attribute_loaders: Mapping[str, LazyAttributeLoader]
+    ) -> AggregateT:
+        """
+        Validates `data` like `bulk_assign` does: field by field, then model validators once, so those reading
+        a lazy attribute load it right away. Attributes of `lazy_attribute_loaders` are loaded on first access
+        and validated by their field validators, their defaults are not used.
+        """
+        missing_field_names = [
+            name
+            for name, field in cls.model_fields.items()
+            if field.is_required() and name not in data and name not in lazy_attribute_loaders
+        ]
+        if missing_field_names:
+            raise ValidationError.from_exception_data(
+                cls.__name__, [{'type': 'missing', 'loc': (name,), 'input': data} for name in missing_field_names]
+            )
+
+        aggregate = cls.model_construct(**data)
+        for name in lazy_attribute_loaders:
+            aggregate.__dict__.pop(name, None)
+            aggregate.__pydantic_fields_set__.discard(name)
+
+        validated_data, fields_set = validate_fields(aggregate, data)
+        object.__setattr__(aggregate, '__dict__', validated_data)
+        aggregate.__pydantic_fields_set__.update(fields_set)
+        aggregate._lazy_attribute_loaders.update(lazy_attribute_loaders)
+        validate_model(aggregate)
+        return aggregate
+
+    def resolve_lazy_attributes(self):
+        for name in tuple(self._lazy_attribute_loaders):
+            if name in self.__dict__:  # assigned before the first access
+                self._lazy_attribute_loaders.pop(name, None)
+            else:
+                getattr(self, name)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Aggregate) and self is not other:
+            self.resolve_lazy_attributes()
+            other.resolve_lazy_attributes()
+        return super().__eq__(other)
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:  # type: ignore[override]
+        self.resolve_lazy_attributes()
+        yield from super().__iter__()
+
+    def __repr_args__(self):
+        self.resolve_lazy_attributes()
+        return super().__repr_args__()
+
+    def bulk_assign(self, **values: Any) -> None:
+        self.resolve_lazy_attributes()
+        super().bulk_assign(**values)
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        self.resolve_lazy_attributes()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self.resolve_lazy_attributes()
+        return super().model_dump_json(**kwargs)
+
 
-__all__ = ('Aggregate',)
+__all__ = ('Aggregate', 'LazyAttributeLoader')
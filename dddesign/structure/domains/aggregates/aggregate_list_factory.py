@@ -1,5 +1,27 @@
+import inspect
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from contextvars import copy_context
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, NamedTuple, Tuple, Type, TypeVar
+from itertools import islice
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from ddutils.annotation_helpers import (
     get_annotation_origin,
@@ -9,26 +31,45 @@ from ddutils.annotation_helpers import (
     is_complex_sequence,
     is_subclass,
 )
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from dddesign.structure.domains.aggregates import Aggregate
 from dddesign.structure.domains.entities import Entity
+from dddesign.structure.domains.errors import BaseError
 from dddesign.utils.base_model import create_pydantic_error_instance
-
-if TYPE_CHECKING:
-    from collections.abc import Sequence
+from dddesign.utils.instrumentation import Event, emit, has_observers
 
 AggregateT = TypeVar('AggregateT', bound=Aggregate)
 
 RelatedObject = Any
 RelatedObjectId = Any
 
+DEPENDENCY_FETCH_EVENT = 'aggregate_list_factory.dependency_fetch'
+CONSTRUCTION_EVENT = 'aggregate_list_factory.construction'
+DEPENDENCY_DEGRADED_EVENT = 'aggregate_list_factory.dependency_degraded'
+
+
+class DependencyTimeoutError(BaseError):
+    message = 'Related objects for `{aggregate_attribute_name}` were not fetched in time'
+    status_code = 504
+
+
+def build_aggregates(aggregate_class: Type[AggregateT], aggregate_inits: List[Dict[str, Any]]) -> List[AggregateT]:
+    """Executed by workers of an executor, a process pool pickles both arguments and the result once"""
+    return [aggregate_class(**aggregate_init) for aggregate_init in aggregate_inits]
+
 
 class MethodArgument(NamedTuple):
     name: str
     annotation: Any
 
 
+class PartialAggregateList(NamedTuple):
+    aggregates: List[Any]
+    # aggregate attributes filled with stale or `None` values because their dependencies were not fetched in time
+    degraded_attribute_names: Tuple[str, ...]
+
+
 class AggregateDependencyMapper(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -37,14 +78,28 @@ class AggregateDependencyMapper(BaseModel):
 
     method_getter: Callable
     method_extra_arguments: Dict[str, Any] = Field(default_factory=dict)
-
-    @cached_property
-    def method_related_argument(self) -> MethodArgument:
-        declared_arguments = {*self.method_extra_arguments.keys(), 'return'}
+    # limits amount of IDs passed to the batch method per call, chunks are fetched by `max_workers` threads
+    max_batch_size: Optional[int] = Field(default=None, gt=0)
+    max_workers: int = Field(default=1, gt=0)
+    # seconds to wait for related objects, on expiration an optional aggregate attribute is filled
+    # with the last `stale_cache_size` fetched related objects, a required one raises `DependencyTimeoutError`
+    timeout: Optional[float] = Field(default=None, gt=0)
+    stale_cache_size: int = Field(default=0, ge=0)
+    # related objects are fetched for all aggregates of a list on the first access to the attribute of any of them
+    lazy: bool = False
+    # one-to-many relation, the method returns lists of related objects grouped by IDs (e.g. `Dict[OrderId, List[Item]]`)
+    # or a flat list of related objects which `related_key_attribute_name` attribute refers to the ID
+    many: bool = False
+    related_key_attribute_name: Optional[str] = None
+
+    # private attributes
+    _stale_cache: 'OrderedDict[RelatedObjectId, RelatedObject]' = PrivateAttr(default_factory=OrderedDict)
+    _stale_cache_lock: Lock = PrivateAttr(default_factory=Lock)
+
+    @staticmethod
+    def _get_method_related_argument(method: Callable, declared_arguments: Set[str]) -> MethodArgument:
         not_declared_arguments = {
-            name: annotation
-            for name, annotation in self.method_getter.__annotations__.items()
-            if name not in declared_arguments
+            name: annotation for name, annotation in method.__annotations__.items() if name not in declared_arguments
         }
         if len(not_declared_arguments) != 1:
             raise create_pydantic_error_instance(
@@ -63,6 +118,10 @@ class AggregateDependencyMapper(BaseModel):
 
         return MethodArgument(name=name, annotation=annotation)
 
+    @cached_property
+    def method_related_argument(self) -> MethodArgument:
+        return self._get_method_related_argument(self.method_getter, {*self.method_extra_arguments.keys(), 'return'})
+
     @cached_property
     def method_return_argument_annotation(self) -> Any:
         method_return_argument_annotation = self.method_getter.__annotations__.get('return')
@@ -72,6 +131,118 @@ class AggregateDependencyMapper(BaseModel):
             )
         return method_return_argument_annotation
 
+    @cached_property
+    def batch_method(self) -> Optional[Tuple[Callable, MethodArgument]]:
+        """
+        Returns the method that fetches related objects for a collection of IDs:
+        either `method_getter` itself or, when `method_getter` is a bound `get` method,
+        the `get_map` method of the same object (e.g. a repository with derived bulk methods).
+        """
+        if is_complex_sequence(self.method_related_argument.annotation):
+            return self.method_getter, self.method_related_argument
+
+        owner = getattr(self.method_getter, '__self__', None)
+        if owner is None or self.method_extra_arguments or getattr(self.method_getter, '__name__', None) != 'get':
+            return None
+
+        get_map = getattr(owner, 'get_map', None)
+        if not callable(get_map) or inspect.iscoroutinefunction(get_map):
+            return None
+
+        try:
+            related_argument = self._get_method_related_argument(get_map, {'return'})
+            key_annotation, value_annotation = get_dict_items_annotation(get_map.__annotations__.get('return'))
+        except (TypeError, ValueError):
+            return None
+
+        if (
+            not is_complex_sequence(related_argument.annotation)
+            or key_annotation != get_complex_sequence_element_annotation(related_argument.annotation)
+            or get_annotation_without_optional(value_annotation)
+            != get_annotation_without_optional(self.method_return_argument_annotation)
+        ):
+            return None
+
+        return get_map, related_argument
+
+    def get_related_object_map(self, related_object_ids: Iterable[RelatedObjectId]) -> Dict[RelatedObjectId, RelatedObject]:
+        if self.batch_method is None:
+            raise TypeError('Dependency mapper does not have a batch method')
+
+        batch_method, batch_method_related_argument = self.batch_method
+        annotation_origin = get_annotation_origin(batch_method_related_argument.annotation)
+        related_object_ids = tuple(related_object_ids)
+        if not related_object_ids:
+            return {}
+
+        batch_size = self.max_batch_size or len(related_object_ids)
+        chunks: List[Sequence[RelatedObjectId]] = [
+            annotation_origin(related_object_ids[index : index + batch_size])
+            for index in range(0, len(related_object_ids), batch_size)
+        ]
+
+        def fetch(chunk: Sequence[RelatedObjectId]) -> Dict[RelatedObjectId, RelatedObject]:
+            result = batch_method(**{batch_method_related_argument.name: chunk, **self.method_extra_arguments})
+            return result if self.related_key_attribute_name is None else self._group_related_objects(result)
+
+        max_workers = min(self.max_workers, len(chunks))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # every chunk gets a copy of the context, so context variables (e.g. identity map scope) are kept
+                futures = [executor.submit(copy_context().run, fetch, chunk) for chunk in chunks]
+                related_object_maps = [future.result() for future in futures]
+        else:
+            related_object_maps = [fetch(chunk) for chunk in chunks]
+
+        if len(related_object_maps) == 1:
+            return related_object_maps[0]
+
+        related_objects: Dict[RelatedObjectId, RelatedObject] = {}
+        for related_object_map in related_object_maps:
+            related_objects.update(related_object_map)
+        return related_objects
+
+    def _group_related_objects(self, related_objects: Iterable[RelatedObject]) -> Dict[RelatedObjectId, List[RelatedObject]]:
+        grouped_related_objects: Dict[RelatedObjectId, List[RelatedObject]] = {}
+        for related_object in related_objects:
+            related_object_id = getattr(related_object, self.related_key_attribute_name)  # type: ignore[arg-type]
+            if related_object_id in grouped_related_objects:
+                grouped_related_objects[related_object_id].append(related_object)
+            else:
+                grouped_related_objects[related_object_id] = [related_object]
+        return grouped_related_objects
+
+    def get_related_object(
+        self, related_objects: Dict[RelatedObjectId, RelatedObject], related_object_id: RelatedObjectId
+    ) -> RelatedObject:
+        related_object = related_objects.get(related_object_id)
+        if related_object is None and self.many:
+            return []
+        return related_object
+
+    @cached_property
+    def related_object_annotation(self) -> Any:
+        """Annotation of the value that is set to the aggregate attribute"""
+        if self.related_key_attribute_name is not None or not is_complex_sequence(self.method_related_argument.annotation):
+            return self.method_return_argument_annotation
+        return get_dict_items_annotation(self.method_return_argument_annotation)[1]
+
+    def remember_related_objects(self, related_objects: Dict[RelatedObjectId, RelatedObject]):
+        if not self.stale_cache_size:
+            return
+
+        with self._stale_cache_lock:
+            for related_object_id, related_object in related_objects.items():
+                if related_object is not None:
+                    self._stale_cache[related_object_id] = related_object
+                    self._stale_cache.move_to_end(related_object_id)
+            while len(self._stale_cache) > self.stale_cache_size:
+                self._stale_cache.popitem(last=False)
+
+    def get_stale_related_objects(self) -> Dict[RelatedObjectId, RelatedObject]:
+        with self._stale_cache_lock:
+            return dict(self._stale_cache)
+
     @model_validator(mode='after')
     def validate_consistency(self):
         # wurm up properties because they are cached
@@ -84,7 +255,29 @@ class AggregateDependencyMapper(BaseModel):
                     message=f'Property `{property_name}` must be initialized',
                 )
 
-        if is_complex_sequence(self.method_related_argument.annotation):
+        if self.related_key_attribute_name is not None and not self.many:
+            raise create_pydantic_error_instance(
+                base_error=ValueError,
+                code='related_key_attribute_name_requires_many',
+                message='`related_key_attribute_name` can be used only for one-to-many relation (`many=True`)',
+            )
+
+        if self.many and not is_complex_sequence(self.method_related_argument.annotation):
+            raise create_pydantic_error_instance(
+                base_error=ValueError,
+                code='many_requires_sequence_related_argument',
+                message='Method of one-to-many relation must accept a collection of related object IDs',
+            )
+
+        if self.related_key_attribute_name is not None:
+            # A flat list of related objects is grouped by `related_key_attribute_name`
+            if not is_complex_sequence(self.method_return_argument_annotation):
+                raise create_pydantic_error_instance(
+                    base_error=ValueError,
+                    code='method_return_annotation_must_be_sequence',
+                    message='Return annotation of method must be a sequence when `related_key_attribute_name` is set',
+                )
+        elif is_complex_sequence(self.method_related_argument.annotation):
             # If the method accepts a list of related object IDs,
             # it should return a map where the key is the ID of the related object
             try:
@@ -110,9 +303,48 @@ class AggregateDependencyMapper(BaseModel):
                     message='Key annotation of dict must be the same as the method argument annotation',
                 )
 
+            if self.many and not is_complex_sequence(self.related_object_annotation):
+                raise create_pydantic_error_instance(
+                    base_error=ValueError,
+                    code='value_annotation_must_be_sequence',
+                    message='Value annotation of dict must be a sequence for one-to-many relation',
+                )
+
+        if (self.max_batch_size is not None or self.max_workers > 1) and self.batch_method is None:
+            raise create_pydantic_error_instance(
+                base_error=ValueError,
+                code='batch_options_require_batch_method',
+                message='`max_batch_size` and `max_workers` require a method accepting a collection of related object IDs',
+            )
+
         return self
 
 
+class LazyDependencyLoader:
+    """Fetches related objects of one dependency for all entities of a list on the first load"""
+
+    __slots__ = ('_dependency', '_entities', '_factory', '_lock', '_related_objects')
+
+    def __init__(self, factory: 'AggregateListFactory', dependency: AggregateDependencyMapper, entities: List[Entity]):
+        self._factory = factory
+        self._dependency = dependency
+        self._entities: Optional[List[Entity]] = entities
+        self._related_objects: Optional[Dict[RelatedObjectId, RelatedObject]] = None
+        self._lock = Lock()
+
+    def load(self, aggregate: Aggregate) -> Any:
+        if self._related_objects is None:
+            with self._lock:
+                if self._related_objects is None and self._entities is not None:
+                    self._related_objects = self._factory._fetch_related_objects(self._dependency, self._entities)
+                    self._entities = None  # entities are referenced by aggregates anyway
+
+        entity = getattr(aggregate, self._factory.aggregate_entity_attribute_name)
+        return self._dependency.get_related_object(
+            self._related_objects or {}, getattr(entity, self._dependency.entity_attribute_name)
+        )
+
+
 class AggregateListFactory(BaseModel, Generic[AggregateT]):
     model_config = ConfigDict(frozen=True)
 
@@ -149,12 +381,7 @@ class AggregateListFactory(BaseModel, Generic[AggregateT]):
             aggregate_target_attribute_annotation = get_annotation_without_optional(
                 self.aggregate_class.__annotations__[dependency.aggregate_attribute_name]
             )
-            dependency_return_object_annotation = dependency.method_return_argument_annotation
-
-            if is_complex_sequence(dependency.method_related_argument.annotation):
-                _, dependency_return_object_annotation = get_dict_items_annotation(dependency_return_object_annotation)
-
-            dependency_return_object_annotation = get_annotation_without_optional(dependency_return_object_annotation)
+            dependency_return_object_annotation = get_annotation_without_optional(dependency.related_object_annotation)
 
             if aggregate_target_attribute_annotation != dependency_return_object_annotation:
                 raise create_pydantic_error_instance(
@@ -165,49 +392,247 @@ class AggregateListFactory(BaseModel, Generic[AggregateT]):
 
         return self
 
-    def create_list(self, entities: List[Entity]) -> List[AggregateT]:
-        dependency_related_object_map: Dict[int, Dict[RelatedObjectId, RelatedObject]] = {}
-        for dependency_item, dependency in enumerate(self.dependency_mappers):
-            related_objects: Dict[RelatedObjectId, RelatedObject] = {}
-            if is_complex_sequence(dependency.method_related_argument.annotation):
-                annotation_origin = get_annotation_origin(dependency.method_related_argument.annotation)
-                related_object_ids: Sequence[RelatedObjectId] = annotation_origin(
-                    {
-                        related_object_id
-                        for entity in entities
-                        if (
-                            (related_object_id := getattr(entity, dependency.entity_attribute_name))
-                            and related_object_id is not None
-                        )
-                    }
-                )
-                related_objects = dependency.method_getter(
-                    **{dependency.method_related_argument.name: related_object_ids, **dependency.method_extra_arguments}
+    def _fetch_related_objects(
+        self, dependency: AggregateDependencyMapper, entities: List[Entity]
+    ) -> Dict[RelatedObjectId, RelatedObject]:
+        observed = has_observers(DEPENDENCY_FETCH_EVENT)
+        started_at = time.perf_counter() if observed else 0.0
+
+        related_objects: Dict[RelatedObjectId, RelatedObject] = {}
+        ids_collection_duration: Optional[float] = None  # ids are collected along with the calls without a batch method
+        if dependency.batch_method is not None:
+            related_object_ids: Set[RelatedObjectId] = {
+                related_object_id
+                for entity in entities
+                if (related_object_id := getattr(entity, dependency.entity_attribute_name)) and related_object_id is not None
+            }
+            ids_collection_duration = time.perf_counter() - started_at if observed else None
+            related_objects = dependency.get_related_object_map(related_object_ids)
+            ids_count = len(related_object_ids)
+        else:
+            for entity in entities:
+                related_object_id = getattr(entity, dependency.entity_attribute_name)
+                if related_object_id is not None and related_object_id not in related_objects:
+                    related_object = dependency.method_getter(
+                        **{dependency.method_related_argument.name: related_object_id, **dependency.method_extra_arguments}
+                    )
+                    related_objects[related_object_id] = related_object
+            ids_count = len(related_objects)
+
+        dependency.remember_related_objects(related_objects)
+
+        if observed:
+            finished_at = time.perf_counter()
+            emit(
+                Event(
+                    name=DEPENDENCY_FETCH_EVENT,
+                    source=self,
+                    duration=finished_at - started_at,
+                    attributes={
+                        'aggregate_attribute_name': dependency.aggregate_attribute_name,
+                        'batch': dependency.batch_method is not None,
+                        'ids_count': ids_count,
+                        'ids_collection_duration': ids_collection_duration,
+                        'objects_count': len(related_objects),
+                    },
                 )
-            else:
-                for entity in entities:
-                    related_object_id = getattr(entity, dependency.entity_attribute_name)
-                    if related_object_id is not None and related_object_id not in related_objects:
-                        related_object = dependency.method_getter(
-                            **{dependency.method_related_argument.name: related_object_id, **dependency.method_extra_arguments}
-                        )
-                        related_objects[related_object_id] = related_object
+            )
 
-            dependency_related_object_map[dependency_item] = related_objects
+        return related_objects
 
-        aggregates: List[AggregateT] = []
+    def _get_aggregate_inits(
+        self, entities: List[Entity], dependency_related_object_map: Dict[int, Dict[RelatedObjectId, RelatedObject]]
+    ) -> Iterator[Dict[str, Any]]:
         for entity in entities:
             aggregate_init: Dict[str, Any] = {self.aggregate_entity_attribute_name: entity}
-            for dependency_item, dependency in enumerate(self.dependency_mappers):
-                related_object_id = getattr(entity, dependency.entity_attribute_name)
-                aggregate_init[dependency.aggregate_attribute_name] = dependency_related_object_map[dependency_item].get(
-                    related_object_id
+            for dependency_item, dependency in self.eager_dependencies:
+                aggregate_init[dependency.aggregate_attribute_name] = dependency.get_related_object(
+                    dependency_related_object_map[dependency_item], getattr(entity, dependency.entity_attribute_name)
                 )
+            yield aggregate_init
+
+    def _build_lazy_aggregates(
+        self,
+        aggregate_inits: Iterator[Dict[str, Any]],
+        lazy_dependencies: Tuple[AggregateDependencyMapper, ...],
+        entities: List[Entity],
+    ) -> List[AggregateT]:
+        lazy_attribute_loaders = {
+            dependency.aggregate_attribute_name: LazyDependencyLoader(self, dependency, entities)
+            for dependency in lazy_dependencies
+        }
 
-            aggregate = self.aggregate_class(**aggregate_init)
-            aggregates.append(aggregate)
+        return [
+            self.aggregate_class.model_validate_lazy(aggregate_init, lazy_attribute_loaders)
+            for aggregate_init in aggregate_inits
+        ]
 
+    def _build_aggregates_in_executor(
+        self, aggregate_inits: Iterator[Dict[str, Any]], executor: Executor, chunk_size: int
+    ) -> List[AggregateT]:
+        futures = []
+        while chunk := list(islice(aggregate_inits, chunk_size)):
+            futures.append(executor.submit(build_aggregates, self.aggregate_class, chunk))
+
+        aggregates: List[AggregateT] = []
+        for future in futures:
+            aggregates.extend(future.result())
         return aggregates
 
+    @cached_property
+    def eager_dependencies(self) -> Tuple[Tuple[int, AggregateDependencyMapper], ...]:
+        return tuple(
+            (dependency_item, dependency)
+            for dependency_item, dependency in enumerate(self.dependency_mappers)
+            if not dependency.lazy
+        )
+
+    @cached_property
+    def optional_attribute_names(self) -> Set[str]:
+        return {
+            dependency.aggregate_attribute_name
+            for dependency in self.dependency_mappers
+            if (annotation := self.aggregate_class.__annotations__[dependency.aggregate_attribute_name])
+            != get_annotation_without_optional(annotation)
+        }
 
-__all__ = ('AggregateListFactory', 'AggregateDependencyMapper', 'MethodArgument')
+    def _degrade_dependency(self, dependency: AggregateDependencyMapper) -> Dict[RelatedObjectId, RelatedObject]:
+        if dependency.aggregate_attribute_name not in self.optional_attribute_names:
+            raise DependencyTimeoutError(aggregate_attribute_name=dependency.aggregate_attribute_name)
+
+        related_objects = dependency.get_stale_related_objects()
+        if has_observers(DEPENDENCY_DEGRADED_EVENT):
+            emit(
+                Event(
+                    name=DEPENDENCY_DEGRADED_EVENT,
+                    source=self,
+                    attributes={
+                        'aggregate_attribute_name': dependency.aggregate_attribute_name,
+                        'stale_objects_count': len(related_objects),
+                    },
+                )
+            )
+        return related_objects
+
+    def _fetch_related_objects_with_deadlines(
+        self, entities: List[Entity], timeout: Optional[float]
+    ) -> Tuple[Dict[int, Dict[RelatedObjectId, RelatedObject]], Tuple[str, ...]]:
+        started_at = time.monotonic()
+        overall_deadline = float('inf') if timeout is None else started_at + timeout
+
+        eager_dependencies = self.eager_dependencies
+        if not eager_dependencies:
+            return {}, ()
+
+        # dependencies are fetched concurrently, so the slowest one defines the waiting time
+        executor = ThreadPoolExecutor(max_workers=len(eager_dependencies))
+        try:
+            futures: List[Future] = [
+                executor.submit(copy_context().run, self._fetch_related_objects, dependency, entities)
+                for _, dependency in eager_dependencies
+            ]
+
+            dependency_related_object_map: Dict[int, Dict[RelatedObjectId, RelatedObject]] = {}
+            degraded_attribute_names: List[str] = []
+            for (dependency_item, dependency), future in zip(eager_dependencies, futures, strict=True):
+                deadline = overall_deadline
+                if dependency.timeout is not None:
+                    deadline = min(deadline, started_at + dependency.timeout)
+
+                try:
+                    dependency_related_object_map[dependency_item] = future.result(
+                        timeout=None if deadline == float('inf') else max(deadline - time.monotonic(), 0)
+                    )
+                except FuturesTimeoutError:
+                    dependency_related_object_map[dependency_item] = self._degrade_dependency(dependency)
+                    degraded_attribute_names.append(dependency.aggregate_attribute_name)
+        finally:
+            # late fetches are not awaited, they only refresh stale caches of their mappers
+            executor.shutdown(wait=False)
+
+        return dependency_related_object_map, tuple(degraded_attribute_names)
+
+    def create_partial_list(
+        self,
+        entities: List[Entity],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1000,
+        timeout: Optional[float] = None,
+    ) -> PartialAggregateList:
+        """
+        Related objects are always fetched in the current process. If `executor` (e.g. `ProcessPoolExecutor`)
+        is passed, aggregates are validated in it by chunks, so `aggregate_class` must be importable by its workers.
+        A process pool returns aggregates holding unpickled copies of `entities` and related objects, not the passed instances.
+        `timeout` limits the time of fetching all related objects in seconds, see `AggregateDependencyMapper.timeout`.
+        """
+        if chunk_size < 1:
+            raise ValueError('`chunk_size` must be greater than zero')
+
+        lazy_dependencies = tuple(dependency for dependency in self.dependency_mappers if dependency.lazy)
+        if lazy_dependencies and executor is not None:
+            raise ValueError('Aggregates with lazy attributes cannot be built in an executor')
+
+        if timeout is None and all(dependency.timeout is None for _, dependency in self.eager_dependencies):
+            dependency_related_object_map: Dict[int, Dict[RelatedObjectId, RelatedObject]] = {
+                dependency_item: self._fetch_related_objects(dependency, entities)
+                for dependency_item, dependency in self.eager_dependencies
+            }
+            degraded_attribute_names: Tuple[str, ...] = ()
+        else:
+            dependency_related_object_map, degraded_attribute_names = self._fetch_related_objects_with_deadlines(
+                entities, timeout
+            )
+
+        observed = has_observers(CONSTRUCTION_EVENT)
+        started_at = time.perf_counter() if observed else 0.0
+
+        aggregate_inits = self._get_aggregate_inits(entities, dependency_related_object_map)
+        if lazy_dependencies:
+            aggregates: List[AggregateT] = self._build_lazy_aggregates(aggregate_inits, lazy_dependencies, entities)
+        elif executor is None:
+            aggregates = [self.aggregate_class(**aggregate_init) for aggregate_init in aggregate_inits]
+        else:
+            aggregates = self._build_aggregates_in_executor(aggregate_inits, executor, chunk_size)
+
+        if observed:
+            emit(
+                Event(
+                    name=CONSTRUCTION_EVENT,
+                    source=self,
+                    duration=time.perf_counter() - started_at,
+                    attributes={'aggregates_count': len(aggregates), 'executor': executor is not None},
+                )
+            )
+
+        return PartialAggregateList(aggregates=aggregates, degraded_attribute_names=degraded_attribute_names)
+
+    def create_list(
+        self,
+        entities: List[Entity],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1000,
+        timeout: Optional[float] = None,
+    ) -> List[AggregateT]:
+        return self.create_partial_list(entities, executor=executor, chunk_size=chunk_size, timeout=timeout).aggregates
+
+    def iter_create_list(self, entities: Iterable[Entity], chunk_size: int = 1000) -> Iterator[AggregateT]:
+        """Builds aggregates chunk by chunk, so a stream of entities is never materialized at once"""
+        if chunk_size < 1:
+            raise ValueError('`chunk_size` must be greater than zero')
+
+        entities_iterator = iter(entities)
+        while chunk := list(islice(entities_iterator, chunk_size)):
+            yield from self.create_list(chunk)
+
+
+__all__ = (
+    'AggregateListFactory',
+    'AggregateDependencyMapper',
+    'DependencyTimeoutError',
+    'LazyDependencyLoader',
+    'MethodArgument',
+    'PartialAggregateList',
+    'DEPENDENCY_DEGRADED_EVENT',
+    'CONSTRUCTION_EVENT',
+    'DEPENDENCY_FETCH_EVENT',
+)
@@ -1,2 +1,9 @@
-from .base_enum import BaseEnum
-from .choice_enum import ChoiceEnum
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .base_enum import BaseEnum
+    from .choice_enum import ChoiceEnum
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, attributes={'BaseEnum': '.base_enum', 'ChoiceEnum': '.choice_enum'})
@@ -1,14 +1,91 @@
-from enum import Enum
-from typing import Any
+from enum import Enum, EnumMeta
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
 
+BaseEnumT = TypeVar('BaseEnumT', bound='BaseEnum')
+
+
+def normalize_value(value: Any) -> str:
+    return str(value).casefold()
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _get_value_forms(value: Any) -> Tuple[Any, ...]:
+    if isinstance(value, bool):
+        return ()
+    elif isinstance(value, int):
+        return (str(value),)
+    elif isinstance(value, str):
+        try:
+            int_value = int(value)
+        except ValueError:
+            return ()
+        return (int_value,) if str(int_value) == value else ()
+    return (str(value),)
+
+
+class BaseEnumMeta(EnumMeta):
+    def __new__(metacls, *args, **kwargs):
+        enum_class = super().__new__(metacls, *args, **kwargs)
+        # lookup maps are built once, when the members are already created
+        enum_class._init_lookup_maps()
+        return enum_class
+
+
+class BaseEnum(Enum, metaclass=BaseEnumMeta):
+    _normalized_value_map: Dict[str, 'BaseEnum']
+    _coerce_map: Dict[Any, 'BaseEnum']
 
-class BaseEnum(Enum):
     def __str__(self):
         return str(self.value)
 
+    @classmethod
+    def _init_lookup_maps(cls):
+        cls._normalized_value_map = {}
+        for member in cls:
+            cls._normalized_value_map.setdefault(normalize_value(member.value), member)
+
+        # exact values take precedence over their str / int forms
+        members = tuple(member for member in cls if _is_hashable(member.value))
+        cls._coerce_map = {member: member for member in members}
+        cls._coerce_map.update((member.value, member) for member in members)
+        for member in members:
+            for value_form in _get_value_forms(member.value):
+                cls._coerce_map.setdefault(value_form, member)
+
     @classmethod
     def has_value(cls, value: Any) -> bool:
         return value in cls._value2member_map_
 
+    @classmethod
+    def get_by_str_value(cls: Type[BaseEnumT], value: str) -> Optional[BaseEnumT]:
+        return cls._normalized_value_map.get(normalize_value(value))  # type: ignore[return-value]
+
+    @classmethod
+    def coerce(cls: Type[BaseEnumT], value: Any, default: Optional[BaseEnumT] = None) -> Optional[BaseEnumT]:
+        """
+        Converts a member, a value or its str / int form to a member without raising `ValueError`.
+        On a miss, a `_missing_` hook overridden by the enum class is consulted, as `Enum.__call__` does.
+        """
+        try:
+            return cls._coerce_map[value]  # type: ignore[return-value]
+        except (KeyError, TypeError):  # unknown or unhashable value
+            pass
+
+        if cls._missing_.__func__ is not Enum._missing_.__func__:  # type: ignore[attr-defined]
+            try:
+                member = cls._missing_(value)
+            except (ValueError, TypeError):
+                return default
+            if isinstance(member, cls):
+                return member
+        return default
+
 
-__all__ = ('BaseEnum',)
+__all__ = ('BaseEnum', 'BaseEnumMeta')
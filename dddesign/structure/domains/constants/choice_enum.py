@@ -1,18 +1,36 @@
-from typing import Any, Tuple
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
 
-from dddesign.structure.domains.constants import BaseEnum
+from dddesign.structure.domains.constants.base_enum import BaseEnum, normalize_value
 
 SEPARATOR = '_'
 
+ChoiceEnumT = TypeVar('ChoiceEnumT', bound='ChoiceEnum')
+
 
 class ChoiceEnum(BaseEnum):
+    _titles: Dict['ChoiceEnum', str]
+    _title_map: Dict[str, 'ChoiceEnum']
+    _choices: Tuple[Tuple[Any, str], ...]
+
+    @classmethod
+    def _init_lookup_maps(cls):
+        super()._init_lookup_maps()
+        cls._titles = {member: ' '.join(member.name.split(SEPARATOR)).title() for member in cls}
+        cls._title_map = {}
+        for member in cls:
+            cls._title_map.setdefault(normalize_value(member.get_title()), member)
+        cls._choices = tuple((member.value, member.get_title()) for member in cls)
+
     def get_title(self) -> str:
-        _name = ' '.join(self.name.split(SEPARATOR))
-        return _name.title()
+        return self._titles[self]
 
     @classmethod
     def get_choices(cls) -> Tuple[Tuple[Any, str], ...]:
-        return tuple((value.value, value.get_title()) for value in cls)
+        return cls._choices
+
+    @classmethod
+    def get_by_title(cls: Type[ChoiceEnumT], title: str) -> Optional[ChoiceEnumT]:
+        return cls._title_map.get(normalize_value(title))  # type: ignore[return-value]
 
 
 __all__ = ('ChoiceEnum',)
@@ -1 +1,10 @@
-from .dto import DataTransferObject
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .dto import BatchValidationResult, DataTransferObject
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__, attributes={'BatchValidationResult': '.dto', 'DataTransferObject': '.dto'}
+)
@@ -1,8 +1,51 @@
-from pydantic import BaseModel, ConfigDict
+from functools import cache
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+from dddesign.structure.domains.errors import CollectionError
+from dddesign.utils.base_model.error_wrapper import wrap_error
+
+DataTransferObjectT = TypeVar('DataTransferObjectT', bound='DataTransferObject')
+
+
+@cache
+def get_list_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    # building the core schema is much more expensive than validation, so it is built once per class
+    return TypeAdapter(List[model_class])  # type: ignore[valid-type]
+
+
+class BatchValidationResult(NamedTuple):
+    items: List[Any]  # valid items in input order
+    errors: CollectionError  # `field_name` is prefixed with the item index, e.g. `items.17.email`
+    invalid_indexes: Tuple[int, ...] = ()
 
 
 class DataTransferObject(BaseModel):
     model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
 
+    @classmethod
+    def validate_many(
+        cls: Type[DataTransferObjectT],
+        items: Iterable[Any],
+        field_name_prefix: Optional[str] = 'items',
+        max_errors: Optional[int] = None,
+    ) -> BatchValidationResult:
+        """
+        Validates items in a single pydantic call instead of one call per item.
+        Invalid items are skipped, the valid ones are validated again only if some item fails.
+        """
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        adapter = get_list_adapter(cls)
+        try:
+            return BatchValidationResult(items=adapter.validate_python(items), errors=CollectionError(max_errors=max_errors))
+        except ValidationError as error:
+            errors = wrap_error(error, max_errors=max_errors, field_name_prefix=field_name_prefix)
+            invalid_indexes = tuple(sorted({int(_error['loc'][0]) for _error in error.errors() if _error['loc']}))
+
+        invalid_index_set = set(invalid_indexes)
+        valid_items = [item for index, item in enumerate(items) if index not in invalid_index_set]
+        return BatchValidationResult(items=adapter.validate_python(valid_items), errors=errors, invalid_indexes=invalid_indexes)
+
 
-__all__ = ('DataTransferObject',)
+__all__ = ('BatchValidationResult', 'DataTransferObject')
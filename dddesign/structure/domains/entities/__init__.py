@@ -1 +1,8 @@
-from .entity import Entity
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .entity import Entity
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, attributes={'Entity': '.entity'})
@@ -1,11 +1,48 @@
-from typing import Optional, Set
+from typing import Any, ClassVar, Optional, Set
 
 from pydantic import BaseModel, ConfigDict
 
+from dddesign.utils.base_model import BulkAssignMixin
 
-class Entity(BaseModel):
+
+def _eq_by_identity(self: 'Entity', other: Any) -> bool:
+    if type(other) is not type(self):
+        return NotImplemented
+
+    identity = getattr(self, self.__identity_field__)  # type: ignore[arg-type]
+    if identity is None:
+        return self is other  # entities without identity (e.g. not saved yet) are equal only to themselves
+    return identity == getattr(other, self.__identity_field__)  # type: ignore[arg-type]
+
+
+def _hash_by_identity(self: 'Entity') -> int:
+    identity = getattr(self, self.__identity_field__)  # type: ignore[arg-type]
+    return id(self) if identity is None else hash(identity)
+
+
+class Entity(BulkAssignMixin):
     model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
 
+    # name of the field identifying the entity: `__eq__` and `__hash__` use only that field,
+    # so entities can be used in sets and as dict keys without comparing every (nested) field
+    __identity_field__: ClassVar[Optional[str]] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+
+        if '__identity_field__' not in cls.__dict__:
+            return
+        elif cls.__identity_field__ is None:
+            # opts out of the identity equality inherited from a parent entity
+            cls.__eq__ = BaseModel.__eq__  # type: ignore[method-assign]
+            cls.__hash__ = None  # type: ignore[assignment]
+        elif cls.__identity_field__ not in cls.model_fields:
+            raise ValueError(f'`__identity_field__` must be a field of `{cls.__name__}`, got `{cls.__identity_field__}`')
+        else:
+            cls.__eq__ = _eq_by_identity  # type: ignore[method-assign, assignment]
+            cls.__hash__ = _hash_by_identity  # type: ignore[method-assign, assignment]
+
     def update(self, data: BaseModel, exclude_fields: Optional[Set[str]] = None):
         for field_name, value in data.model_dump(exclude_unset=True, exclude=exclude_fields).items():
             if field_name in self.model_fields and getattr(self, field_name) != value:
@@ -1,2 +1,19 @@
-from .base_error import BaseError
-from .collection_error import CollectionError
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .base_error import BaseError, ErrorDetail
+    from .collection_error import CollectionError
+    from .result import ErrorAccumulator, Result
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    attributes={
+        'BaseError': '.base_error',
+        'ErrorDetail': '.base_error',
+        'CollectionError': '.collection_error',
+        'ErrorAccumulator': '.result',
+        'Result': '.result',
+    },
+)
@@ -1,11 +1,36 @@
 import re
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Type
 
 from ddutils.convertors import convert_camel_case_to_snake_case, convert_to_repr
 
 _PLACEHOLDER_RE = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}')
 
 
+# messages and class names are mostly class constants, so parsing them once keeps per-error cost low
+@lru_cache(maxsize=1024)
+def _get_placeholders(message: str) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(_PLACEHOLDER_RE.findall(message)))
+
+
+@lru_cache(maxsize=1024)
+def _convert_class_name(class_name: str) -> str:
+    return convert_camel_case_to_snake_case(class_name)
+
+
+def _format_message(message: Optional[str], kwargs: Dict[str, Any], class_name: str) -> str:
+    if not message:
+        raise ValueError('Field `message` is required')
+    placeholders = _get_placeholders(message)
+    if not placeholders:
+        return message
+
+    missing = tuple(name for name in placeholders if name not in kwargs)
+    if missing:
+        raise ValueError(f'Message contains placeholders {missing} that were not provided as keyword arguments to {class_name}')
+    return _PLACEHOLDER_RE.sub(lambda match: str(kwargs[match.group(1)]), message)
+
+
 class BaseError(Exception):
     message: str
     error_code: str
@@ -20,20 +45,10 @@ class BaseError(Exception):
         field_name: Optional[str] = None,
         **kwargs: Any,
     ):
-        message = message or getattr(self, 'message', None)
-        if not message:
-            raise ValueError('Field `message` is required')
-        missing = tuple(name for name in dict.fromkeys(_PLACEHOLDER_RE.findall(message)) if name not in kwargs)
-        if missing:
-            raise ValueError(
-                f'Message contains placeholders {missing} that were not provided as keyword arguments to {type(self).__name__}'
-            )
-        self.message = _PLACEHOLDER_RE.sub(lambda match: str(kwargs[match.group(1)]), message)
-
+        # attributes are resolved on the instance, so subclasses may set them before calling `super().__init__()`
+        self.message = _format_message(message or getattr(self, 'message', None), kwargs, type(self).__name__)
         self.error_code = error_code or getattr(self, 'error_code', None) or self.get_error_code()
-
         self.status_code = status_code or getattr(self, 'status_code', None) or 400
-
         self.field_name = field_name or getattr(self, 'field_name', None)
 
     def __str__(self) -> str:
@@ -44,7 +59,58 @@ class BaseError(Exception):
 
     @classmethod
     def get_error_code(cls) -> str:
-        return convert_camel_case_to_snake_case(cls.__name__)
+        return _convert_class_name(cls.__name__)
+
+    @classmethod
+    def detail(
+        cls,
+        message: Optional[str] = None,
+        error_code: Optional[str] = None,
+        status_code: Optional[int] = None,
+        field_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> 'ErrorDetail':
+        """Resolves the same attributes as the constructor from class attributes, without creating an exception"""
+        return ErrorDetail(
+            message=_format_message(message or getattr(cls, 'message', None), kwargs, cls.__name__),
+            error_code=error_code or getattr(cls, 'error_code', None) or cls.get_error_code(),
+            status_code=status_code or getattr(cls, 'status_code', None) or 400,
+            field_name=field_name or getattr(cls, 'field_name', None),
+        )
+
+    @classmethod
+    def from_detail(cls, detail: 'ErrorDetail') -> 'BaseError':
+        error = cls.__new__(cls)  # the message is already formatted, so placeholders are not resolved again
+        error.message, error.error_code, error.status_code, error.field_name = detail
+        return error
+
+
+class ErrorDetail(NamedTuple):
+    """
+    Plain data counterpart of `BaseError` for high-volume validation:
+    building it involves no traceback or frame capture, see `ErrorAccumulator`.
+    """
+
+    message: str
+    error_code: str
+    status_code: int = 400
+    field_name: Optional[str] = None
+
+    @classmethod
+    def from_error(cls, error: BaseError) -> 'ErrorDetail':
+        return cls(
+            message=error.message, error_code=error.error_code, status_code=error.status_code, field_name=error.field_name
+        )
+
+    def to_error(self, error_class: Type[BaseError] = BaseError) -> BaseError:
+        """
+        A detail does not keep the class of the error it was built from, so it becomes an instance of `error_class`
+        created without calling `__init__`: attributes other than the four fields are not restored
+        """
+        return error_class.from_detail(self)
+
+    def with_field_name(self, field_name: Optional[str]) -> 'ErrorDetail':
+        return self._replace(field_name=field_name)
 
 
-__all__ = ('BaseError',)
+__all__ = ('BaseError', 'ErrorDetail')
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 
 from ddutils.convertors import convert_to_repr
 
@@ -7,10 +7,14 @@ from dddesign.structure.domains.errors.base_error import BaseError
 
 class CollectionError(Exception):
     errors: List[BaseError]
+    max_errors: Optional[int]
+
+    def __init__(self, max_errors: Optional[int] = None):
+        if max_errors is not None and max_errors < 1:
+            raise ValueError('`max_errors` must be greater than zero')
 
-    def __init__(self):
         self.errors = []
-        self.__index = 0
+        self.max_errors = max_errors
 
     def __str__(self) -> str:
         return repr(self)
@@ -21,23 +25,45 @@ class CollectionError(Exception):
     def __bool__(self) -> bool:
         return bool(self.errors)
 
-    def __iter__(self):
-        return self
+    def __len__(self) -> int:
+        return len(self.errors)
 
-    def __next__(self) -> BaseError:
-        if self.__index >= len(self.errors):
-            self._index = 0
-            raise StopIteration
+    def __iter__(self) -> Iterator[BaseError]:
+        return iter(self.errors)
 
-        result = self.errors[self.__index]
-        self.__index += 1
-        return result
+    @property
+    def is_full(self) -> bool:
+        return self.max_errors is not None and len(self.errors) >= self.max_errors
 
     def add(self, error: BaseError):
         if not isinstance(error, BaseError):
             raise TypeError('`error` must be an instance of `BaseError`')
 
-        self.errors.append(error)
+        if not self.is_full:
+            self.errors.append(error)
+
+    def add_many(self, errors: Iterable[BaseError]):
+        # consumed lazily, so a generator is not exhausted once `max_errors` is reached,
+        # nothing is added if any consumed element is not a `BaseError`
+        if self.is_full:
+            return
+
+        limit = None if self.max_errors is None else self.max_errors - len(self.errors)
+        accepted: List[BaseError] = []
+        for error in errors:
+            if not isinstance(error, BaseError):
+                raise TypeError('All elements of `errors` must be instances of `BaseError`')
+            accepted.append(error)
+            if len(accepted) == limit:
+                break
+
+        self.errors.extend(accepted)
+
+    def extend(self, other: 'CollectionError'):
+        if not isinstance(other, CollectionError):
+            raise TypeError('`other` must be an instance of `CollectionError`')
+
+        self.add_many(other.errors)
 
 
 __all__ = ('CollectionError',)
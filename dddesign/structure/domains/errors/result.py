@@ -0,0 +1,109 @@
+from typing import Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from ddutils.convertors import convert_to_repr
+
+from dddesign.structure.domains.errors.base_error import BaseError, ErrorDetail
+from dddesign.structure.domains.errors.collection_error import CollectionError
+
+T = TypeVar('T')
+
+
+class ErrorAccumulator:
+    """
+    Non-raising counterpart of `CollectionError`: collects `ErrorDetail` in validation loops
+    and is converted to `CollectionError` (or the `Errors` DTO) only at the boundary.
+    """
+
+    details: List[ErrorDetail]
+    max_errors: Optional[int]
+
+    def __init__(self, max_errors: Optional[int] = None):
+        if max_errors is not None and max_errors < 1:
+            raise ValueError('`max_errors` must be greater than zero')
+
+        self.details = []
+        self.max_errors = max_errors
+
+    def __repr__(self) -> str:
+        return convert_to_repr(self)
+
+    def __bool__(self) -> bool:
+        return bool(self.details)
+
+    def __len__(self) -> int:
+        return len(self.details)
+
+    def __iter__(self) -> Iterator[ErrorDetail]:
+        return iter(self.details)
+
+    @property
+    def is_full(self) -> bool:
+        return self.max_errors is not None and len(self.details) >= self.max_errors
+
+    def add(self, detail: Union[ErrorDetail, BaseError]):
+        if isinstance(detail, BaseError):
+            detail = ErrorDetail.from_error(detail)
+        elif not isinstance(detail, ErrorDetail):
+            raise TypeError('`detail` must be an instance of `ErrorDetail` or `BaseError`')
+
+        if not self.is_full:
+            self.details.append(detail)
+
+    def add_many(self, details: Iterable[Union[ErrorDetail, BaseError]]):
+        for detail in details:
+            if self.is_full:
+                break
+            self.add(detail)
+
+    def to_collection_error(self) -> CollectionError:
+        errors = CollectionError(max_errors=self.max_errors)
+        errors.add_many(detail.to_error() for detail in self.details)
+        return errors
+
+    def raise_if_any(self):
+        if self.details:
+            raise self.to_collection_error()
+
+
+class Result(Generic[T]):
+    """Outcome of a validation step: either a value or error details, without raising"""
+
+    __slots__ = ('errors', 'value')  # created per validated item
+
+    value: Optional[T]
+    errors: Tuple[ErrorDetail, ...]
+
+    def __init__(self, value: Optional[T] = None, errors: Iterable[ErrorDetail] = ()):
+        self.value = value
+        self.errors = tuple(errors)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(value={self.value!r}, errors={self.errors!r})'
+
+    def __bool__(self) -> bool:
+        return not self.errors
+
+    @classmethod
+    def ok(cls, value: T) -> 'Result[T]':
+        return cls(value=value)
+
+    @classmethod
+    def fail(cls, *errors: ErrorDetail) -> 'Result[T]':
+        if not errors:
+            raise ValueError('At least one error is required')
+        return cls(errors=errors)
+
+    @property
+    def is_ok(self) -> bool:
+        return not self.errors
+
+    def unwrap(self) -> T:
+        """Returns the value or raises `CollectionError` with the error details"""
+        if self.errors:
+            errors = ErrorAccumulator()
+            errors.add_many(self.errors)
+            errors.raise_if_any()
+        return self.value  # type: ignore[return-value]
+
+
+__all__ = ('ErrorAccumulator', 'Result')
@@ -1 +1,8 @@
-from .value_object import ValueObject
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .value_object import ValueObject
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, attributes={'ValueObject': '.value_object'})
@@ -1,8 +1,119 @@
+from contextvars import ContextVar
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, TypeVar
+from weakref import WeakValueDictionary
+
 from pydantic import BaseModel, ConfigDict
+from pydantic_core import core_schema
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+
+ValueObjectT = TypeVar('ValueObjectT', bound='ValueObject')
+
+# instance validated by `__init__` of an interned class, it must be returned as is
+_initialized_instance: ContextVar[Optional['ValueObject']] = ContextVar('initialized_instance', default=None)
+
+
+def _make_field_values_getter(cls: type) -> Callable[[Any], Any]:
+    field_names = tuple(cls.model_fields)  # type: ignore[attr-defined]
+    return itemgetter(*field_names) if field_names else lambda _: ()
+
+
+def _hash_once(self: 'ValueObject') -> int:
+    try:
+        return object.__getattribute__(self, '_cached_hash')
+    except AttributeError:
+        pass
+
+    value = hash(type(self)._field_values_getter(self.__dict__))
+    object.__setattr__(self, '_cached_hash', value)
+    return value
+
+
+def _is_interned(value: 'ValueObject') -> bool:
+    try:
+        return object.__getattribute__(value, '_interned')
+    except AttributeError:
+        return False
+
+
+def _eq_with_identity_shortcut(self: 'ValueObject', other: Any) -> bool:
+    if self is other:
+        return True
+    elif type(other) is type(self) and _is_interned(self) and _is_interned(other):
+        return False  # equal interned value objects are the same instance
+    return BaseModel.__eq__(self, other)
+
+
+def _init_without_interning(self: 'ValueObject', /, **data: Any) -> None:
+    token = _initialized_instance.set(self)
+    try:
+        BaseModel.__init__(self, **data)
+    finally:
+        _initialized_instance.reset(token)
+
+
+# keeps validation of nested instances by pydantic-core instead of calling `__init__`
+_init_without_interning.__pydantic_base_init__ = True  # type: ignore[attr-defined]
+
+
+def _intern_validated(value: 'ValueObject') -> 'ValueObject':
+    return value if value is _initialized_instance.get() else value.intern()
 
 
 class ValueObject(BaseModel):
+    __slots__ = ('_cached_hash', '_interned')
+
     model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
 
+    # computes the hash once per instance, useful for value objects used as dict keys or set members
+    CACHE_HASH: ClassVar[bool] = False
+    # shares one instance between equal value objects validated as fields or by `model_validate`,
+    # instances created by the constructor are shared only by `intern`; implies `CACHE_HASH`
+    INTERN: ClassVar[bool] = False
+
+    if TYPE_CHECKING:
+        _field_values_getter: ClassVar[Callable[[Any], Any]]
+        _intern_table: ClassVar[WeakValueDictionary]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+
+        if cls.CACHE_HASH or cls.INTERN:
+            cls._field_values_getter = _make_field_values_getter(cls)
+            cls.__hash__ = _hash_once  # type: ignore[method-assign, assignment]
+            cls.__eq__ = _eq_with_identity_shortcut  # type: ignore[method-assign, assignment]
+
+        if cls.INTERN:
+            cls._intern_table = WeakValueDictionary()
+            cls.__init__ = _init_without_interning  # type: ignore[method-assign]
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: 'GetCoreSchemaHandler') -> core_schema.CoreSchema:
+        schema = handler(source)
+        if source is cls and cls.INTERN:
+            return core_schema.no_info_after_validator_function(_intern_validated, schema)
+        return schema
+
+    def intern(self: ValueObjectT) -> ValueObjectT:
+        """
+        Returns the shared instance equal to this one, registering this one if there is none yet.
+        Instances are kept in a weak-value table per class, so unused ones are still garbage collected.
+        """
+        cls = type(self)
+        if not cls.INTERN:
+            raise TypeError(f'`{cls.__name__}` does not support interning, set `INTERN = True`')
+
+        try:
+            instance = cls._intern_table.setdefault(cls._field_values_getter(self.__dict__), self)
+        except TypeError:
+            return self  # field values are not hashable
+
+        if instance is self:
+            object.__setattr__(self, '_interned', True)
+        return instance
+
 
 __all__ = ['ValueObject']
@@ -1,3 +1,3 @@
-from . import adapters, repositories
+from dddesign.utils.lazy_import import lazy_import
 
-__all__ = ('adapters', 'repositories')
+__getattr__, __dir__, __all__ = lazy_import(__name__, submodules=('adapters', 'repositories'))
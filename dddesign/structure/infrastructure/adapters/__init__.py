@@ -1,3 +1,3 @@
-from . import external, internal
+from dddesign.utils.lazy_import import lazy_import
 
-__all__ = ('external', 'internal')
+__getattr__, __dir__, __all__ = lazy_import(__name__, submodules=('external', 'internal'))
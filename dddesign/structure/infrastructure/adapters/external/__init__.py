@@ -1 +1,8 @@
-from .external_adapter import ExternalAdapter
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .external_adapter import ExternalAdapter
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, attributes={'ExternalAdapter': '.external_adapter'})
@@ -1 +1,8 @@
-from .internal_adapter import InternalAdapter
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .internal_adapter import InternalAdapter
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, attributes={'InternalAdapter': '.internal_adapter'})
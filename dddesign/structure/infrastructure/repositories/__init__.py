@@ -1 +1,22 @@
-from .repository import Repository
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .async_repository import AsyncRepository
+    from .identity_map import identity_map_scope
+    from .repository import Repository
+    from .streaming import aiterate_cursor, aiterate_cursor_chunks, iterate_cursor, iterate_cursor_chunks
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    attributes={
+        'AsyncRepository': '.async_repository',
+        'identity_map_scope': '.identity_map',
+        'Repository': '.repository',
+        'aiterate_cursor': '.streaming',
+        'aiterate_cursor_chunks': '.streaming',
+        'iterate_cursor': '.streaming',
+        'iterate_cursor_chunks': '.streaming',
+    },
+)
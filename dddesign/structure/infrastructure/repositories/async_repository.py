@@ -0,0 +1,37 @@
+import inspect
+from typing import Callable, Dict
+
+from dddesign.structure.infrastructure.repositories.repository import STREAMING_METHODS, Repository
+
+ASYNC_GENERATOR_ALLOWED_METHODS = {
+    'get_list',  # May yield entities instead of returning a list
+    *STREAMING_METHODS,
+}
+
+
+class AsyncRepository(Repository):
+    @classmethod
+    def _validate_method_types(cls, methods: Dict[str, Callable]):
+        for name, method in methods.items():
+            cls._validate_method_type(name, method)
+        cls._wrap_streaming_methods(methods, asynchronous=True)
+
+    @classmethod
+    def _validate_method_type(cls, name: str, method: Callable):
+        if name in STREAMING_METHODS:
+            if inspect.iscoroutinefunction(method) or inspect.isgeneratorfunction(method):
+                raise TypeError(f'Method `{name}` must be an async generator function or return an async iterator')
+            return
+        elif inspect.iscoroutinefunction(method):
+            return
+        elif inspect.isasyncgenfunction(method):
+            if name not in ASYNC_GENERATOR_ALLOWED_METHODS:
+                raise TypeError(
+                    f'Method `{name}` must be a coroutine function, async generators are allowed only for streaming'
+                )
+            return
+
+        raise TypeError(f'Method `{name}` must be a coroutine function, use `Repository` for synchronous methods')
+
+
+__all__ = ('AsyncRepository', 'ASYNC_GENERATOR_ALLOWED_METHODS')
@@ -0,0 +1,132 @@
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ddutils.annotation_helpers import get_annotation_origin, get_annotation_without_optional, get_dict_items_annotation
+
+DERIVED_ATTRIBUTE = '__derived__'
+
+# derived method name -> name of the method it is derived from
+DERIVABLE_METHODS = {
+    'get_map': 'get',
+    'get': 'get_map',
+    'bulk_create': 'create',
+    'bulk_update': 'update',
+    'bulk_delete': 'delete',
+}
+
+
+def _get_argument(method: Callable) -> Tuple[str, Any]:
+    parameters = tuple(inspect.signature(method).parameters.values())[1:]  # skip `self`
+    if not parameters:
+        raise TypeError(f'Method `{method.__name__}` must accept an argument to derive a bulk method from it')
+
+    name = parameters[0].name
+    return name, method.__annotations__.get(name, Any)
+
+
+def _mark(method: Callable, name: str, annotations: Dict[str, Any]) -> Callable:
+    method.__name__ = name
+    method.__qualname__ = name
+    method.__annotations__ = annotations
+    setattr(method, DERIVED_ATTRIBUTE, True)
+    return method
+
+
+def derive_get_map(get: Callable) -> Callable:
+    _, pk_annotation = _get_argument(get)
+    entity_annotation = get.__annotations__.get('return', Any)
+    if entity_annotation is not Any:
+        entity_annotation = get_annotation_without_optional(entity_annotation)
+
+    async def async_get_map(self, pks):
+        pks = tuple(dict.fromkeys(pks))
+        semaphore = asyncio.Semaphore(self.BULK_FALLBACK_MAX_WORKERS)
+
+        async def _get(pk):
+            async with semaphore:
+                return await self.get(pk)
+
+        entities = await asyncio.gather(*(_get(pk) for pk in pks))
+        return {pk: entity for pk, entity in zip(pks, entities, strict=True) if entity is not None}
+
+    def get_map(self, pks):
+        pks = tuple(dict.fromkeys(pks))
+        max_workers = min(self.BULK_FALLBACK_MAX_WORKERS, len(pks))
+        if max_workers <= 1:
+            entities = [self.get(pk) for pk in pks]
+        else:
+            # every call gets a copy of the context, so context variables (e.g. identity map scope, DB session) are kept
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(copy_context().run, self.get, pk) for pk in pks]
+                entities = [future.result() for future in futures]
+
+        return {pk: entity for pk, entity in zip(pks, entities, strict=True) if entity is not None}
+
+    return _mark(
+        async_get_map if inspect.iscoroutinefunction(get) else get_map,
+        'get_map',
+        {'pks': List[pk_annotation], 'return': Dict[pk_annotation, entity_annotation]},  # type: ignore[valid-type]
+    )
+
+
+def derive_get(get_map: Callable) -> Callable:
+    _, pks_annotation = _get_argument(get_map)
+    try:
+        pk_annotation, entity_annotation = get_dict_items_annotation(get_map.__annotations__.get('return'))
+    except (TypeError, ValueError):
+        pk_annotation, entity_annotation = Any, Any
+
+    try:
+        pks_type = get_annotation_origin(pks_annotation)
+    except TypeError:
+        pks_type = tuple
+    if pks_type not in {list, tuple, set, frozenset}:
+        pks_type = tuple
+
+    async def async_get(self, pk):
+        return (await self.get_map(pks_type((pk,)))).get(pk)
+
+    def get(self, pk):
+        return self.get_map(pks_type((pk,))).get(pk)
+
+    return _mark(
+        async_get if inspect.iscoroutinefunction(get_map) else get,
+        'get',
+        {'pk': pk_annotation, 'return': Optional[entity_annotation]},  # type: ignore[valid-type]
+    )
+
+
+def derive_bulk_method(single_method: Callable, name: str) -> Callable:
+    _, item_annotation = _get_argument(single_method)
+    single_method_name = DERIVABLE_METHODS[name]
+
+    # writes are performed sequentially to keep their order
+    async def async_bulk_method(self, items):
+        return [await getattr(self, single_method_name)(item) for item in items]
+
+    def bulk_method(self, items):
+        return [getattr(self, single_method_name)(item) for item in items]
+
+    return _mark(
+        async_bulk_method if inspect.iscoroutinefunction(single_method) else bulk_method,
+        name,
+        {'items': List[item_annotation], 'return': List[Any]},  # type: ignore[valid-type]
+    )
+
+
+def derive_method(name: str, source_method: Callable) -> Callable:
+    if name == 'get_map':
+        return derive_get_map(source_method)
+    elif name == 'get':
+        return derive_get(source_method)
+    return derive_bulk_method(source_method, name)
+
+
+def is_derived(method: Callable) -> bool:
+    return getattr(method, DERIVED_ATTRIBUTE, False)
+
+
+__all__ = ('DERIVABLE_METHODS', 'derive_method', 'is_derived')
@@ -0,0 +1,189 @@
+import inspect
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+PrimaryKey = Any
+EntityMap = Dict[PrimaryKey, Any]
+
+IDENTITY_MAP_ATTRIBUTE = '__identity_map__'
+
+# `IDENTITY_MAP_KEY` or repository id -> (repository, loaded entities); the repository is referenced,
+# so its id is not reused by another instance within the scope
+_identity_map: ContextVar[Optional[Dict[Any, Tuple[Any, EntityMap]]]] = ContextVar('identity_map', default=None)
+
+
+@contextmanager
+def identity_map_scope() -> Generator[None, None, None]:
+    """
+    Defines a unit of work in which repositories with `USE_IDENTITY_MAP = True`
+    load each entity from storage at most once. Nested scopes share the outermost map.
+    """
+    if _identity_map.get() is not None:
+        yield
+        return
+
+    token = _identity_map.set({})
+    try:
+        yield
+    finally:
+        _identity_map.reset(token)
+
+
+def _get_entity_map(repository: Any) -> Optional[EntityMap]:
+    identity_map = _identity_map.get()
+    if identity_map is None:
+        return None
+
+    # instances of the same class may work with different storages (e.g. per tenant), so they do not share entities
+    repository_key = getattr(repository, 'IDENTITY_MAP_KEY', None) or id(repository)
+    item = identity_map.get(repository_key)
+    if item is None:
+        item = identity_map[repository_key] = (repository, {})
+    return item[1]
+
+
+def _get_single_argument(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+    if len(args) + len(kwargs) != 1:
+        return False, None
+    return True, args[0] if args else next(iter(kwargs.values()))
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _get_missing_pks_call(
+    entity_map: EntityMap, args: Tuple[Any, ...], kwargs: Dict[str, Any], pks: Tuple[Any, ...]
+) -> Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]]:
+    missing_pks = tuple(pk for pk in dict.fromkeys(pks) if pk not in entity_map)
+    if not missing_pks:
+        return None
+
+    collection_type = type(args[0] if args else next(iter(kwargs.values())))
+    if collection_type not in {list, tuple, set, frozenset}:
+        collection_type = tuple
+    missing_pks_argument = collection_type(missing_pks)
+
+    if args:
+        return (missing_pks_argument,), {}
+    return (), {next(iter(kwargs)): missing_pks_argument}
+
+
+def _mark(wrapper: Callable) -> Callable:
+    setattr(wrapper, IDENTITY_MAP_ATTRIBUTE, True)
+    return wrapper
+
+
+def wrap_get(method: Callable) -> Callable:
+    if inspect.iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            entity_map = _get_entity_map(self)
+            is_single, pk = _get_single_argument(args, kwargs)
+            if entity_map is None or not is_single or not _is_hashable(pk):
+                return await method(self, *args, **kwargs)
+            elif pk in entity_map:
+                return entity_map[pk]
+
+            entity = await method(self, *args, **kwargs)
+            if entity is not None:
+                entity_map[pk] = entity
+            return entity
+
+        return _mark(async_wrapper)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        entity_map = _get_entity_map(self)
+        is_single, pk = _get_single_argument(args, kwargs)
+        # calls with extra arguments (e.g. locks or filters) are never served from the map
+        if entity_map is None or not is_single or not _is_hashable(pk):
+            return method(self, *args, **kwargs)
+        elif pk in entity_map:
+            return entity_map[pk]
+
+        entity = method(self, *args, **kwargs)
+        if entity is not None:
+            entity_map[pk] = entity
+        return entity
+
+    return _mark(wrapper)
+
+
+def wrap_get_map(method: Callable) -> Callable:
+    if inspect.iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            entity_map = _get_entity_map(self)
+            is_single, pks = _get_single_argument(args, kwargs)
+            if entity_map is None or not is_single:
+                return await method(self, *args, **kwargs)
+
+            pks = tuple(pks)
+            missing_pks_call = _get_missing_pks_call(entity_map, args, kwargs, pks)
+            if missing_pks_call is not None:
+                entity_map.update(await method(self, *missing_pks_call[0], **missing_pks_call[1]))
+
+            return {pk: entity_map[pk] for pk in pks if pk in entity_map}
+
+        return _mark(async_wrapper)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        entity_map = _get_entity_map(self)
+        is_single, pks = _get_single_argument(args, kwargs)
+        if entity_map is None or not is_single:
+            return method(self, *args, **kwargs)
+
+        pks = tuple(pks)
+        missing_pks_call = _get_missing_pks_call(entity_map, args, kwargs, pks)
+        if missing_pks_call is not None:
+            entity_map.update(method(self, *missing_pks_call[0], **missing_pks_call[1]))
+
+        return {pk: entity_map[pk] for pk in pks if pk in entity_map}
+
+    return _mark(wrapper)
+
+
+def _clear_entity_map(repository: Any):
+    entity_map = _get_entity_map(repository)
+    if entity_map is not None:
+        entity_map.clear()
+
+
+def wrap_write(method: Callable) -> Callable:
+    if inspect.iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                _clear_entity_map(self)
+
+        return _mark(async_wrapper)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _clear_entity_map(self)
+
+    return _mark(wrapper)
+
+
+def is_wrapped(method: Callable) -> bool:
+    return getattr(method, IDENTITY_MAP_ATTRIBUTE, False)
+
+
+__all__ = ('identity_map_scope', 'is_wrapped', 'wrap_get', 'wrap_get_map', 'wrap_write')
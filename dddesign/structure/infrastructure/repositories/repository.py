@@ -1,12 +1,17 @@
 import inspect
-from typing import Optional, Set
+from typing import Callable, Dict, Optional, Set
 
 from pydantic import BaseModel, ConfigDict
 
+from dddesign.structure.infrastructure.repositories.bulk_fallback import DERIVABLE_METHODS, derive_method, is_derived
+from dddesign.structure.infrastructure.repositories.identity_map import is_wrapped, wrap_get, wrap_get_map, wrap_write
+from dddesign.structure.infrastructure.repositories.streaming import is_streaming_checked, wrap_streaming_method
+
 BASE_ALLOWED_METHODS = {
     'get',  # Returns one entity by PK
     'get_by_filters',  # Returns one entity matching filters
     'get_list',  # Returns a list of entities
+    'iter_list',  # Yields entities one by one (e.g. from a server-side cursor), must return an iterator
     'get_map',  # Returns a mapping of entities (e.g. {pk: entity})
     'create',  # Creates one entity, accepts entity
     'update',  # Updates one entity, accepts entity
@@ -18,11 +23,24 @@ BASE_ALLOWED_METHODS = {
     'delete_by_filters',  # Deletes entities matching filters
 }
 
+STREAMING_METHODS = {'iter_list'}
+READ_METHOD_PREFIXES = ('get', 'iter')
+
+
+def is_asynchronous(method: Callable) -> bool:
+    return inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method)
+
 
 class Repository(BaseModel):
     model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
 
     EXTERNAL_ALLOWED_METHODS: Optional[Set[str]] = None
+    USE_IDENTITY_MAP: bool = False
+    # entities are shared by repositories with the same key, each instance has its own entities by default
+    IDENTITY_MAP_KEY: Optional[str] = None
+    DERIVE_BULK_METHODS: bool = False
+    # concurrent `get` calls of a derived `get_map`, the repository (and its session) must be thread-safe to raise it
+    BULK_FALLBACK_MAX_WORKERS: int = 1
 
     @classmethod
     def __pydantic_init_subclass__(cls, **kwargs):
@@ -33,14 +51,75 @@ class Repository(BaseModel):
         if external_allowed_methods:
             allowed_methods = {*allowed_methods, *external_allowed_methods}
 
-        methods = (name for name, member in cls.__dict__.items() if inspect.isfunction(member))
+        methods = ((name, member) for name, member in cls.__dict__.items() if inspect.isfunction(member))
 
-        for method in methods:
+        for method, _ in methods:
             if method.startswith('__') and method.endswith('__'):
                 continue
 
             if method not in allowed_methods:
                 raise TypeError(f'Method name `{method}` does not allowed')
 
+        # inherited methods are included, so a subclass can not mix kinds with its parents either
+        cls._validate_method_types(
+            {name: member for name in allowed_methods if inspect.isfunction(member := getattr(cls, name, None))}
+        )
+
+        if cls.model_fields['DERIVE_BULK_METHODS'].get_default():
+            cls._derive_bulk_methods()
+
+        if cls.model_fields['USE_IDENTITY_MAP'].get_default():
+            cls._apply_identity_map(allowed_methods)
+
+    @classmethod
+    def _validate_method_types(cls, methods: Dict[str, Callable]):
+        for name in STREAMING_METHODS & methods.keys():
+            if inspect.iscoroutinefunction(methods[name]):
+                raise TypeError(f'Method `{name}` must return an iterator, not a coroutine')
+
+        asynchronous_methods = sorted(name for name, method in methods.items() if is_asynchronous(method))
+        if not asynchronous_methods:
+            cls._wrap_streaming_methods(methods, asynchronous=False)
+            return
+
+        synchronous_methods = sorted(methods.keys() - set(asynchronous_methods))
+        if synchronous_methods:
+            raise TypeError(
+                f'Methods {synchronous_methods} are synchronous while {asynchronous_methods} are asynchronous, '
+                'use `Repository` for synchronous methods and `AsyncRepository` for asynchronous ones'
+            )
+
+    @classmethod
+    def _wrap_streaming_methods(cls, methods: Dict[str, Callable], asynchronous: bool):
+        for name in STREAMING_METHODS & methods.keys():
+            method = methods[name]
+            if not (inspect.isgeneratorfunction(method) or inspect.isasyncgenfunction(method) or is_streaming_checked(method)):
+                setattr(cls, name, wrap_streaming_method(method, asynchronous=asynchronous))
+
+    @classmethod
+    def _derive_bulk_methods(cls):
+        for name, source_name in DERIVABLE_METHODS.items():
+            if getattr(cls, name, None) is not None:
+                continue  # native implementations are always preferred
+
+            source_method = getattr(cls, source_name, None)
+            if inspect.isfunction(source_method) and not is_derived(source_method):
+                setattr(cls, name, derive_method(name, source_method))
+
+    @classmethod
+    def _apply_identity_map(cls, allowed_methods: Set[str]):
+        for name in allowed_methods:
+            member = getattr(cls, name, None)
+            if not inspect.isfunction(member) or is_wrapped(member):
+                continue
+
+            if name == 'get':
+                setattr(cls, name, wrap_get(member))
+            elif name == 'get_map':
+                setattr(cls, name, wrap_get_map(member))
+            elif not name.startswith(READ_METHOD_PREFIXES):
+                # any method that is not a read invalidates entities loaded in the current scope
+                setattr(cls, name, wrap_write(member))
+
 
-__all__ = ('Repository', 'BASE_ALLOWED_METHODS')
+__all__ = ('Repository', 'BASE_ALLOWED_METHODS', 'STREAMING_METHODS')
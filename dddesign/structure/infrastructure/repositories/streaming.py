@@ -0,0 +1,77 @@
+import collections.abc
+from functools import wraps
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Sequence, TypeVar
+
+T = TypeVar('T')
+
+DEFAULT_CHUNK_SIZE = 1000
+
+STREAMING_CHECK_ATTRIBUTE = '__streaming_check__'
+
+# Cursor-like callables accept the maximum amount of rows and return the next rows,
+# an empty sequence means that the cursor is exhausted (e.g. DB-API `cursor.fetchmany`)
+FetchMany = Callable[[int], Sequence[T]]
+AsyncFetchMany = Callable[[int], Awaitable[Sequence[T]]]
+
+
+def iterate_cursor_chunks(fetch_many: FetchMany[T], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Sequence[T]]:
+    if chunk_size < 1:
+        raise ValueError('`chunk_size` must be greater than zero')
+
+    while chunk := fetch_many(chunk_size):
+        yield chunk
+
+
+def iterate_cursor(fetch_many: FetchMany[T], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[T]:
+    for chunk in iterate_cursor_chunks(fetch_many, chunk_size):
+        yield from chunk
+
+
+async def aiterate_cursor_chunks(
+    fetch_many: AsyncFetchMany[T], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncIterator[Sequence[T]]:
+    if chunk_size < 1:
+        raise ValueError('`chunk_size` must be greater than zero')
+
+    while chunk := await fetch_many(chunk_size):
+        yield chunk
+
+
+async def aiterate_cursor(fetch_many: AsyncFetchMany[T], chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[T]:
+    async for chunk in aiterate_cursor_chunks(fetch_many, chunk_size):
+        for item in chunk:
+            yield item
+
+
+def wrap_streaming_method(method: Callable, asynchronous: bool) -> Callable:
+    """
+    Checks that a streaming method which is not a generator function (e.g. `return iterate_cursor(...)`)
+    returns an iterator, or an async iterator if `asynchronous`, when it is called
+    """
+    iterator_class: Any = collections.abc.AsyncIterator if asynchronous else collections.abc.Iterator
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        if not isinstance(result, iterator_class):
+            raise TypeError(
+                f'Method `{method.__name__}` must return `{iterator_class.__name__}`, got `{type(result).__name__}`'
+            )
+        return result
+
+    setattr(wrapper, STREAMING_CHECK_ATTRIBUTE, True)
+    return wrapper
+
+
+def is_streaming_checked(method: Callable) -> bool:
+    return getattr(method, STREAMING_CHECK_ATTRIBUTE, False)
+
+
+__all__ = (
+    'aiterate_cursor',
+    'aiterate_cursor_chunks',
+    'is_streaming_checked',
+    'iterate_cursor',
+    'iterate_cursor_chunks',
+    'wrap_streaming_method',
+)
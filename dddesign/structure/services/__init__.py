@@ -1 +1,8 @@
-from .service import Service
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .service import Service
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, attributes={'Service': '.service'})
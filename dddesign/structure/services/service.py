@@ -1,11 +1,31 @@
 from abc import ABCMeta, abstractmethod
+from typing import ClassVar
 
 from pydantic import BaseModel, ConfigDict
 
+from dddesign.utils.instrumentation import instrument_method, is_instrumented
+
 
 class Service(BaseModel, metaclass=ABCMeta):
     model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
 
+    # instrumentation is decided per class, so the flags are not fields
+    INSTRUMENT: ClassVar[bool] = False
+    TRACE_MEMORY: ClassVar[bool] = False
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+
+        handle = cls.__dict__.get('handle')
+        if (
+            cls.INSTRUMENT
+            and handle is not None
+            and not getattr(handle, '__isabstractmethod__', False)
+            and not is_instrumented(handle)
+        ):
+            cls.handle = instrument_method(handle, trace_memory=cls.TRACE_MEMORY)
+
     @abstractmethod
     def handle(self): ...
 
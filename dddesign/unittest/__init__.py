@@ -1,3 +1,3 @@
-from . import magic_mock
+from dddesign.utils.lazy_import import lazy_import
 
-__all__ = ('magic_mock',)
+__getattr__, __dir__, __all__ = lazy_import(__name__, submodules=('magic_mock',))
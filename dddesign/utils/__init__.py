@@ -1,3 +1,3 @@
-from . import base_model
+from dddesign.utils import lazy_import as _lazy_import
 
-__all__ = ('base_model',)
+__getattr__, __dir__, __all__ = _lazy_import.lazy_import(__name__, submodules=('base_model', 'instrumentation', 'lazy_import'))
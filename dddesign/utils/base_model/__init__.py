@@ -1,4 +1,28 @@
-from .changes_tracker import TrackChangesMixin
-from .error_instance_factory import create_pydantic_error_instance
-from .error_wrapper import wrap_error
-from .flatten_model_dump import flatten_model_dump
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .bulk_assign import BulkAssignMixin
+    from .changes_tracker import TrackChangesMixin
+    from .error_instance_factory import create_pydantic_error_instance
+    from .error_wrapper import wrap_error
+    from .flatten_model_dump import flatten_model_dump, flatten_model_dump_columns, iter_flatten_model_dump
+    from .json_lines import ModelBatch, iter_json_lines, iter_model_batches, iter_model_batches_from_file
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    attributes={
+        'BulkAssignMixin': '.bulk_assign',
+        'TrackChangesMixin': '.changes_tracker',
+        'create_pydantic_error_instance': '.error_instance_factory',
+        'wrap_error': '.error_wrapper',
+        'flatten_model_dump': '.flatten_model_dump',
+        'flatten_model_dump_columns': '.flatten_model_dump',
+        'iter_flatten_model_dump': '.flatten_model_dump',
+        'ModelBatch': '.json_lines',
+        'iter_json_lines': '.json_lines',
+        'iter_model_batches': '.json_lines',
+        'iter_model_batches_from_file': '.json_lines',
+    },
+)
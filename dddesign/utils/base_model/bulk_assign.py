@@ -0,0 +1,46 @@
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from dddesign.utils.base_model.field_validation import get_model_validators, validate_fields, validate_model
+
+
+class BulkAssignMixin(BaseModel):
+    """
+    Assigns several fields at once and rolls all of them back if any assignment fails.
+
+    Only the assigned fields are validated, so validators of untouched fields never run again;
+    model validators run once on the final state, so fields bound by an invariant can be changed together.
+    """
+
+    def bulk_assign(self, **values: Any) -> None:
+        if not values:
+            return
+
+        model_class = self.__class__
+        validators = get_model_validators(model_class)
+        for field_name in values:
+            if field_name not in validators.field_names:
+                raise ValueError(f'"{model_class.__name__}" object has no field "{field_name}"')
+
+        if validators.frozen:
+            raise ValidationError.from_exception_data(
+                model_class.__name__,
+                [{'type': 'frozen_instance', 'loc': (field_name,), 'input': value} for field_name, value in values.items()],
+            )
+
+        data, fields_set = validate_fields(self, values)
+
+        initial_dict = self.__dict__
+        initial_fields_set = self.__pydantic_fields_set__
+        object.__setattr__(self, '__dict__', data)
+        object.__setattr__(self, '__pydantic_fields_set__', initial_fields_set | fields_set)
+        try:
+            validate_model(self)
+        except BaseException:
+            object.__setattr__(self, '__dict__', initial_dict)
+            object.__setattr__(self, '__pydantic_fields_set__', initial_fields_set)
+            raise
+
+
+__all__ = ('BulkAssignMixin',)
@@ -7,14 +7,21 @@ from dddesign.structure.domains.errors import BaseError, CollectionError
 from dddesign.utils.base_model.error_instance_factory import CONTEXT_MESSAGES_PARAM
 
 
-def wrap_error(error: ValidationError) -> CollectionError:
+def wrap_error(
+    error: ValidationError, max_errors: Optional[int] = None, field_name_prefix: Optional[str] = None
+) -> CollectionError:
     if not isinstance(error, ValidationError):
         raise TypeError('`exception` must be an instance of `pydantic.ValidationError`')
 
-    errors = CollectionError()
+    errors = CollectionError(max_errors=max_errors)
 
     for _error in error.errors():
-        field_name: Optional[str] = '.'.join(str(item) for item in _error['loc']) or None
+        if errors.is_full:
+            break
+
+        field_name: Optional[str] = (
+            '.'.join(str(item) for item in (field_name_prefix, *_error['loc']) if item is not None) or None
+        )
 
         original_error: Optional[Exception] = _error.get('ctx', {}).get('error')
         if original_error:
@@ -0,0 +1,72 @@
+from functools import cache
+from typing import Any, Dict, FrozenSet, Mapping, NamedTuple, Optional, Set, Tuple, Type, cast
+
+from pydantic import BaseModel
+from pydantic_core import SchemaValidator
+
+AssignmentResult = Tuple[Dict[str, Any], Optional[Dict[str, Any]], Set[str]]
+
+
+class ModelValidators(NamedTuple):
+    fields: SchemaValidator  # field and `before` model validators, as used by `validate_assignment`
+    model: Optional[SchemaValidator]  # `after` and `wrap` model validators only, `None` if there are none
+    field_names: FrozenSet[str]
+    frozen: bool
+
+
+@cache
+def get_model_validators(model_class: Type[BaseModel]) -> ModelValidators:
+    """Splits the core schema of `model_class` around its `model` node, so both parts can be run separately"""
+    schema: Dict[str, Any] = model_class.__pydantic_core_schema__  # type: ignore[assignment]
+    definitions = []
+    if schema['type'] == 'definitions':
+        definitions, schema = schema['definitions'], schema['schema']
+    if schema['type'] == 'definition-ref':
+        schema = next(definition for definition in definitions if definition.get('ref') == schema['schema_ref'])
+
+    outer_schemas = []
+    while schema['type'] != 'model':
+        outer_schemas.append(schema)
+        schema = schema['schema']
+
+    config = schema.get('config')
+    fields_schema = schema['schema']
+    if definitions:
+        fields_schema = {'type': 'definitions', 'schema': fields_schema, 'definitions': definitions}
+
+    model_schema: Optional[Dict[str, Any]] = None
+    for outer_schema in reversed(outer_schemas):
+        model_schema = {**outer_schema, 'schema': model_schema or {'type': 'any'}}
+        model_schema.pop('ref', None)
+
+    return ModelValidators(
+        fields=SchemaValidator(fields_schema, config),  # type: ignore[arg-type]
+        model=model_schema and SchemaValidator(model_schema, config),  # type: ignore[arg-type]
+        field_names=frozenset(model_class.model_fields),
+        frozen=bool(model_class.model_config.get('frozen')),
+    )
+
+
+def validate_fields(model: BaseModel, values: Mapping[str, Any]) -> Tuple[Dict[str, Any], Set[str]]:
+    """
+    Validates `values` one by one against the current state of `model` without changing it,
+    returns the new `__dict__` and the names of the assigned fields. Model `after` validators are not run.
+    """
+    validator = get_model_validators(type(model)).fields
+    data = dict(model.__dict__)  # the validator updates the passed dict in place
+    fields_set: Set[str] = set()
+    for field_name, value in values.items():
+        # `model-fields` schema returns the updated dict, extra values and the assigned field names
+        data, _, assigned_fields = cast('AssignmentResult', validator.validate_assignment(data, field_name, value))
+        fields_set.update(assigned_fields)
+    return data, fields_set
+
+
+def validate_model(model: BaseModel) -> None:
+    """Runs `after` and `wrap` model validators against the current state of `model`"""
+    validator = get_model_validators(type(model)).model
+    if validator is not None:
+        validator.validate_python(model)
+
+
+__all__ = ('ModelValidators', 'get_model_validators', 'validate_fields', 'validate_model')
@@ -1,21 +1,78 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
 
 from pydantic import BaseModel
 
+# Maps a key of a nested level to its full flattened key and the node of the next level
+KeyNode = Dict[Any, Tuple[str, 'KeyNode']]
 
-def _flatten_dict(data: Dict[str, Any], prefix: str, separator: str) -> Dict[str, Any]:
-    result: Dict[str, Any] = {}
-    for key, value in data.items():
-        full_key = f'{prefix}{separator}{key}' if prefix else key
-        if isinstance(value, dict):
-            result.update(_flatten_dict(value, prefix=full_key, separator=separator))
+
+def iter_flatten_model_dump(
+    data: BaseModel, separator: str = '.', flatten_lists: bool = False, **model_dump_kwargs
+) -> Iterator[Tuple[str, Any]]:
+    sequence_types = (list, tuple) if flatten_lists else ()
+    stack: List[Tuple[str, Iterator[Tuple[Any, Any]]]] = [('', iter(data.model_dump(**model_dump_kwargs).items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            full_key = f'{prefix}{separator}{key}' if prefix else key
+            if isinstance(value, dict):
+                stack.append((full_key, iter(value.items())))
+                break
+            elif isinstance(value, sequence_types):
+                stack.append((full_key, enumerate(value)))
+                break
+            yield full_key, value
         else:
-            result[full_key] = value
-    return result
+            stack.pop()
+
+
+def flatten_model_dump(
+    data: BaseModel, separator: str = '.', flatten_lists: bool = False, **model_dump_kwargs
+) -> Dict[str, Any]:
+    return dict(iter_flatten_model_dump(data, separator=separator, flatten_lists=flatten_lists, **model_dump_kwargs))
+
+
+def flatten_model_dump_columns(
+    data: Sequence[BaseModel], separator: str = '.', flatten_lists: bool = False, **model_dump_kwargs
+) -> Dict[str, List[Any]]:
+    sequence_types = (list, tuple) if flatten_lists else ()
+    root_node: KeyNode = {}
+    columns: Dict[str, List[Any]] = {}
+
+    for row_index, model in enumerate(data):
+        stack: List[Tuple[str, KeyNode, Iterator[Tuple[Any, Any]]]] = [
+            ('', root_node, iter(model.model_dump(**model_dump_kwargs).items()))
+        ]
+        while stack:
+            prefix, node, items = stack[-1]
+            for key, value in items:
+                key_info = node.get(key)
+                if key_info is None:
+                    key_info = node[key] = (f'{prefix}{separator}{key}' if prefix else key, {})
+
+                full_key, next_node = key_info
+                if isinstance(value, dict):
+                    stack.append((full_key, next_node, iter(value.items())))
+                    break
+                elif isinstance(value, sequence_types):
+                    stack.append((full_key, next_node, enumerate(value)))
+                    break
+
+                column = columns.get(full_key)
+                if column is None:
+                    column = columns[full_key] = [None] * row_index
+                elif len(column) < row_index:
+                    column.extend([None] * (row_index - len(column)))
+                column.append(value)
+            else:
+                stack.pop()
 
+    rows_count = len(data)
+    for column in columns.values():
+        if len(column) < rows_count:
+            column.extend([None] * (rows_count - len(column)))
 
-def flatten_model_dump(data: BaseModel, separator: str = '.', **model_dump_kwargs) -> Dict[str, Any]:
-    return _flatten_dict(data.model_dump(**model_dump_kwargs), prefix='', separator=separator)
+    return columns
 
 
-__all__ = ('flatten_model_dump',)
+__all__ = ('flatten_model_dump', 'flatten_model_dump_columns', 'iter_flatten_model_dump')
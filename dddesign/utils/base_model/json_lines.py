@@ -0,0 +1,106 @@
+import mmap
+import os
+from functools import partial
+from typing import Any, BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel, ValidationError
+
+from dddesign.structure.domains.errors import CollectionError
+from dddesign.utils.base_model.error_wrapper import wrap_error
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_READ_SIZE = 1 << 20  # bytes read from a stream at once
+
+# a buffer (e.g. `mmap`) is scanned in place, a binary stream is read in chunks of `read_size`,
+# any other iterable is treated as already chunked bytes (e.g. an HTTP response body)
+JsonLinesSource = Union[bytes, bytearray, mmap.mmap, BinaryIO, Iterable[bytes]]
+JsonLine = Union[bytes, bytearray]
+
+
+class ModelBatch(NamedTuple):
+    items: List[Any]  # instances of the validated model in line order
+    errors: CollectionError  # `field_name` is prefixed with the 1-based line number, e.g. `line.17.email`
+
+
+def _iter_buffer_lines(buffer: Union[bytes, bytearray, mmap.mmap]) -> Iterator[JsonLine]:
+    start, size = 0, len(buffer)
+    while start < size:
+        end = buffer.find(b'\n', start)
+        if end == -1:
+            end = size
+        yield buffer[start:end]
+        start = end + 1
+
+
+def _iter_chunked_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    remainder = b''
+    for chunk in chunks:
+        lines = (remainder + chunk).split(b'\n') if remainder else chunk.split(b'\n')
+        remainder = lines.pop()
+        yield from lines
+
+    if remainder:
+        yield remainder
+
+
+def iter_json_lines(source: JsonLinesSource, read_size: int = DEFAULT_READ_SIZE) -> Iterator[JsonLine]:
+    """Yields raw lines of NDJSON (JSON Lines) without decoding them, blank lines are yielded as well"""
+    if isinstance(source, (bytes, bytearray, mmap.mmap)):
+        return _iter_buffer_lines(source)
+    elif hasattr(source, 'read'):
+        return _iter_chunked_lines(iter(partial(source.read, read_size), b''))
+    return _iter_chunked_lines(source)
+
+
+def iter_model_batches(
+    model_class: Type[ModelT],
+    source: JsonLinesSource,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    read_size: int = DEFAULT_READ_SIZE,
+    field_name_prefix: str = 'line',
+    max_errors: Optional[int] = None,
+) -> Iterator[ModelBatch]:
+    """
+    Validates every NDJSON line with `model_validate_json`, so lines are never decoded into intermediate dicts.
+    Yields batches of at most `batch_size` lines, `max_errors` limits errors kept per batch.
+    """
+    if batch_size < 1:
+        raise ValueError('`batch_size` must be greater than zero')
+
+    items: List[ModelT] = []
+    errors = CollectionError(max_errors=max_errors)
+    lines_count = 0
+    for line_number, line in enumerate(iter_json_lines(source, read_size=read_size), start=1):
+        if not line or line.isspace():
+            continue
+
+        try:
+            items.append(model_class.model_validate_json(line))
+        except ValidationError as error:
+            if not errors.is_full:
+                errors.extend(wrap_error(error, field_name_prefix=f'{field_name_prefix}.{line_number}'))
+
+        lines_count += 1
+        if lines_count == batch_size:
+            yield ModelBatch(items, errors)
+            items, errors, lines_count = [], CollectionError(max_errors=max_errors), 0
+
+    if lines_count:
+        yield ModelBatch(items, errors)
+
+
+def iter_model_batches_from_file(model_class: Type[ModelT], path: Union[str, os.PathLike], **kwargs) -> Iterator[ModelBatch]:
+    """Same as `iter_model_batches` over a memory-mapped file, pages are loaded by the OS on demand"""
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return  # empty files can not be memory-mapped
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                buffer.madvise(mmap.MADV_SEQUENTIAL)
+            yield from iter_model_batches(model_class, buffer, **kwargs)
+
+
+__all__ = ('ModelBatch', 'iter_json_lines', 'iter_model_batches', 'iter_model_batches_from_file')
@@ -0,0 +1,28 @@
+from typing import TYPE_CHECKING
+
+from dddesign.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from .events import Event, EventObserver, emit, has_observers, subscribe, unsubscribe
+    from .instrument import add_exporter, instrument_method, is_instrumented, remove_exporter
+    from .metrics import CallMetrics, CallRecord, InMemoryMetricsSink, MetricsExporter
+
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    attributes={
+        'Event': '.events',
+        'EventObserver': '.events',
+        'emit': '.events',
+        'has_observers': '.events',
+        'subscribe': '.events',
+        'unsubscribe': '.events',
+        'add_exporter': '.instrument',
+        'instrument_method': '.instrument',
+        'is_instrumented': '.instrument',
+        'remove_exporter': '.instrument',
+        'CallMetrics': '.metrics',
+        'CallRecord': '.metrics',
+        'InMemoryMetricsSink': '.metrics',
+        'MetricsExporter': '.metrics',
+    },
+)
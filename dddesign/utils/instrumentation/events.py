@@ -0,0 +1,56 @@
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+ALL_EVENTS = '*'
+
+
+class Event(NamedTuple):
+    name: str
+    source: Any  # object that emitted the event
+    duration: Optional[float] = None  # seconds
+    attributes: Mapping[str, Any] = MappingProxyType({})
+
+
+EventObserver = Callable[[Event], None]
+
+# event name -> observers, replaced as a whole on every change, so emitters read it without locking
+_observers: Dict[str, Tuple[EventObserver, ...]] = {}
+_observers_lock = Lock()
+
+
+def subscribe(observer: EventObserver, *event_names: str):
+    """Subscribes the observer to the given events, or to all events if no names are given"""
+    global _observers  # noqa: PLW0603
+    with _observers_lock:
+        observers = dict(_observers)
+        for event_name in event_names or (ALL_EVENTS,):
+            if observer not in observers.get(event_name, ()):
+                observers[event_name] = (*observers.get(event_name, ()), observer)
+        _observers = observers
+
+
+def unsubscribe(observer: EventObserver, *event_names: str):
+    """Unsubscribes the observer from the given events, or from all events if no names are given"""
+    global _observers  # noqa: PLW0603
+    with _observers_lock:
+        observers = {}
+        for event_name, event_observers in _observers.items():
+            if not event_names or event_name in event_names:
+                event_observers = tuple(item for item in event_observers if item is not observer)
+            if event_observers:
+                observers[event_name] = event_observers
+        _observers = observers
+
+
+def has_observers(event_name: str) -> bool:
+    """Emitters check it before measuring anything, so disabled events cost two dict lookups"""
+    return event_name in _observers or ALL_EVENTS in _observers
+
+
+def emit(event: Event):
+    for observer in (*_observers.get(event.name, ()), *_observers.get(ALL_EVENTS, ())):
+        observer(event)
+
+
+__all__ = ('ALL_EVENTS', 'Event', 'EventObserver', 'emit', 'has_observers', 'subscribe', 'unsubscribe')
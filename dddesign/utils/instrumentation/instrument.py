@@ -0,0 +1,139 @@
+import inspect
+import time
+import tracemalloc
+from contextvars import ContextVar
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, FrozenSet, Optional, Tuple
+
+from dddesign.structure.domains.errors import BaseError
+from dddesign.utils.instrumentation.metrics import CallRecord, MetricsExporter
+
+INSTRUMENTED_ATTRIBUTE = '__instrumented__'
+
+# replaced as a whole on every change, so calls read it without locking
+_exporters: Tuple[MetricsExporter, ...] = ()
+_exporters_lock = Lock()
+
+# (instance id, method name) of calls being measured, so `super()` calls of overridden methods are not recorded again
+_active_calls: ContextVar[FrozenSet[Tuple[int, str]]] = ContextVar('active_calls', default=frozenset())
+
+
+def add_exporter(exporter: MetricsExporter):
+    global _exporters  # noqa: PLW0603
+    with _exporters_lock:
+        if exporter not in _exporters:
+            _exporters = (*_exporters, exporter)
+
+
+def remove_exporter(exporter: MetricsExporter):
+    global _exporters  # noqa: PLW0603
+    with _exporters_lock:
+        _exporters = tuple(item for item in _exporters if item is not exporter)
+
+
+def get_exporters() -> Tuple[MetricsExporter, ...]:
+    return _exporters
+
+
+def get_error_code(error: BaseException) -> str:
+    return error.error_code if isinstance(error, BaseError) else type(error).__name__
+
+
+class _Measurement:
+    __slots__ = ('cpu_time', 'memory', 'wall_time')
+
+    def __init__(self, trace_memory: bool):
+        self.memory = tracemalloc.get_traced_memory()[0] if trace_memory and tracemalloc.is_tracing() else None
+        self.wall_time = time.perf_counter()
+        self.cpu_time = time.thread_time()
+
+    def finish(self, name: str, error: Optional[BaseException]) -> CallRecord:
+        cpu_time = time.thread_time() - self.cpu_time
+        wall_time = time.perf_counter() - self.wall_time
+        memory_delta = None
+        if self.memory is not None and tracemalloc.is_tracing():
+            memory_delta = tracemalloc.get_traced_memory()[0] - self.memory
+
+        return CallRecord(
+            name=name,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            error_code=None if error is None else get_error_code(error),
+            memory_delta=memory_delta,
+        )
+
+
+def export(record: CallRecord):
+    for exporter in _exporters:
+        exporter.export(record)
+
+
+def get_instance_name(instance: Any) -> str:
+    return f'{type(instance).__module__}.{type(instance).__qualname__}'
+
+
+def instrument_method(method: Callable, trace_memory: bool = False) -> Callable:
+    """
+    Wraps a method to export a `CallRecord` named after the class of the instance on every call.
+    Costs a single check while no exporter is registered. Nested calls of the same method on the same instance
+    (e.g. `super().handle()` of an overridden instrumented method) are measured once, by the outermost call.
+    For coroutines the CPU time also includes other tasks executed by the thread while awaiting.
+    """
+    name = method.__name__
+    if inspect.iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            active_calls = _active_calls.get()
+            if not _exporters or (id(self), name) in active_calls:
+                return await method(self, *args, **kwargs)
+
+            token = _active_calls.set(active_calls | {(id(self), name)})
+            measurement, error = _Measurement(trace_memory), None
+            try:
+                return await method(self, *args, **kwargs)
+            except BaseException as exception:
+                error = exception
+                raise
+            finally:
+                export(measurement.finish(get_instance_name(self), error))
+                _active_calls.reset(token)
+
+        setattr(async_wrapper, INSTRUMENTED_ATTRIBUTE, True)
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        active_calls = _active_calls.get()
+        if not _exporters or (id(self), name) in active_calls:
+            return method(self, *args, **kwargs)
+
+        token = _active_calls.set(active_calls | {(id(self), name)})
+        measurement, error = _Measurement(trace_memory), None
+        try:
+            return method(self, *args, **kwargs)
+        except BaseException as exception:
+            error = exception
+            raise
+        finally:
+            export(measurement.finish(get_instance_name(self), error))
+            _active_calls.reset(token)
+
+    setattr(wrapper, INSTRUMENTED_ATTRIBUTE, True)
+    return wrapper
+
+
+def is_instrumented(method: Callable) -> bool:
+    return getattr(method, INSTRUMENTED_ATTRIBUTE, False)
+
+
+__all__ = (
+    'add_exporter',
+    'export',
+    'get_error_code',
+    'get_exporters',
+    'instrument_method',
+    'is_instrumented',
+    'remove_exporter',
+)
@@ -0,0 +1,74 @@
+from threading import Lock
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Protocol
+
+
+class CallRecord(NamedTuple):
+    name: str
+    wall_time: float  # seconds
+    cpu_time: float  # seconds of CPU time of the calling thread
+    error_code: Optional[str] = None  # `BaseError.error_code` or exception class name
+    memory_delta: Optional[int] = None  # bytes, only when `tracemalloc` is tracing
+
+
+class CallMetrics(NamedTuple):
+    calls: int = 0
+    errors: int = 0
+    errors_by_code: Mapping[str, int] = MappingProxyType({})
+    wall_time_total: float = 0.0
+    wall_time_min: Optional[float] = None
+    wall_time_max: float = 0.0
+    cpu_time_total: float = 0.0
+    memory_delta_total: int = 0
+
+    @property
+    def wall_time_mean(self) -> float:
+        return self.wall_time_total / self.calls if self.calls else 0.0
+
+    def add(self, record: CallRecord) -> 'CallMetrics':
+        errors_by_code = self.errors_by_code
+        if record.error_code is not None:
+            errors_by_code = MappingProxyType(
+                {**errors_by_code, record.error_code: errors_by_code.get(record.error_code, 0) + 1}
+            )
+
+        return CallMetrics(
+            calls=self.calls + 1,
+            errors=self.errors + (record.error_code is not None),
+            errors_by_code=errors_by_code,
+            wall_time_total=self.wall_time_total + record.wall_time,
+            wall_time_min=record.wall_time if self.wall_time_min is None else min(self.wall_time_min, record.wall_time),
+            wall_time_max=max(self.wall_time_max, record.wall_time),
+            cpu_time_total=self.cpu_time_total + record.cpu_time,
+            memory_delta_total=self.memory_delta_total + (record.memory_delta or 0),
+        )
+
+
+class MetricsExporter(Protocol):
+    def export(self, record: CallRecord) -> None: ...
+
+
+class InMemoryMetricsSink:
+    """Aggregates call records per name in the current process"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._metrics: Dict[str, CallMetrics] = {}
+
+    def export(self, record: CallRecord) -> None:
+        with self._lock:
+            self._metrics[record.name] = self._metrics.get(record.name, CallMetrics()).add(record)
+
+    def get(self, name: str) -> CallMetrics:
+        return self._metrics.get(name, CallMetrics())
+
+    def snapshot(self) -> Dict[str, CallMetrics]:
+        with self._lock:
+            return dict(self._metrics)
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+
+
+__all__ = ('CallMetrics', 'CallRecord', 'InMemoryMetricsSink', 'MetricsExporter')
@@ -0,0 +1,41 @@
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def _import_module(name: str) -> ModuleType:
+    # unlike `importlib.import_module`, the builtin import is reported by `python -X importtime`
+    __import__(name)
+    return sys.modules[name]
+
+
+def lazy_import(
+    package_name: str, submodules: Sequence[str] = (), attributes: Optional[Dict[str, str]] = None
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], Tuple[str, ...]]:
+    """
+    Builds PEP 562 `__getattr__` and `__dir__` for a package, so its submodules and attributes
+    (attribute name -> relative module name) are imported on first access instead of the package import:
+
+        __getattr__, __dir__, __all__ = lazy_import(__name__, attributes={'Entity': '.entity'})
+    """
+    attributes = attributes or {}
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if name in submodules:
+            value = _import_module(f'{package_name}.{name}')
+        elif name in attributes:
+            value = getattr(_import_module(f'{package_name}{attributes[name]}'), name)
+        else:
+            raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+        # next accesses are resolved by the module dict without calling `__getattr__`
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[package_name]), *submodules, *attributes})
+
+    return __getattr__, __dir__, (*submodules, *attributes)
+
+
+__all__ = ('lazy_import',)
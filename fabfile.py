@@ -25,6 +25,10 @@ def tests():
     _run_command_container('pytest')
 
 
+def benchmarks(arguments=''):
+    _run_command_container(f'python -m benchmarks.runner {arguments}')
+
+
 def shell():
     _run_command_container('python -m IPython')
 
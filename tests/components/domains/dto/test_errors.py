@@ -1,7 +1,7 @@
 from unittest import TestCase
 
 from dddesign.components.domains.dto import Errors
-from dddesign.structure.domains.errors import BaseError, CollectionError
+from dddesign.structure.domains.errors import BaseError, CollectionError, ErrorAccumulator
 
 
 class CustomError(BaseError):
@@ -25,3 +25,18 @@ class TestErrors(TestCase):
         self.assertEqual(errors.errors[0].message, CustomError.message)
         self.assertEqual(errors.errors[0].error_code, CustomError.error_code)
         self.assertIsNone(errors.errors[0].field_name)
+
+    def test_factory_from_error_accumulator(self):
+        # Arrange
+        errors = ErrorAccumulator()
+        errors.add(CustomError.detail(field_name='email'))
+        errors.add(BaseError(message='Test message'))
+
+        # Act
+        errors_dto = Errors.factory(errors)
+
+        # Assert
+        self.assertEqual(len(errors_dto.errors), 2)
+        self.assertEqual(errors_dto.status_code, 400)
+        self.assertEqual(errors_dto.errors[0].field_name, 'email')
+        self.assertEqual(errors_dto.errors[1].error_code, 'base_error')
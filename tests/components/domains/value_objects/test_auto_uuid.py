@@ -1,5 +1,5 @@
 from unittest import TestCase
-from uuid import UUID, uuid4
+from uuid import RFC_4122, UUID, uuid4
 
 from parameterized import parameterized
 from pydantic import BaseModel as BaseModelV2, Field as FieldV2, ValidationError as ValidationErrorV2
@@ -12,6 +12,10 @@ class CustomerId(AutoUUID):
     pass
 
 
+class OrderId(AutoUUID):
+    GENERATED_VERSION = 7
+
+
 class CustomerV1(BaseModelV1):
     customer_id: CustomerId = FieldV1(default_factory=CustomerId)
     name: str
@@ -35,6 +39,28 @@ class TestAutoUUID(TestCase):
         self.assertIsInstance(uuid1, UUID)
         self.assertNotEqual(uuid1, uuid2)
 
+    @parameterized.expand(((AutoUUID, 4), (CustomerId, 4), (OrderId, 7)))
+    def test_generated_version(self, klass, version):
+        # Act
+        result = klass()
+
+        # Assert
+        self.assertEqual(result.version, version)
+        self.assertEqual(result.variant, RFC_4122)
+
+    def test_uuid7_is_time_ordered(self):
+        # Act
+        results = [OrderId() for _ in range(10_000)]
+
+        # Assert
+        self.assertEqual(results, sorted(results))
+        self.assertEqual(len(set(results)), len(results))
+
+    def test_unsupported_generated_version(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            type('UnsupportedId', (AutoUUID,), {'GENERATED_VERSION': 5})
+
     def test_from_hex_string_with_hyphens(self):
         # Arrange
         hex_string = '12345678-1234-5678-1234-567812345678'
@@ -118,6 +144,17 @@ class TestAutoUUID(TestCase):
         self.assertEqual(customer.customer_id.hex, original_uuid.hex)
         self.assertIsInstance(customer.customer_id, UUID)
 
+    @parameterized.expand((CustomerV1, CustomerV2))
+    def test_pydantic_validation_keeps_instance(self, pydantic_class):
+        # Arrange
+        customer_id = CustomerId()
+
+        # Act
+        customer = pydantic_class(customer_id=customer_id, name='Test User')
+
+        # Assert
+        self.assertIs(customer.customer_id, customer_id)
+
     @parameterized.expand(((CustomerV1, ValidationErrorV1), (CustomerV2, ValidationErrorV2)))
     def test_pydantic_validation_invalid_hex_string(self, pydantic_class, validation_error):
         # Act & Assert
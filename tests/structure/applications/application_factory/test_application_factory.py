@@ -1,11 +1,17 @@
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 from pydantic import ValidationError
 
 from dddesign.structure.applications import Application, ApplicationDependencyMapper, ApplicationFactory
-from dddesign.structure.applications.application_factory import RequestAttributeNotProvideError, RequestAttributeValueError
+from dddesign.structure.applications.application_factory import (
+    IMPLEMENTATION_EVENT,
+    RequestAttributeNotProvideError,
+    RequestAttributeValueError,
+)
 from dddesign.structure.domains.constants import BaseEnum
 from dddesign.structure.infrastructure.adapters.external import ExternalAdapter
+from dddesign.utils.instrumentation import subscribe, unsubscribe
 
 
 class FirstTestEnum(str, BaseEnum):
@@ -18,6 +24,17 @@ class SecondTestEnum(str, BaseEnum):
     SECOND_VALUE2 = 'second_value2'
 
 
+class RegionEnum(str, BaseEnum):
+    EU = 'eu'
+    US = 'us'
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.lower())
+        return None
+
+
 class Example1ExternalAdapter(ExternalAdapter):
     pass
 
@@ -67,6 +84,82 @@ class TestApplicationFactory(TestCase):
         with self.assertRaises(RequestAttributeValueError):
             application_factory.get(**{'first_test_enum': 'unknown_value'})
 
+    def test_implementation_events(self):
+        # Arrange
+        application_factory = ApplicationFactory(
+            application_class=ExampleWithoutDefaultStateApp,
+            dependency_mappers=(
+                ApplicationDependencyMapper(
+                    application_attribute_name='external_adapter',
+                    request_attribute_value_map={
+                        FirstTestEnum.FIRST_VALUE1: Example1ExternalAdapter(),
+                        FirstTestEnum.FIRST_VALUE2: Example2ExternalAdapter(),
+                    },
+                ),
+            ),
+        )
+        observer = MagicMock()
+        subscribe(observer, IMPLEMENTATION_EVENT)
+
+        # Act
+        try:
+            application_factory.get(first_test_enum=FirstTestEnum.FIRST_VALUE1)
+            application_factory.get(first_test_enum=FirstTestEnum.FIRST_VALUE1)
+        finally:
+            unsubscribe(observer)
+
+        # Assert
+        miss_event, hit_event = (call.args[0] for call in observer.call_args_list)
+        self.assertFalse(miss_event.attributes['cache_hit'])
+        self.assertIsNotNone(miss_event.duration)
+        self.assertTrue(hit_event.attributes['cache_hit'])
+        self.assertEqual(hit_event.attributes['request_attribute_values'], (FirstTestEnum.FIRST_VALUE1,))
+
+    def test_raw_request_attribute_values(self):
+        # Arrange
+        application_factory = ApplicationFactory(
+            application_class=ExampleWithoutDefaultStateApp,
+            dependency_mappers=(
+                ApplicationDependencyMapper(
+                    application_attribute_name='external_adapter',
+                    request_attribute_value_map={
+                        FirstTestEnum.FIRST_VALUE1: Example1ExternalAdapter(),
+                        FirstTestEnum.FIRST_VALUE2: Example2ExternalAdapter(),
+                    },
+                ),
+            ),
+        )
+
+        # Act & Assert
+        self.assertIs(
+            application_factory.get(first_test_enum=FirstTestEnum.FIRST_VALUE2.value),
+            application_factory.get(first_test_enum=FirstTestEnum.FIRST_VALUE2),
+        )
+
+        with self.assertRaises(RequestAttributeValueError):
+            application_factory.get(first_test_enum=['unhashable_value'])
+
+    def test_request_attribute_value_resolved_by_missing_hook(self):
+        # Arrange
+        application_factory = ApplicationFactory(
+            application_class=ExampleWithoutDefaultStateApp,
+            dependency_mappers=(
+                ApplicationDependencyMapper(
+                    application_attribute_name='external_adapter',
+                    request_attribute_value_map={
+                        RegionEnum.EU: Example1ExternalAdapter(),
+                        RegionEnum.US: Example2ExternalAdapter(),
+                    },
+                ),
+            ),
+        )
+
+        # Act & Assert
+        self.assertIs(application_factory.get(region_enum='EU'), application_factory.get(region_enum=RegionEnum.EU))
+
+        with self.assertRaises(RequestAttributeValueError):
+            application_factory.get(region_enum='ASIA')
+
     def test_correct_state_empty_dependency_mapper(self):
         # Act
         application_factory = ApplicationFactory(application_class=ExampleWitDefaultStateApp)
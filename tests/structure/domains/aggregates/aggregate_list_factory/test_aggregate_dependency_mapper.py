@@ -2,6 +2,7 @@ from typing import Dict, List, NewType
 from unittest import TestCase
 
 from ddutils.annotation_helpers import get_complex_sequence_element_annotation, is_complex_sequence
+from parameterized import parameterized
 from pydantic import ValidationError
 
 from dddesign.structure.domains.aggregates.aggregate_list_factory import AggregateDependencyMapper
@@ -160,3 +161,81 @@ class TestAggregateDependencyMapper(TestCase):
             )
         error = context.exception.errors()[0]['ctx']['error']
         self.assertEqual(error.code, 'key_annotation_must_be_the_same_as_method_argument_annotation')
+
+    @parameterized.expand(((1,), (3,)))
+    def test_get_related_object_map_by_chunks(self, max_workers):
+        # Arrange
+        requested_chunks = []
+
+        def get_images_by_chunks(image_ids: List[ImageId]) -> Dict[ImageId, Image]:
+            requested_chunks.append(image_ids)
+            return get_images(image_ids)
+
+        mapper = AggregateDependencyMapper(
+            entity_attribute_name='icon_id',
+            aggregate_attribute_name='icon',
+            method_getter=get_images_by_chunks,
+            max_batch_size=2,
+            max_workers=max_workers,
+        )
+
+        # Act
+        images = mapper.get_related_object_map(ImageId(image_id) for image_id in range(1, 6))
+
+        # Assert
+        self.assertEqual(sorted(images), [1, 2, 3, 4, 5])
+        self.assertEqual(sorted(requested_chunks), [[1, 2], [3, 4], [5]])
+
+    def test_get_related_object_map_without_ids(self):
+        # Arrange
+        mapper = AggregateDependencyMapper(
+            entity_attribute_name='icon_id', aggregate_attribute_name='icon', method_getter=get_images, max_batch_size=2
+        )
+
+        # Act & Assert
+        self.assertEqual(mapper.get_related_object_map(()), {})
+
+    @parameterized.expand((({'max_batch_size': 2},), ({'max_workers': 2},)))
+    def test_batch_options_for_single_getter(self, batch_options):
+        # Act & Assert
+        with self.assertRaises(ValidationError) as context:
+            AggregateDependencyMapper(
+                entity_attribute_name='icon_id', aggregate_attribute_name='icon', method_getter=get_image, **batch_options
+            )
+        error = context.exception.errors()[0]['ctx']['error']
+        self.assertEqual(error.code, 'batch_options_require_batch_method')
+
+    @parameterized.expand(
+        (
+            (
+                {'method_getter': get_images, 'related_key_attribute_name': 'image_id'},
+                'related_key_attribute_name_requires_many',
+            ),
+            ({'method_getter': get_image, 'many': True}, 'many_requires_sequence_related_argument'),
+            (
+                {'method_getter': get_images, 'many': True, 'related_key_attribute_name': 'image_id'},
+                'method_return_annotation_must_be_sequence',
+            ),
+            ({'method_getter': get_images, 'many': True}, 'value_annotation_must_be_sequence'),
+        )
+    )
+    def test_incorrect_one_to_many_state(self, mapper_options, error_code):
+        # Act & Assert
+        with self.assertRaises(ValidationError) as context:
+            AggregateDependencyMapper(entity_attribute_name='icon_id', aggregate_attribute_name='icon', **mapper_options)
+        error = context.exception.errors()[0]['ctx']['error']
+        self.assertEqual(error.code, error_code)
+
+    def test_correct_one_to_many_state(self):
+        # Act
+        mapper = AggregateDependencyMapper(
+            entity_attribute_name='icon_id',
+            aggregate_attribute_name='icons',
+            method_getter=get_images_with_list_return_annotation,
+            many=True,
+            related_key_attribute_name='image_id',
+        )
+
+        # Assert
+        self.assertEqual(mapper.related_object_annotation, List[Image])
+        self.assertEqual(mapper.get_related_object({}, ImageId(1)), [])
@@ -1,12 +1,23 @@
-from typing import Dict, List, NewType
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Event
+from typing import Dict, Iterator, List, NewType, Optional
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 from parameterized import parameterized
 from pydantic import ValidationError
 
 from dddesign.structure.domains.aggregates.aggregate import Aggregate
-from dddesign.structure.domains.aggregates.aggregate_list_factory import AggregateDependencyMapper, AggregateListFactory
+from dddesign.structure.domains.aggregates.aggregate_list_factory import (
+    CONSTRUCTION_EVENT,
+    DEPENDENCY_FETCH_EVENT,
+    AggregateDependencyMapper,
+    AggregateListFactory,
+    DependencyTimeoutError,
+)
 from dddesign.structure.domains.entities import Entity
+from dddesign.structure.infrastructure.repositories import Repository
+from dddesign.utils.instrumentation import subscribe, unsubscribe
 
 ImageId = NewType('ImageId', int)
 
@@ -25,6 +36,35 @@ class ProfileAggregate(Aggregate):
     icon: Image
 
 
+class ProfileWithOptionalIconAggregate(Aggregate):
+    profile: Profile
+    icon: Optional[Image]
+
+
+class Order(Entity):
+    order_id: int
+
+
+class OrderItem(Entity):
+    order_id: int
+    item_id: int
+
+
+class OrderAggregate(Aggregate):
+    order: Order
+    items: List[OrderItem]
+
+
+def get_order_items(order_ids: List[int]) -> List[OrderItem]:
+    return [
+        OrderItem(order_id=order_id, item_id=item_id) for order_id in order_ids if order_id > 1 for item_id in range(order_id)
+    ]
+
+
+def get_order_item_map(order_ids: List[int]) -> Dict[int, List[OrderItem]]:
+    return {order_id: [OrderItem(order_id=order_id, item_id=0)] for order_id in order_ids if order_id > 1}
+
+
 def get_image(image_id: ImageId) -> Image:
     return Image(image_id=image_id)
 
@@ -33,6 +73,16 @@ def get_images(image_ids: List[ImageId]) -> Dict[ImageId, Image]:
     return {image_id: Image(image_id=image_id) for image_id in image_ids}
 
 
+class ImageRepository(Repository):
+    DERIVE_BULK_METHODS: bool = True
+
+    storage: MagicMock
+
+    def get(self, image_id: ImageId) -> Optional[Image]:
+        self.storage.get(image_id)
+        return Image(image_id=image_id)
+
+
 class TestAggregateListFactory(TestCase):
     @parameterized.expand((get_image, get_images))
     def test_correct_state(self, method_getter):
@@ -57,6 +107,251 @@ class TestAggregateListFactory(TestCase):
             self.assertIsInstance(profile_aggregate.icon, Image)
             self.assertIsInstance(profile_aggregate.profile, Profile)
 
+    def test_batch_method_is_picked_up(self):
+        # Arrange
+        storage = MagicMock()
+        image_repository = ImageRepository(storage=storage)
+        profiles = [Profile(profile_id=index, icon_id=ImageId(index % 2 + 1)) for index in range(4)]
+        dependency_mapper = AggregateDependencyMapper(
+            entity_attribute_name='icon_id', aggregate_attribute_name='icon', method_getter=image_repository.get
+        )
+        aggregate_list_factory = AggregateListFactory(
+            aggregate_class=ProfileAggregate, aggregate_entity_attribute_name='profile', dependency_mappers=(dependency_mapper,)
+        )
+
+        # Act
+        profile_aggregates = aggregate_list_factory.create_list(profiles)
+
+        # Assert
+        self.assertEqual(dependency_mapper.batch_method[0], image_repository.get_map)
+        self.assertEqual(storage.get.call_count, 2)
+        self.assertEqual([aggregate.icon.image_id for aggregate in profile_aggregates], [1, 2, 1, 2])
+
+    def test_iter_create_list(self):
+        # Arrange
+        storage = MagicMock()
+        image_repository = ImageRepository(storage=storage)
+        profiles = (Profile(profile_id=index, icon_id=ImageId(index)) for index in range(1, 6))
+        aggregate_list_factory = AggregateListFactory(
+            aggregate_class=ProfileAggregate,
+            aggregate_entity_attribute_name='profile',
+            dependency_mappers=(
+                AggregateDependencyMapper(
+                    entity_attribute_name='icon_id', aggregate_attribute_name='icon', method_getter=image_repository.get
+                ),
+            ),
+        )
+
+        # Act
+        profile_aggregates = aggregate_list_factory.iter_create_list(profiles, chunk_size=2)
+
+        # Assert
+        self.assertIsInstance(profile_aggregates, Iterator)
+        self.assertEqual([aggregate.icon.image_id for aggregate in profile_aggregates], [1, 2, 3, 4, 5])
+        self.assertEqual(storage.get.call_count, 5)
+
+    @parameterized.expand((ProcessPoolExecutor, ThreadPoolExecutor))
+    def test_create_list_in_executor(self, executor_class):
+        # Arrange
+        profiles = [Profile(profile_id=index, icon_id=ImageId(index % 3 + 1)) for index in range(5)]
+        aggregate_list_factory = AggregateListFactory(
+            aggregate_class=ProfileAggregate,
+            aggregate_entity_attribute_name='profile',
+            dependency_mappers=(
+                AggregateDependencyMapper(
+                    entity_attribute_name='icon_id', aggregate_attribute_name='icon', method_getter=get_images
+                ),
+            ),
+        )
+
+        # Act
+        with executor_class(max_workers=2) as executor:
+            profile_aggregates = aggregate_list_factory.create_list(profiles, executor=executor, chunk_size=2)
+
+        # Assert
+        self.assertEqual(profile_aggregates, aggregate_list_factory.create_list(profiles))
+        self.assertEqual([aggregate.icon.image_id for aggregate in profile_aggregates], [1, 2, 3, 1, 2])
+        # a process pool returns copies of the entities
+        self.assertEqual(profile_aggregates[0].profile is profiles[0], executor_class is ThreadPoolExecutor)
+
+    def test_optional_dependency_is_degraded_on_timeout(self):
+        # Arrange
+        release = Event()
+        requested_image_ids = []
+
+        def get_images_slowly(image_ids: List[ImageId]) -> Dict[ImageId, Image]:
+            if requested_image_ids:
+                release.wait(1)
+            requested_image_ids.append(image_ids)
+            return get_images(image_ids)
+
+        aggregate_list_factory = AggregateListFactory(
+            aggregate_class=ProfileWithOptionalIconAggregate,
+            aggregate_entity_attribute_name='profile',
+            dependency_mappers=(
+                AggregateDependencyMapper(
+                    entity_attribute_name='icon_id',
+                    aggregate_attribute_name='icon',
+                    method_getter=get_images_slowly,
+                    timeout=0.05,
+                    stale_cache_size=10,
+                ),
+            ),
+        )
+        profiles = [Profile(profile_id=1, icon_id=ImageId(1)), Profile(profile_id=2, icon_id=ImageId(2))]
+
+        # Act
+        try:
+            first_result = aggregate_list_factory.create_partial_list(profiles[:1])
+            second_result = aggregate_list_factory.create_partial_list(profiles)
+        finally:
+            release.set()
+
+        # Assert
+        self.assertEqual(first_result.degraded_attribute_names, ())
+        self.assertEqual(second_result.degraded_attribute_names, ('icon',))
+        self.assertEqual(second_result.aggregates[0].icon.image_id, 1)  # stale related object
+        self.assertIsNone(second_result.aggregates[1].icon)
+
+    def test_required_dependency_timeout(self):
+        # Arrange
+        release = Event()
+
+        def get_images_slowly(image_ids: List[ImageId]) -> Dict[ImageId, Image]:
+            release.wait(1)
+            return get_images(image_ids)
+
+        aggregate_list_factory = AggregateListFactory(
+            aggregate_class=ProfileAggregate,
+            aggregate_entity_attribute_name='profile',
+            dependency_mappers=(
+                AggregateDependencyMapper(
+                    entity_attribute_name='icon_id', aggregate_attribute_name='icon', method_getter=get_images_slowly
+                ),
+            ),
+        )
+
+        # Act & Assert
+        try:
+            with self.assertRaises(DependencyTimeoutError):
+                aggregate_list_factory.create_list([Profile(profile_id=1, icon_id=ImageId(1))], timeout=0.05)
+        finally:
+            release.set()
+
+    def test_lazy_dependency(self):
+        # Arrange
+        storage = MagicMock()
+        image_repository = ImageRepository(storage=storage)
+        profiles = [Profile(profile_id=index, icon_id=ImageId(index % 2 + 1)) for index in range(4)]
+        aggregate_list_factory = AggregateListFactory(
+            aggregate_class=ProfileAggregate,
+            aggregate_entity_attribute_name='profile',
+            dependency_mappers=(
+                AggregateDependencyMapper(
+                    entity_attribute_name='icon_id',
+                    aggregate_attribute_name='icon',
+                    method_getter=image_repository.get,
+                    lazy=True,
+                ),
+            ),
+        )
+
+        # Act
+        profile_aggregates = aggregate_list_factory.create_list(profiles)
+        get_call_count_before_access = storage.get.call_count
+        icon_ids = [aggregate.icon.image_id for aggregate in profile_aggregates]
+
+        # Assert
+        self.assertEqual(get_call_count_before_access, 0)
+        self.assertEqual(icon_ids, [1, 2, 1, 2])
+        self.assertEqual(storage.get.call_count, 2)  # one batch for all aggregates
+        self.assertEqual(profile_aggregates[0].model_dump()['icon'], {'image_id': 1})
+
+    def test_lazy_dependency_is_not_built_in_executor(self):
+        # Arrange
+        aggregate_list_factory = AggregateListFactory(
+            aggregate_class=ProfileAggregate,
+            aggregate_entity_attribute_name='profile',
+            dependency_mappers=(
+                AggregateDependencyMapper(
+                    entity_attribute_name='icon_id', aggregate_attribute_name='icon', method_getter=get_images, lazy=True
+                ),
+            ),
+        )
+
+        # Act & Assert
+        with ThreadPoolExecutor() as executor, self.assertRaises(ValueError):
+            aggregate_list_factory.create_list([Profile(profile_id=1, icon_id=ImageId(1))], executor=executor)
+
+    @parameterized.expand(((get_order_items, 'order_id', [[], [0, 1], [0, 1, 2]]), (get_order_item_map, None, [[], [0], [0]])))
+    def test_one_to_many_dependency(self, method_getter, related_key_attribute_name, expected_item_ids):
+        # Arrange
+        orders = [Order(order_id=order_id) for order_id in range(1, 4)]
+        aggregate_list_factory = AggregateListFactory(
+            aggregate_class=OrderAggregate,
+            aggregate_entity_attribute_name='order',
+            dependency_mappers=(
+                AggregateDependencyMapper(
+                    entity_attribute_name='order_id',
+                    aggregate_attribute_name='items',
+                    method_getter=method_getter,
+                    many=True,
+                    related_key_attribute_name=related_key_attribute_name,
+                    max_batch_size=2,
+                ),
+            ),
+        )
+
+        # Act
+        order_aggregates = aggregate_list_factory.create_list(orders)
+
+        # Assert
+        self.assertEqual([[item.item_id for item in aggregate.items] for aggregate in order_aggregates], expected_item_ids)
+        self.assertTrue(
+            all(item.order_id == aggregate.order.order_id for aggregate in order_aggregates for item in aggregate.items)
+        )
+
+    def test_events(self):
+        # Arrange
+        image_repository = ImageRepository(storage=MagicMock())
+        profiles = [Profile(profile_id=index, icon_id=ImageId(index % 2 + 1)) for index in range(4)]
+        aggregate_list_factory = AggregateListFactory(
+            aggregate_class=ProfileAggregate,
+            aggregate_entity_attribute_name='profile',
+            dependency_mappers=(
+                AggregateDependencyMapper(
+                    entity_attribute_name='icon_id', aggregate_attribute_name='icon', method_getter=image_repository.get
+                ),
+            ),
+        )
+        observer = MagicMock()
+        subscribe(observer, DEPENDENCY_FETCH_EVENT, CONSTRUCTION_EVENT)
+
+        # Act
+        try:
+            aggregate_list_factory.create_list(profiles)
+        finally:
+            unsubscribe(observer)
+
+        # Assert
+        fetch_event, construction_event = (call.args[0] for call in observer.call_args_list)
+        self.assertEqual(fetch_event.name, DEPENDENCY_FETCH_EVENT)
+        self.assertIs(fetch_event.source, aggregate_list_factory)
+        self.assertEqual(fetch_event.attributes['ids_count'], 2)
+        self.assertTrue(fetch_event.attributes['batch'])
+        self.assertEqual(construction_event.name, CONSTRUCTION_EVENT)
+        self.assertEqual(construction_event.attributes, {'aggregates_count': 4, 'executor': False})
+        self.assertGreaterEqual(construction_event.duration, 0)
+
+    def test_batch_method_is_not_picked_up_for_plain_function(self):
+        # Act
+        dependency_mapper = AggregateDependencyMapper(
+            entity_attribute_name='icon_id', aggregate_attribute_name='icon', method_getter=get_image
+        )
+
+        # Assert
+        self.assertIsNone(dependency_mapper.batch_method)
+
     def test_aggregate_class_does_not_have_entity_attribute(self):
         # Act & Assert
         with self.assertRaises(ValidationError) as context:
@@ -1,12 +1,167 @@
+from typing import Optional
 from unittest import TestCase
+from unittest.mock import MagicMock
+
+from pydantic import ValidationError, field_validator, model_validator
 
 from dddesign.structure.domains.aggregates import Aggregate
 from tests.structure.validators import validate_arbitrary_types_allowed, validate_assignment
 
 
+class ProfileAggregate(Aggregate):
+    name: str
+    icon_url: str
+
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, value: str) -> str:
+        return value.strip()
+
+
+def create_lazy_aggregate(name: str = 'name') -> ProfileAggregate:
+    loader = MagicMock()
+    loader.load.return_value = 'https://example.com/icon.png'
+    return ProfileAggregate.model_validate_lazy({'name': name}, {'icon_url': loader})
+
+
 class TestAggregate(TestCase):
     def test_arbitrary_types_allowed(self):
         validate_arbitrary_types_allowed(Aggregate)
 
     def test_assignment(self):
         validate_assignment(Aggregate)
+
+    def test_lazy_attribute(self):
+        # Arrange
+        loader = MagicMock()
+        loader.load.return_value = 'https://example.com/icon.png'
+        aggregate = ProfileAggregate.model_construct(name='name')
+        aggregate._lazy_attribute_loaders['icon_url'] = loader
+
+        # Act
+        icon_url = aggregate.icon_url
+
+        # Assert
+        self.assertEqual(icon_url, 'https://example.com/icon.png')
+        self.assertEqual(aggregate.model_dump(), {'name': 'name', 'icon_url': icon_url})
+        loader.load.assert_called_once_with(aggregate)
+        with self.assertRaises(AttributeError):
+            aggregate.unknown  # noqa: B018
+
+    def test_model_validate_lazy(self):
+        # Act
+        aggregate = create_lazy_aggregate(name=' name ')
+
+        # Assert
+        self.assertEqual(aggregate.name, 'name')
+        self.assertNotIn('icon_url', aggregate.__dict__)
+
+    def test_model_validate_lazy_validates_fields(self):
+        # Act & Assert
+        with self.assertRaisesRegex(ValidationError, 'name'):
+            ProfileAggregate.model_validate_lazy({'name': 1}, {'icon_url': MagicMock()})
+
+        with self.assertRaisesRegex(ValidationError, 'Field required'):
+            ProfileAggregate.model_validate_lazy({}, {'icon_url': MagicMock()})
+
+    def test_model_validate_lazy_runs_model_validators(self):
+        # Arrange
+        class _ProfileAggregate(ProfileAggregate):
+            @model_validator(mode='after')
+            def validate_icon_url(self):
+                if not self.icon_url.startswith('https://'):
+                    raise ValueError('Icon URL must be secure')
+                return self
+
+        loader = MagicMock()
+        loader.load.return_value = 'http://example.com/icon.png'
+
+        # Act & Assert
+        with self.assertRaisesRegex(ValidationError, 'Icon URL must be secure'):
+            _ProfileAggregate.model_validate_lazy({'name': 'name'}, {'icon_url': loader})
+
+    def test_lazy_attribute_in_repr_and_dict(self):
+        # Arrange
+        aggregate = create_lazy_aggregate()
+
+        # Act
+        aggregate_repr = repr(create_lazy_aggregate())
+        aggregate_dict = dict(aggregate)
+
+        # Assert
+        self.assertIn("icon_url='https://example.com/icon.png'", aggregate_repr)
+        self.assertEqual(aggregate_dict, {'name': 'name', 'icon_url': 'https://example.com/icon.png'})
+
+    def test_lazy_attribute_in_eq(self):
+        # Arrange
+        aggregate = create_lazy_aggregate()
+        other_aggregate = create_lazy_aggregate()
+        aggregate.icon_url  # noqa: B018
+
+        # Act & Assert
+        self.assertEqual(aggregate, other_aggregate)
+        self.assertEqual(aggregate, ProfileAggregate(name='name', icon_url='https://example.com/icon.png'))
+        self.assertNotEqual(aggregate, create_lazy_aggregate(name='other'))
+
+    def test_lazy_attribute_in_bulk_assign(self):
+        # Arrange
+        aggregate = create_lazy_aggregate()
+
+        # Act
+        aggregate.bulk_assign(name='other')
+
+        # Assert
+        self.assertEqual(aggregate.model_dump(), {'name': 'other', 'icon_url': 'https://example.com/icon.png'})
+
+    def test_assigned_lazy_attribute_is_not_loaded(self):
+        # Arrange
+        aggregate = create_lazy_aggregate()
+        loader = aggregate._lazy_attribute_loaders['icon_url']
+
+        # Act
+        aggregate.icon_url = 'https://example.com/other.png'
+
+        # Assert
+        self.assertEqual(aggregate.model_dump()['icon_url'], 'https://example.com/other.png')
+        loader.load.assert_not_called()
+
+    def test_lazy_attribute_with_default(self):
+        # Arrange
+        class _ProfileAggregate(Aggregate):
+            name: str
+            icon_url: Optional[str] = None
+
+        loader = MagicMock()
+        loader.load.return_value = 'https://example.com/icon.png'
+        aggregate = _ProfileAggregate.model_validate_lazy({'name': 'name'}, {'icon_url': loader})
+
+        # Act
+        icon_url = aggregate.icon_url
+
+        # Assert
+        self.assertEqual(icon_url, 'https://example.com/icon.png')
+        loader.load.assert_called_once_with(aggregate)
+
+    def test_loaded_lazy_attribute_is_validated(self):
+        # Arrange
+        class _ProfileAggregate(Aggregate):
+            name: str
+            icon_width: int
+
+            @field_validator('icon_width')
+            @classmethod
+            def validate_icon_width(cls, value: int) -> int:
+                if value < 0:
+                    raise ValueError('Icon width must be positive')
+                return value
+
+        loader = MagicMock()
+        loader.load.side_effect = ('64', -1)
+
+        # Act
+        icon_width = _ProfileAggregate.model_validate_lazy({'name': 'name'}, {'icon_width': loader}).icon_width
+
+        # Assert
+        self.assertEqual(icon_width, 64)
+        with self.assertRaisesRegex(ValidationError, 'Icon width must be positive'):
+            _ProfileAggregate.model_validate_lazy({'name': 'name'}, {'icon_width': loader}).icon_width  # noqa: B018
@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+from parameterized import parameterized
+
 from dddesign.structure.domains.constants import BaseEnum
 
 
@@ -13,6 +15,22 @@ class StrEnum(str, BaseEnum):
     SECOND = '2'
 
 
+class CaseEnum(str, BaseEnum):
+    ACTIVE = 'Active'
+    PENDING = 'PENDING'
+
+
+class RegionEnum(str, BaseEnum):
+    EU = 'eu'
+    US = 'us'
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.lower())
+        return None
+
+
 class TestBaseEnum(TestCase):
     def test_has_value_int(self):
         # Act & Assert
@@ -27,3 +45,45 @@ class TestBaseEnum(TestCase):
         self.assertTrue(StrEnum.has_value('2'))
         self.assertFalse(StrEnum.has_value('3'))
         self.assertFalse(StrEnum.has_value(4))
+
+    @parameterized.expand(
+        ((StrEnum, '1', StrEnum.FIRST), (IntEnum, '2', IntEnum.SECOND), (CaseEnum, 'active', CaseEnum.ACTIVE))
+    )
+    def test_get_by_str_value(self, enum_class, value, member):
+        # Act & Assert
+        self.assertIs(enum_class.get_by_str_value(value), member)
+
+    def test_get_by_str_value_ignores_case(self):
+        # Act & Assert
+        self.assertIs(CaseEnum.get_by_str_value('ACTIVE'), CaseEnum.ACTIVE)
+        self.assertIs(CaseEnum.get_by_str_value('Pending'), CaseEnum.PENDING)
+        self.assertIsNone(CaseEnum.get_by_str_value('unknown'))
+
+    @parameterized.expand(
+        (
+            (IntEnum, 1, IntEnum.FIRST),
+            (IntEnum, '2', IntEnum.SECOND),
+            (IntEnum, IntEnum.SECOND, IntEnum.SECOND),
+            (StrEnum, '1', StrEnum.FIRST),
+            (StrEnum, 2, StrEnum.SECOND),
+            (CaseEnum, 'Active', CaseEnum.ACTIVE),
+        )
+    )
+    def test_coerce(self, enum_class, value, member):
+        # Act & Assert
+        self.assertIs(enum_class.coerce(value), member)
+
+    def test_coerce_with_missing_hook(self):
+        # Act & Assert
+        self.assertIs(RegionEnum.coerce('EU'), RegionEnum('EU'))
+        self.assertIsNone(RegionEnum.coerce('asia'))
+        self.assertIsNone(RegionEnum.coerce(['EU']))
+
+    @parameterized.expand(((IntEnum, 3), (IntEnum, '01'), (StrEnum, '3'), (CaseEnum, 'active'), (CaseEnum, ['Active'])))
+    def test_coerce_unknown_value(self, enum_class, value):
+        # Arrange
+        default = next(iter(enum_class))
+
+        # Act & Assert
+        self.assertIsNone(enum_class.coerce(value))
+        self.assertIs(enum_class.coerce(value, default=default), default)
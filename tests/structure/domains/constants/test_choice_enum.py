@@ -37,3 +37,34 @@ class TestChoiceEnum(TestCase):
         # Assert
         self.assertIsInstance(choices, tuple)
         self.assertEqual(len(choices), 3)
+
+    def test_get_choices_is_cached(self):
+        # Act & Assert
+        self.assertIs(StatusEnum.get_choices(), StatusEnum.get_choices())
+        self.assertEqual(
+            StatusEnum.get_choices(), (('active', 'Active'), ('inactive', 'Inactive'), ('pending_approval', 'Pending Approval'))
+        )
+
+    @parameterized.expand(
+        (
+            (PriorityEnum, 'Medium', PriorityEnum.MEDIUM),
+            (StatusEnum, 'Pending Approval', StatusEnum.PENDING_APPROVAL),
+            (StatusEnum, 'pending approval', StatusEnum.PENDING_APPROVAL),
+            (StatusEnum, 'Unknown', None),
+        )
+    )
+    def test_get_by_title(self, enum_class, title, member):
+        # Act & Assert
+        self.assertIs(enum_class.get_by_title(title), member)
+
+    def test_overridden_get_title(self):
+        # Arrange
+        class CustomTitleEnum(str, ChoiceEnum):
+            FIRST = 'first'
+
+            def get_title(self) -> str:
+                return f'#{self.value}'
+
+        # Act & Assert
+        self.assertEqual(CustomTitleEnum.get_choices(), (('first', '#first'),))
+        self.assertIs(CustomTitleEnum.get_by_title('#first'), CustomTitleEnum.FIRST)
@@ -1,6 +1,10 @@
 from unittest import TestCase
 
+from parameterized import parameterized
+from pydantic import Field
+
 from dddesign.structure.domains.dto import DataTransferObject
+from dddesign.structure.domains.dto.dto import get_list_adapter
 from tests.structure.validators import validate_arbitrary_types_allowed, validate_immutable
 
 
@@ -10,3 +14,44 @@ class TestDataTransferObject(TestCase):
 
     def test_arbitrary_types_allowed(self):
         validate_arbitrary_types_allowed(DataTransferObject)
+
+
+class UserDTO(DataTransferObject):
+    name: str
+    email: str = Field(pattern=r'^[^@]+@[^@]+$')
+
+
+class TestValidateMany(TestCase):
+    def test_all_items_valid(self):
+        # Act
+        result = UserDTO.validate_many({'name': f'user{index}', 'email': f'user{index}@test'} for index in range(3))
+
+        # Assert
+        self.assertEqual([item.name for item in result.items], ['user0', 'user1', 'user2'])
+        self.assertFalse(result.errors)
+        self.assertEqual(result.invalid_indexes, ())
+
+    @parameterized.expand(
+        (('items', None, ['items.1.email', 'items.3.name', 'items.3.email']), (None, 2, ['1.email', '3.name']))
+    )
+    def test_invalid_items(self, field_name_prefix, max_errors, expected_field_names):
+        # Arrange
+        items = [
+            {'name': 'user0', 'email': 'user0@test'},
+            {'name': 'user1', 'email': 'user1'},
+            UserDTO(name='user2', email='user2@test'),
+            {'email': 'user3'},
+        ]
+
+        # Act
+        result = UserDTO.validate_many(items, field_name_prefix=field_name_prefix, max_errors=max_errors)
+
+        # Assert
+        self.assertEqual([item.name for item in result.items], ['user0', 'user2'])
+        self.assertTrue(all(isinstance(item, UserDTO) for item in result.items))
+        self.assertEqual([error.field_name for error in result.errors], expected_field_names)
+        self.assertEqual(result.invalid_indexes, (1, 3))
+
+    def test_adapter_is_cached(self):
+        # Act & Assert
+        self.assertIs(get_list_adapter(UserDTO), get_list_adapter(UserDTO))
@@ -3,7 +3,7 @@ from unittest import TestCase
 from uuid import uuid4
 
 from parameterized import parameterized
-from pydantic import Field
+from pydantic import BaseModel, Field, field_validator
 
 from dddesign.structure.domains.dto import DataTransferObject
 from dddesign.structure.domains.entities import Entity
@@ -20,6 +20,34 @@ class SomeEntity(Entity):
     some_field: str = Field(default=DEFAULT_VALUE)
 
 
+class PasswordEntity(Entity):
+    name: str
+    password: str
+
+    @field_validator('password')
+    @classmethod
+    def hash_password(cls, value: str) -> str:
+        return f'hash({value})'
+
+
+class NameDTO(DataTransferObject):
+    name: str
+
+
+class Address(BaseModel):
+    city: str
+
+
+class IdentifiedEntity(Entity):
+    __identity_field__ = 'entity_id'
+
+    entity_id: Optional[int] = None
+    address: Address = Address(city='city')
+
+
+class OtherIdentifiedEntity(IdentifiedEntity): ...
+
+
 class TestEntity(TestCase):
     def test_arbitrary_types_allowed(self):
         validate_arbitrary_types_allowed(Entity)
@@ -44,3 +72,59 @@ class TestEntity(TestCase):
 
         # Assert
         self.assertEqual(entity.some_field, excepted_value)
+
+    def test_update_does_not_revalidate_untouched_fields(self):
+        # Arrange
+        entity = PasswordEntity(name='a', password='x')
+
+        # Act
+        entity.update(NameDTO(name='b'))
+
+        # Assert
+        self.assertEqual((entity.name, entity.password), ('b', 'hash(x)'))
+
+    def test_equality_without_identity_field(self):
+        # Act & Assert
+        self.assertEqual(SomeEntity(some_field='a'), SomeEntity(some_field='a'))
+        self.assertNotEqual(SomeEntity(some_field='a'), SomeEntity(some_field='b'))
+        with self.assertRaises(TypeError):
+            hash(SomeEntity())
+
+    @parameterized.expand(
+        (
+            (IdentifiedEntity(entity_id=1), IdentifiedEntity(entity_id=1, address=Address(city='other')), True),
+            (IdentifiedEntity(entity_id=1), IdentifiedEntity(entity_id=2), False),
+            (IdentifiedEntity(entity_id=1), OtherIdentifiedEntity(entity_id=1), False),
+            (IdentifiedEntity(), IdentifiedEntity(), False),
+        )
+    )
+    def test_equality_with_identity_field(self, entity, other_entity, expected_equal):
+        # Act & Assert
+        self.assertEqual(entity == other_entity, expected_equal)
+        self.assertEqual(len({entity, other_entity}), 1 if expected_equal else 2)
+
+    def test_entity_without_identity_is_equal_to_itself(self):
+        # Arrange
+        entity = IdentifiedEntity()
+
+        # Act & Assert
+        self.assertEqual(entity, entity)
+        self.assertEqual({entity: 1}[entity], 1)
+
+    def test_incorrect_identity_field(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+
+            class IncorrectEntity(Entity):
+                __identity_field__ = 'unknown_field'
+
+    def test_identity_field_opt_out_in_subclass(self):
+        # Arrange
+        class ValueLikeEntity(IdentifiedEntity):
+            __identity_field__ = None
+
+        # Act & Assert
+        self.assertEqual(ValueLikeEntity(entity_id=1), ValueLikeEntity(entity_id=1))
+        self.assertNotEqual(ValueLikeEntity(entity_id=1), ValueLikeEntity(entity_id=1, address=Address(city='other')))
+        with self.assertRaises(TypeError):
+            hash(ValueLikeEntity(entity_id=1))
@@ -54,3 +54,21 @@ class TestBaseError(TestCase):
         with self.assertRaises(ValueError) as ctx:
             BaseError(message='Error message: {error_message} and {some_arg}', error_message='x')
         self.assertIn('some_arg', str(ctx.exception))
+
+    def test_attributes_set_by_subclass_before_init(self):
+        # Arrange
+        class FieldError(BaseError):
+            message = 'Field is invalid'
+
+            def __init__(self, field_name: str, **kwargs):
+                self.field_name = field_name
+                self.message = f'Field {field_name} is invalid'
+                super().__init__(**kwargs)
+
+        # Act
+        error = FieldError(field_name='email')
+
+        # Assert
+        self.assertEqual(error.field_name, 'email')
+        self.assertEqual(error.message, 'Field email is invalid')
+        self.assertEqual(error.error_code, 'field_error')
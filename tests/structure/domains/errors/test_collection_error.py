@@ -30,3 +30,78 @@ class TestCollectionError(TestCase):
         # Assert
         with self.assertRaises(TypeError):
             error.add(ValueError('Test message'))
+
+    def test_repeated_iteration(self):
+        # Arrange
+        error = CollectionError()
+        error.add(BaseError(message='Test message 1'))
+        error.add(BaseError(message='Test message 2'))
+
+        # Act
+        first_pass = [_err.message for _err in error]
+        second_pass = [_err.message for _err in error]
+
+        # Assert
+        self.assertEqual(first_pass, ['Test message 1', 'Test message 2'])
+        self.assertEqual(first_pass, second_pass)
+        self.assertEqual(len(error), 2)
+
+    def test_add_many(self):
+        # Act
+        error = CollectionError()
+        error.add_many(BaseError(message=f'Test message {index}') for index in range(3))
+
+        # Assert
+        self.assertEqual(len(error), 3)
+
+    def test_add_many_non_base_error(self):
+        # Arrange
+        error = CollectionError()
+
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            error.add_many((BaseError(message='Test message'), ValueError('Test message')))
+        self.assertEqual(len(error), 0)
+
+    def test_extend(self):
+        # Arrange
+        error = CollectionError()
+        error.add(BaseError(message='Test message 1'))
+        other_error = CollectionError()
+        other_error.add(BaseError(message='Test message 2'))
+
+        # Act
+        error.extend(other_error)
+
+        # Assert
+        self.assertEqual([_err.message for _err in error], ['Test message 1', 'Test message 2'])
+
+    def test_max_errors(self):
+        # Arrange
+        error = CollectionError(max_errors=2)
+
+        # Act
+        error.add(BaseError(message='Test message 1'))
+        error.add_many(BaseError(message=f'Test message {index}') for index in range(2, 5))
+        error.add(BaseError(message='Test message 5'))
+
+        # Assert
+        self.assertTrue(error.is_full)
+        self.assertEqual([_err.message for _err in error], ['Test message 1', 'Test message 2'])
+
+    def test_add_many_stops_consuming_when_full(self):
+        # Arrange
+        error = CollectionError(max_errors=2)
+        errors = (BaseError(message=f'Test message {index}') for index in range(100))
+
+        # Act
+        error.add_many(errors)
+
+        # Assert
+        self.assertEqual(len(error), 2)
+        self.assertEqual(next(errors).message, 'Test message 2')
+
+    def test_incorrect_max_errors(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            CollectionError(max_errors=0)
@@ -0,0 +1,128 @@
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from dddesign.structure.domains.errors import BaseError, CollectionError, ErrorAccumulator, ErrorDetail, Result
+
+
+class InvalidEmailError(BaseError):
+    message = 'Email {email} is invalid'
+    status_code = 422
+    field_name = 'email'
+
+
+class TestErrorDetail(TestCase):
+    def test_detail_matches_error(self):
+        # Act
+        detail = InvalidEmailError.detail(email='{name}@')
+        error = InvalidEmailError(email='{name}@')
+
+        # Assert
+        self.assertEqual(detail, ErrorDetail.from_error(error))
+        self.assertEqual(detail, ErrorDetail('Email {name}@ is invalid', 'invalid_email_error', 422, 'email'))
+
+    def test_detail_with_missing_placeholder(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            InvalidEmailError.detail()
+
+    def test_to_error(self):
+        # Arrange
+        detail = InvalidEmailError.detail(email='{name}@').with_field_name('items.1.email')
+
+        # Act
+        error = detail.to_error()
+
+        # Assert
+        self.assertIsInstance(error, BaseError)
+        self.assertEqual(error.message, 'Email {name}@ is invalid')
+        self.assertEqual(error.field_name, 'items.1.email')
+        self.assertEqual(ErrorDetail.from_error(error), detail)
+
+    def test_to_error_with_error_class(self):
+        # Arrange
+        detail = InvalidEmailError.detail(email='test@')
+
+        # Act
+        error = detail.to_error(InvalidEmailError)
+
+        # Assert
+        self.assertIsInstance(error, InvalidEmailError)
+        self.assertEqual(ErrorDetail.from_error(error), detail)
+
+
+class TestErrorAccumulator(TestCase):
+    def test_incorrect_max_errors(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            ErrorAccumulator(max_errors=0)
+
+    @parameterized.expand(((None, 3), (2, 2)))
+    def test_add_many(self, max_errors, expected_count):
+        # Arrange
+        errors = ErrorAccumulator(max_errors=max_errors)
+
+        # Act
+        errors.add(BaseError(message='Test message 0'))
+        errors.add_many(ErrorDetail(message=f'Test message {index}', error_code='test') for index in range(1, 3))
+
+        # Assert
+        self.assertEqual(len(errors), expected_count)
+        self.assertTrue(all(isinstance(detail, ErrorDetail) for detail in errors))
+        self.assertEqual(errors.is_full, max_errors is not None)
+
+    def test_add_incorrect_type(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            ErrorAccumulator().add(ValueError('Test message'))
+
+    def test_to_collection_error(self):
+        # Arrange
+        errors = ErrorAccumulator()
+        errors.add(InvalidEmailError.detail(email='test@'))
+
+        # Act
+        collection_error = errors.to_collection_error()
+
+        # Assert
+        self.assertIsInstance(collection_error, CollectionError)
+        self.assertEqual([error.message for error in collection_error], ['Email test@ is invalid'])
+
+    def test_raise_if_any(self):
+        # Arrange
+        errors = ErrorAccumulator()
+
+        # Act
+        errors.raise_if_any()
+        errors.add(InvalidEmailError.detail(email='test@'))
+
+        # Assert
+        with self.assertRaises(CollectionError):
+            errors.raise_if_any()
+
+
+class TestResult(TestCase):
+    def test_ok(self):
+        # Act
+        result = Result.ok(1)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertTrue(result.is_ok)
+        self.assertEqual(result.unwrap(), 1)
+
+    def test_fail(self):
+        # Act
+        result: Result[int] = Result.fail(InvalidEmailError.detail(email='test@'))
+
+        # Assert
+        self.assertFalse(result)
+        self.assertIsNone(result.value)
+        with self.assertRaises(CollectionError) as context:
+            result.unwrap()
+        self.assertEqual(context.exception.errors[0].error_code, 'invalid_email_error')
+
+    def test_fail_without_errors(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            Result.fail()
@@ -1,12 +1,83 @@
+import gc
+from typing import List
 from unittest import TestCase
 
+from pydantic import BaseModel
+
 from dddesign.structure.domains.value_objects import ValueObject
 from tests.structure.validators import validate_arbitrary_types_allowed, validate_immutable
 
 
+class Currency(ValueObject):
+    INTERN = True
+
+    code: str
+
+
+class Unit(ValueObject):
+    CACHE_HASH = True
+
+    name: str
+    scale: int
+
+
+class Price(BaseModel):
+    currencies: List[Currency]
+
+
 class TestValueObject(TestCase):
     def test_immutable(self):
         validate_immutable(ValueObject)
 
     def test_arbitrary_types_allowed(self):
         validate_arbitrary_types_allowed(ValueObject)
+
+    def test_cache_hash(self):
+        # Arrange
+        unit = Unit(name='meter', scale=1)
+
+        # Act
+        unit_hash = hash(unit)
+
+        # Assert
+        self.assertEqual(unit._cached_hash, unit_hash)
+        self.assertEqual(unit_hash, hash(Unit(name='meter', scale=1)))
+        self.assertEqual(unit, Unit(name='meter', scale=1))
+        self.assertEqual(hash(unit.model_copy(update={'scale': 2})), hash(Unit(name='meter', scale=2)))
+
+    def test_intern_validated_fields(self):
+        # Act
+        price = Price(currencies=[{'code': 'USD'}, {'code': 'USD'}, Currency(code='USD'), {'code': 'EUR'}])
+
+        # Assert
+        self.assertIs(price.currencies[0], price.currencies[1])
+        self.assertIs(price.currencies[0], price.currencies[2])
+        self.assertIs(Currency.model_validate({'code': 'USD'}), price.currencies[0])
+        self.assertNotEqual(price.currencies[0], price.currencies[3])
+
+    def test_intern_constructed_instance(self):
+        # Arrange
+        currency = Currency.model_validate({'code': 'GBP'})
+
+        # Act
+        constructed_currency = Currency(code='GBP')
+
+        # Assert
+        self.assertIsNot(constructed_currency, currency)
+        self.assertEqual(constructed_currency, currency)
+        self.assertIs(constructed_currency.intern(), currency)
+
+    def test_intern_table_is_weak(self):
+        # Arrange
+        Currency.model_validate({'code': 'JPY'})
+
+        # Act
+        gc.collect()
+
+        # Assert
+        self.assertNotIn('JPY', Currency._intern_table)
+
+    def test_intern_without_option(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            Unit(name='meter', scale=1).intern()
@@ -0,0 +1,165 @@
+import asyncio
+import inspect
+from typing import AsyncGenerator, AsyncIterator, Iterator, List, Optional
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import MagicMock
+
+from dddesign.structure.domains.entities import Entity
+from dddesign.structure.infrastructure.repositories import AsyncRepository, Repository, aiterate_cursor, identity_map_scope
+
+
+class Customer(Entity):
+    customer_id: int
+
+
+class CustomerRepository(AsyncRepository):
+    USE_IDENTITY_MAP: bool = True
+    DERIVE_BULK_METHODS: bool = True
+
+    storage: MagicMock
+
+    async def get(self, customer_id: int) -> Optional[Customer]:
+        self.storage.get(customer_id)
+        await asyncio.sleep(0)
+        return Customer(customer_id=customer_id)
+
+    async def get_list(self) -> AsyncGenerator[Customer, None]:
+        for customer_id in range(2):
+            yield Customer(customer_id=customer_id)
+
+    async def delete(self, customer_id: int):
+        self.storage.delete(customer_id)
+
+
+class TestAsyncRepositoryContract(TestCase):
+    def test_sync_method_in_async_repository(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+
+            class _Repository(AsyncRepository):
+                def get(self, customer_id: int) -> Optional[Customer]: ...
+
+    def test_async_generator_method_in_async_repository(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+
+            class _Repository(AsyncRepository):
+                async def get(self, customer_id: int) -> AsyncGenerator[Customer, None]:
+                    yield Customer(customer_id=customer_id)
+
+    def test_mixed_methods_in_sync_repository(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+
+            class _Repository(Repository):
+                async def get(self, customer_id: int) -> Optional[Customer]: ...
+
+                def delete(self, customer_id: int): ...
+
+    def test_mixed_methods_in_sync_repository_subclass(self):
+        # Arrange
+        class _Repository(Repository):
+            async def get(self, customer_id: int) -> Optional[Customer]: ...
+
+        # Act & Assert
+        with self.assertRaises(TypeError):
+
+            class _ChildRepository(_Repository):
+                def delete(self, customer_id: int): ...
+
+    def test_async_methods_in_sync_repository(self):
+        # Act
+        class _Repository(Repository):
+            async def get(self, customer_id: int) -> Optional[Customer]: ...
+
+            async def delete(self, customer_id: int): ...
+
+        # Assert
+        self.assertTrue(inspect.iscoroutinefunction(_Repository.get))
+
+    def test_coroutine_streaming_method_in_async_repository(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+
+            class _Repository(AsyncRepository):
+                async def iter_list(self) -> List[Customer]:
+                    return []
+
+    def test_generator_streaming_method_in_async_repository(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+
+            class _Repository(AsyncRepository):
+                def iter_list(self) -> Iterator[Customer]:
+                    yield Customer(customer_id=1)
+
+    def test_async_repository_is_repository(self):
+        # Act & Assert
+        self.assertTrue(issubclass(CustomerRepository, Repository))
+
+
+class TestAsyncRepository(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.storage = MagicMock()
+        self.repository = CustomerRepository(storage=self.storage)
+
+    async def test_get_list_streaming(self):
+        # Act
+        customers = [customer async for customer in self.repository.get_list()]
+
+        # Assert
+        self.assertEqual([customer.customer_id for customer in customers], [0, 1])
+
+    async def test_derived_get_map(self):
+        # Act
+        customers = await self.repository.get_map([1, 2, 3])
+
+        # Assert
+        self.assertEqual(list(customers), [1, 2, 3])
+        self.assertEqual(CustomerRepository.get_map.__annotations__['pks'], List[int])
+
+    async def test_derived_bulk_delete(self):
+        # Act
+        await self.repository.bulk_delete([1, 2])
+
+        # Assert
+        self.assertEqual(self.storage.delete.call_count, 2)
+
+    async def test_identity_map(self):
+        # Act
+        with identity_map_scope():
+            customers = await self.repository.get_map([1, 2])
+            customer = await self.repository.get(1)
+            await self.repository.delete(1)
+            await self.repository.get(1)
+
+        # Assert
+        self.assertIs(customer, customers[1])
+        self.assertEqual(self.storage.get.call_count, 3)
+
+    async def test_streaming_method_returning_async_iterator(self):
+        # Arrange
+        class _Repository(AsyncRepository):
+            def iter_list(self) -> AsyncIterator[int]:
+                rows = iter(([0, 1], []))
+
+                async def fetch_many(_: int) -> List[int]:
+                    return next(rows)
+
+                return aiterate_cursor(fetch_many)
+
+        # Act
+        items = [item async for item in _Repository().iter_list()]
+
+        # Assert
+        self.assertEqual(items, [0, 1])
+
+    async def test_streaming_method_must_return_async_iterator(self):
+        # Arrange
+        class _Repository(AsyncRepository):
+            def iter_list(self) -> List[int]:
+                return []
+
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            _Repository().iter_list()
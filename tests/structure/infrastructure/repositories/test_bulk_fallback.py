@@ -0,0 +1,131 @@
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from dddesign.structure.domains.entities import Entity
+from dddesign.structure.infrastructure.repositories import Repository
+from dddesign.structure.infrastructure.repositories.bulk_fallback import is_derived
+
+session: ContextVar[Optional[str]] = ContextVar('session', default=None)
+
+
+class Customer(Entity):
+    customer_id: int
+    name: str
+
+
+class GetCustomerRepository(Repository):
+    DERIVE_BULK_METHODS: bool = True
+
+    storage: MagicMock
+
+    def get(self, customer_id: int) -> Optional[Customer]:
+        self.storage.get(customer_id)
+        return Customer(customer_id=customer_id, name='name') if customer_id > 0 else None
+
+    def create(self, customer: Customer) -> Customer:
+        self.storage.create(customer)
+        return customer
+
+    def delete(self, customer_id: int):
+        self.storage.delete(customer_id)
+
+
+class GetMapCustomerRepository(Repository):
+    DERIVE_BULK_METHODS: bool = True
+
+    storage: MagicMock
+
+    def get_map(self, customer_ids: List[int]) -> Dict[int, Customer]:
+        self.storage.get_map(customer_ids)
+        return {customer_id: Customer(customer_id=customer_id, name='name') for customer_id in customer_ids}
+
+
+class NativeCustomerRepository(GetCustomerRepository):
+    def get_map(self, customer_ids: List[int]) -> Dict[int, Customer]:  # noqa: ARG002
+        return {}
+
+
+class TestBulkFallback(TestCase):
+    def setUp(self):
+        self.storage = MagicMock()
+
+    def test_get_map_derived_from_get(self):
+        # Arrange
+        repository = GetCustomerRepository(storage=self.storage)
+
+        # Act
+        customers = repository.get_map([1, 2, 2, -1])
+
+        # Assert
+        self.assertTrue(is_derived(GetCustomerRepository.get_map))
+        self.assertEqual(set(customers), {1, 2})
+        self.assertEqual(self.storage.get.call_count, 3)
+        self.assertEqual(GetCustomerRepository.get_map.__annotations__, {'pks': List[int], 'return': Dict[int, Customer]})
+
+    def test_get_map_derived_from_get_sequentially_by_default(self):
+        # Arrange
+        repository = GetCustomerRepository(storage=self.storage)
+
+        # Act
+        customers = repository.get_map((1, 2))
+
+        # Assert
+        self.assertEqual(repository.BULK_FALLBACK_MAX_WORKERS, 1)
+        self.assertEqual(list(customers), [1, 2])
+
+    def test_get_map_derived_from_get_concurrently_keeps_context(self):
+        # Arrange
+        repository = GetCustomerRepository(storage=self.storage, BULK_FALLBACK_MAX_WORKERS=4)
+        sessions = []
+        self.storage.get.side_effect = lambda _: sessions.append(session.get())
+        token = session.set('session')
+        self.addCleanup(session.reset, token)
+
+        # Act
+        customers = repository.get_map([1, 2, 3, 4])
+
+        # Assert
+        self.assertEqual(list(customers), [1, 2, 3, 4])
+        self.assertEqual(sessions, ['session'] * 4)
+
+    def test_get_derived_from_get_map(self):
+        # Arrange
+        repository = GetMapCustomerRepository(storage=self.storage)
+
+        # Act
+        customer = repository.get(1)
+
+        # Assert
+        self.assertTrue(is_derived(GetMapCustomerRepository.get))
+        self.assertEqual(customer.customer_id, 1)
+        self.storage.get_map.assert_called_once_with([1])
+
+    def test_bulk_methods_derived_from_single_methods(self):
+        # Arrange
+        repository = GetCustomerRepository(storage=self.storage)
+        customers = [Customer(customer_id=1, name='first'), Customer(customer_id=2, name='second')]
+
+        # Act
+        created_customers = repository.bulk_create(customers)
+        repository.bulk_delete([1, 2])
+
+        # Assert
+        self.assertEqual(created_customers, customers)
+        self.assertEqual(self.storage.create.call_count, 2)
+        self.assertEqual(self.storage.delete.call_count, 2)
+        self.assertFalse(hasattr(repository, 'bulk_update'))
+
+    def test_native_method_is_preferred(self):
+        # Act & Assert
+        self.assertFalse(is_derived(NativeCustomerRepository.get_map))
+        self.assertEqual(NativeCustomerRepository(storage=self.storage).get_map([1]), {})
+
+    def test_disabled_by_default(self):
+        # Arrange
+        class CustomerRepository(Repository):
+            def get(self, customer_id: int) -> Optional[Customer]: ...
+
+        # Act & Assert
+        self.assertFalse(hasattr(CustomerRepository, 'get_map'))
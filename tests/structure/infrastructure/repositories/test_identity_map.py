@@ -0,0 +1,205 @@
+from typing import Dict, List, Optional
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from dddesign.structure.domains.entities import Entity
+from dddesign.structure.infrastructure.repositories import Repository, identity_map_scope
+
+
+class Customer(Entity):
+    customer_id: int
+    name: str
+
+
+class CustomerRepository(Repository):
+    USE_IDENTITY_MAP: bool = True
+
+    storage: MagicMock
+
+    def get(self, customer_id: int) -> Optional[Customer]:
+        return self.storage.get(customer_id)
+
+    def get_map(self, customer_ids: List[int]) -> Dict[int, Customer]:
+        return self.storage.get_map(customer_ids)
+
+    def update(self, customer: Customer):
+        self.storage.update(customer)
+
+
+class CustomerReadRepository(Repository):
+    USE_IDENTITY_MAP: bool = True
+    IDENTITY_MAP_KEY: Optional[str] = 'customer'
+
+    storage: MagicMock
+
+    def get(self, customer_id: int) -> Optional[Customer]:
+        return self.storage.get(customer_id)
+
+
+class CustomerWriteRepository(Repository):
+    USE_IDENTITY_MAP: bool = True
+    IDENTITY_MAP_KEY: Optional[str] = 'customer'
+
+    storage: MagicMock
+
+    def update(self, customer: Customer):
+        self.storage.update(customer)
+
+
+class PlainCustomerRepository(Repository):
+    storage: MagicMock
+
+    def get(self, customer_id: int) -> Optional[Customer]:
+        return self.storage.get(customer_id)
+
+
+def create_storage() -> MagicMock:
+    storage = MagicMock()
+    storage.get.side_effect = lambda customer_id: Customer(customer_id=customer_id, name='name') if customer_id > 0 else None
+    storage.get_map.side_effect = lambda customer_ids: {
+        customer_id: Customer(customer_id=customer_id, name='name') for customer_id in customer_ids
+    }
+    return storage
+
+
+class TestIdentityMap(TestCase):
+    def setUp(self):
+        self.storage = create_storage()
+        self.repository = CustomerRepository(storage=self.storage)
+
+    def test_get_is_loaded_once_within_scope(self):
+        # Act
+        with identity_map_scope():
+            first = self.repository.get(1)
+            second = self.repository.get(customer_id=1)
+
+        # Assert
+        self.assertIs(first, second)
+        self.storage.get.assert_called_once_with(1)
+
+    def test_get_without_scope(self):
+        # Act
+        first = self.repository.get(1)
+        second = self.repository.get(1)
+
+        # Assert
+        self.assertIsNot(first, second)
+        self.assertEqual(self.storage.get.call_count, 2)
+
+    def test_scopes_are_isolated(self):
+        # Act
+        with identity_map_scope():
+            first = self.repository.get(1)
+        with identity_map_scope():
+            second = self.repository.get(1)
+
+        # Assert
+        self.assertIsNot(first, second)
+
+    def test_nested_scopes_share_map(self):
+        # Act
+        with identity_map_scope():
+            first = self.repository.get(1)
+            with identity_map_scope():
+                second = self.repository.get(1)
+
+        # Assert
+        self.assertIs(first, second)
+
+    def test_missing_entity_is_not_memoized(self):
+        # Act
+        with identity_map_scope():
+            self.repository.get(-1)
+            self.repository.get(-1)
+
+        # Assert
+        self.assertEqual(self.storage.get.call_count, 2)
+
+    def test_get_map_loads_only_missing_entities(self):
+        # Act
+        with identity_map_scope():
+            customer = self.repository.get(1)
+            customers = self.repository.get_map([1, 2, 3])
+            customers_again = self.repository.get_map([2, 3])
+
+        # Assert
+        self.storage.get_map.assert_called_once_with([2, 3])
+        self.assertIs(customers[1], customer)
+        self.assertEqual(list(customers), [1, 2, 3])
+        self.assertIs(customers_again[2], customers[2])
+
+    def test_get_is_served_from_get_map(self):
+        # Act
+        with identity_map_scope():
+            customers = self.repository.get_map([1, 2])
+            customer = self.repository.get(2)
+
+        # Assert
+        self.storage.get.assert_not_called()
+        self.assertIs(customer, customers[2])
+
+    def test_write_invalidates_map(self):
+        # Act
+        with identity_map_scope():
+            customer = self.repository.get(1)
+            self.repository.update(customer)
+            self.repository.get(1)
+
+        # Assert
+        self.assertEqual(self.storage.get.call_count, 2)
+
+    def test_instances_do_not_share_map(self):
+        # Arrange
+        other_storage = create_storage()
+        other_repository = CustomerRepository(storage=other_storage)
+
+        # Act
+        with identity_map_scope():
+            first = self.repository.get(1)
+            second = other_repository.get(1)
+
+        # Assert
+        self.assertIsNot(first, second)
+        self.storage.get.assert_called_once_with(1)
+        other_storage.get.assert_called_once_with(1)
+
+    def test_instances_with_explicit_key_share_map(self):
+        # Arrange
+        read_repository = CustomerReadRepository(storage=self.storage)
+        other_read_repository = CustomerReadRepository(storage=self.storage)
+
+        # Act
+        with identity_map_scope():
+            first = read_repository.get(1)
+            second = other_read_repository.get(1)
+
+        # Assert
+        self.assertIs(first, second)
+        self.storage.get.assert_called_once_with(1)
+
+    def test_explicit_key_is_shared_between_classes(self):
+        # Arrange
+        read_repository = CustomerReadRepository(storage=self.storage)
+        write_repository = CustomerWriteRepository(storage=self.storage)
+
+        # Act
+        with identity_map_scope():
+            customer = read_repository.get(1)
+            read_repository.get(1)
+            write_repository.update(customer)
+            read_repository.get(1)
+
+        # Assert
+        self.assertEqual(self.storage.get.call_count, 2)
+
+    def test_disabled_by_default(self):
+        # Arrange
+        repository = PlainCustomerRepository(storage=self.storage)
+
+        # Act
+        with identity_map_scope():
+            repository.get(1)
+            repository.get(1)
+
+        # Assert
+        self.assertEqual(self.storage.get.call_count, 2)
@@ -1,12 +1,66 @@
+from typing import Iterator, List
 from unittest import TestCase
 
-from dddesign.structure.infrastructure.repositories import Repository
+from dddesign.structure.domains.entities import Entity
+from dddesign.structure.infrastructure.repositories import Repository, iterate_cursor
 from tests.structure.validators import validate_arbitrary_types_allowed, validate_immutable
 
 
+class Customer(Entity):
+    customer_id: int
+
+
 class TestRepository(TestCase):
     def test_immutable(self):
         validate_immutable(Repository, 'get')
 
     def test_arbitrary_types_allowed(self):
         validate_arbitrary_types_allowed(Repository, 'get')
+
+    def test_streaming_method_must_return_iterator(self):
+        # Arrange
+        class _Repository(Repository):
+            def iter_list(self) -> List[Customer]:
+                return []
+
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            _Repository().iter_list()
+
+    def test_streaming_method_must_not_be_coroutine(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+
+            class _Repository(Repository):
+                async def iter_list(self) -> List[Customer]:
+                    return []
+
+    def test_streaming_method_returning_iterator(self):
+        # Arrange
+        class CustomerRepository(Repository):
+            def iter_list(self) -> Iterator[Customer]:
+                rows = iter(([{'customer_id': 0}, {'customer_id': 1}], []))
+                return (Customer(**row) for row in iterate_cursor(lambda _: next(rows), chunk_size=2))
+
+        class ChildCustomerRepository(CustomerRepository): ...
+
+        # Act
+        customers = list(ChildCustomerRepository().iter_list())
+
+        # Assert
+        self.assertEqual([customer.customer_id for customer in customers], [0, 1])
+        self.assertIs(ChildCustomerRepository.iter_list, CustomerRepository.iter_list)
+
+    def test_streaming_method(self):
+        # Arrange
+        class CustomerRepository(Repository):
+            def iter_list(self) -> Iterator[Customer]:
+                for customer_id in range(3):
+                    yield Customer(customer_id=customer_id)
+
+        # Act
+        customers = CustomerRepository().iter_list()
+
+        # Assert
+        self.assertIsInstance(customers, Iterator)
+        self.assertEqual([customer.customer_id for customer in customers], [0, 1, 2])
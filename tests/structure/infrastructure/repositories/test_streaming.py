@@ -0,0 +1,79 @@
+from typing import List
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from parameterized import parameterized
+
+from dddesign.structure.infrastructure.repositories import (
+    aiterate_cursor,
+    aiterate_cursor_chunks,
+    iterate_cursor,
+    iterate_cursor_chunks,
+)
+
+
+class Cursor:
+    def __init__(self, rows: List[int]):
+        self.rows = rows
+        self.fetch_count = 0
+
+    def fetchmany(self, size: int) -> List[int]:
+        self.fetch_count += 1
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+    async def afetchmany(self, size: int) -> List[int]:
+        return self.fetchmany(size)
+
+
+class TestStreaming(TestCase):
+    @parameterized.expand(((5, 2, [[0, 1], [2, 3], [4]]), (4, 2, [[0, 1], [2, 3]]), (0, 2, [])))
+    def test_iterate_cursor_chunks(self, rows_count, chunk_size, expected_chunks):
+        # Arrange
+        cursor = Cursor(list(range(rows_count)))
+
+        # Act
+        chunks = list(iterate_cursor_chunks(cursor.fetchmany, chunk_size))
+
+        # Assert
+        self.assertEqual(chunks, expected_chunks)
+        self.assertEqual(cursor.fetch_count, len(expected_chunks) + 1)
+
+    def test_iterate_cursor_is_lazy(self):
+        # Arrange
+        cursor = Cursor(list(range(5)))
+
+        # Act
+        rows = iterate_cursor(cursor.fetchmany, chunk_size=2)
+        first_row = next(rows)
+
+        # Assert
+        self.assertEqual(first_row, 0)
+        self.assertEqual(cursor.fetch_count, 1)
+        self.assertEqual(list(rows), [1, 2, 3, 4])
+
+    def test_invalid_chunk_size(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            next(iterate_cursor_chunks(Cursor([]).fetchmany, chunk_size=0))
+
+
+class TestAsyncStreaming(IsolatedAsyncioTestCase):
+    async def test_aiterate_cursor_chunks(self):
+        # Arrange
+        cursor = Cursor(list(range(3)))
+
+        # Act
+        chunks = [chunk async for chunk in aiterate_cursor_chunks(cursor.afetchmany, chunk_size=2)]
+
+        # Assert
+        self.assertEqual(chunks, [[0, 1], [2]])
+
+    async def test_aiterate_cursor(self):
+        # Arrange
+        cursor = Cursor(list(range(3)))
+
+        # Act
+        rows = [row async for row in aiterate_cursor(cursor.afetchmany, chunk_size=2)]
+
+        # Assert
+        self.assertEqual(rows, [0, 1, 2])
@@ -1,12 +1,74 @@
 from unittest import TestCase
 
 from dddesign.structure.services import Service
+from dddesign.utils.instrumentation import InMemoryMetricsSink, add_exporter, remove_exporter
+from dddesign.utils.instrumentation.instrument import is_instrumented
 from tests.structure.validators import validate_arbitrary_types_allowed, validate_immutable
 
 
+class SumService(Service):
+    INSTRUMENT = True
+
+    first: int
+    second: int
+
+    def handle(self) -> int:
+        return self.first + self.second
+
+
 class TestService(TestCase):
     def test_immutable(self):
         validate_immutable(Service)
 
     def test_arbitrary_types_allowed(self):
         validate_arbitrary_types_allowed(Service)
+
+    def test_instrumented_handle(self):
+        # Arrange
+        sink = InMemoryMetricsSink()
+        add_exporter(sink)
+
+        # Act
+        try:
+            result = SumService(first=1, second=2).handle()
+        finally:
+            remove_exporter(sink)
+
+        # Assert
+        self.assertEqual(result, 3)
+        self.assertTrue(is_instrumented(SumService.handle))
+        self.assertEqual(sink.get(f'{SumService.__module__}.SumService').calls, 1)
+
+    def test_not_instrumented_by_default(self):
+        # Arrange
+        class _Service(Service):
+            def handle(self): ...
+
+        # Act & Assert
+        self.assertFalse(is_instrumented(_Service.handle))
+
+    def test_instrument_flags_are_not_fields(self):
+        # Act & Assert
+        self.assertNotIn('INSTRUMENT', SumService.model_fields)
+        self.assertNotIn('TRACE_MEMORY', SumService.model_fields)
+        self.assertEqual(SumService(first=1, second=2).model_dump(), {'first': 1, 'second': 2})
+
+    def test_overridden_handle_is_recorded_once(self):
+        # Arrange
+        class DoubleSumService(SumService):
+            def handle(self) -> int:
+                return super().handle() * 2
+
+        sink = InMemoryMetricsSink()
+        add_exporter(sink)
+
+        # Act
+        try:
+            result = DoubleSumService(first=1, second=2).handle()
+        finally:
+            remove_exporter(sink)
+
+        # Assert
+        self.assertEqual(result, 6)
+        self.assertTrue(is_instrumented(DoubleSumService.handle))
+        self.assertEqual(sink.get(f'{DoubleSumService.__module__}.{DoubleSumService.__qualname__}').calls, 1)
@@ -0,0 +1,173 @@
+from typing import ClassVar
+from unittest import TestCase
+
+from pydantic import AliasChoices, ConfigDict, Field, ValidationError, field_validator, model_validator
+
+from dddesign.structure.domains.entities import Entity
+from dddesign.utils.base_model import TrackChangesMixin
+
+
+class SomeEntity(TrackChangesMixin, Entity):
+    str_field: str
+    int_field: int
+    frozen_field: str = Field(default='frozen', frozen=True)
+
+    @field_validator('str_field')
+    @classmethod
+    def strip_str_field(cls, value: str) -> str:
+        return value.strip()
+
+    @model_validator(mode='after')
+    def validate_consistency(self):
+        if self.int_field < 0 and self.str_field:
+            raise ValueError('`int_field` must be positive when `str_field` is set')
+        return self
+
+
+class PasswordEntity(Entity):
+    name: str
+    password: str
+
+    @field_validator('password')
+    @classmethod
+    def hash_password(cls, value: str) -> str:
+        return f'hash({value})'
+
+
+class RangeEntity(Entity):
+    validate_range_calls: ClassVar[int] = 0
+
+    lo: int
+    hi: int
+
+    @model_validator(mode='after')
+    def validate_range(self):
+        RangeEntity.validate_range_calls += 1
+        if self.lo > self.hi:
+            raise ValueError('lo > hi')
+        return self
+
+
+class AliasEntity(Entity):
+    str_field: str = Field(validation_alias=AliasChoices('str_field', 'strField'))
+    int_field: int
+
+
+class TestBulkAssignMixin(TestCase):
+    def setUp(self):
+        self.entity = SomeEntity(str_field='initial', int_field=1)
+
+    def test_assign_values(self):
+        # Act
+        self.entity.bulk_assign(str_field=' changed ', int_field='2')
+
+        # Assert
+        self.assertEqual(self.entity.str_field, 'changed')
+        self.assertEqual(self.entity.int_field, 2)
+
+    def test_changes_are_tracked(self):
+        # Act
+        self.entity.bulk_assign(str_field='changed', int_field=2)
+
+        # Assert
+        self.assertEqual(set(self.entity.changed_fields), {'str_field', 'int_field'})
+        self.assertEqual(self.entity.diffs, {'str_field': ('initial', 'changed'), 'int_field': (1, 2)})
+
+    def test_rollback_on_field_error(self):
+        # Act & Assert
+        with self.assertRaises(ValidationError):
+            self.entity.bulk_assign(str_field='changed', int_field='not int')
+
+        self.assertEqual(self.entity.str_field, 'initial')
+        self.assertEqual(self.entity.int_field, 1)
+        self.assertFalse(self.entity.has_changed)
+
+    def test_rollback_on_model_error(self):
+        # Act & Assert
+        with self.assertRaises(ValidationError):
+            self.entity.bulk_assign(str_field='changed', int_field=-1)
+
+        self.assertEqual(self.entity.str_field, 'initial')
+        self.assertEqual(self.entity.int_field, 1)
+
+    def test_model_validator_runs_on_final_state(self):
+        # Act
+        self.entity.bulk_assign(str_field='', int_field=-1)
+
+        # Assert
+        self.assertEqual(self.entity.int_field, -1)
+
+        # Act & Assert
+        with self.assertRaises(ValidationError):
+            self.entity.bulk_assign(int_field=-2, str_field='changed')
+
+        self.assertEqual((self.entity.str_field, self.entity.int_field), ('', -1))
+
+    def test_cross_field_invariant(self):
+        # Arrange
+        entity = RangeEntity(lo=0, hi=1)
+        calls_count = RangeEntity.validate_range_calls
+
+        # Act
+        entity.bulk_assign(lo=5, hi='10')
+
+        # Assert
+        self.assertEqual((entity.lo, entity.hi), (5, 10))
+        self.assertEqual(RangeEntity.validate_range_calls - calls_count, 1)
+
+        # Act & Assert
+        with self.assertRaisesRegex(ValidationError, 'lo > hi'):
+            entity.bulk_assign(lo=20, hi=15)
+
+        self.assertEqual((entity.lo, entity.hi), (5, 10))
+
+    def test_untouched_fields_are_not_revalidated(self):
+        # Arrange
+        entity = PasswordEntity(name='a', password='x')
+
+        # Act
+        entity.bulk_assign(name='b')
+
+        # Assert
+        self.assertEqual((entity.name, entity.password), ('b', 'hash(x)'))
+        self.assertEqual(entity.model_fields_set, {'name', 'password'})
+
+    def test_unknown_field(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            self.entity.bulk_assign(unknown_field='value')
+
+    def test_frozen_field(self):
+        # Act & Assert
+        with self.assertRaises(ValidationError) as context:
+            self.entity.bulk_assign(frozen_field='changed')
+
+        self.assertEqual(context.exception.errors()[0]['type'], 'frozen_field')
+
+    def test_alias_fallback(self):
+        # Arrange
+        entity = AliasEntity(strField='initial', int_field=1)
+
+        # Act & Assert
+        entity.bulk_assign(str_field='changed', int_field=2)
+        self.assertEqual((entity.str_field, entity.int_field), ('changed', 2))
+
+        with self.assertRaises(ValidationError):
+            entity.bulk_assign(str_field='rolled back', int_field='not int')
+        self.assertEqual((entity.str_field, entity.int_field), ('changed', 2))
+
+    def test_frozen_model(self):
+        # Arrange
+        class FrozenEntity(Entity):
+            model_config = ConfigDict(frozen=True)
+
+            str_field: str
+
+        entity = FrozenEntity(str_field='initial')
+
+        # Act & Assert
+        with self.assertRaises(ValidationError) as context:
+            entity.bulk_assign(str_field='changed')
+
+        self.assertEqual(context.exception.errors()[0]['type'], 'frozen_instance')
+        self.assertEqual(entity.str_field, 'initial')
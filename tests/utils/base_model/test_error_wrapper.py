@@ -188,6 +188,22 @@ class TestWrapErrorFunction(TestCase):
         self.assertEqual('list_max_two_elements_field.1', collection_error.errors[0].field_name)
         self.assertEqual('Input should be a valid string', collection_error.errors[0].message)
 
+    def test_field_name_prefix(self):
+        # Arrange
+        collection_error = None
+
+        # Act
+        try:
+            SomeModel(**{**self.correct_required_fields_data, 'list_max_two_elements_field': ['one', 2]})
+        except ValidationError as e:
+            collection_error = wrap_error(e, field_name_prefix='items.17')
+
+        if collection_error is None:
+            raise AssertionError('The `ValidationError` exception was not raised')
+
+        # Assert
+        self.assertEqual('items.17.list_max_two_elements_field.1', collection_error.errors[0].field_name)
+
     def test_context_messages_param(self):
         # Arrange
         collection_error = None
@@ -296,3 +312,20 @@ class TestWrapErrorFunction(TestCase):
         self.assertEqual(len(collection_error.errors), 1)
         self.assertTrue(all(isinstance(err, BaseError) for err in collection_error.errors))
         self.assertEqual('nested_model_field.int_field', collection_error.errors[0].field_name)
+
+    def test_max_errors(self):
+        # Arrange
+        collection_error = None
+
+        # Act
+        try:
+            SomeModel()
+        except ValidationError as e:
+            collection_error = wrap_error(e, max_errors=2)
+
+        if collection_error is None:
+            raise AssertionError('The `ValidationError` exception was not raised')
+
+        # Assert
+        self.assertEqual(len(collection_error.errors), 2)
+        self.assertTrue(collection_error.is_full)
@@ -0,0 +1,73 @@
+from typing import List, Optional
+from unittest import TestCase
+
+from pydantic import BaseModel, ValidationError, field_validator, model_validator
+
+from dddesign.utils.base_model.field_validation import get_model_validators, validate_fields, validate_model
+
+
+class Node(BaseModel):
+    name: str
+    parent: Optional['Node'] = None
+    children: List['Node'] = []
+
+    @field_validator('name')
+    @classmethod
+    def strip_name(cls, value: str) -> str:
+        return value.strip()
+
+    @model_validator(mode='after')
+    def validate_parent(self):
+        if self.parent is not None and self.parent.name == self.name:
+            raise ValueError('Parent must have another name')
+        return self
+
+
+class Leaf(BaseModel):
+    name: str
+
+
+class TestFieldValidation(TestCase):
+    def test_validate_fields(self):
+        # Arrange
+        node = Node(name='root')
+
+        # Act
+        data, fields_set = validate_fields(node, {'name': ' changed ', 'children': [{'name': ' child '}]})
+
+        # Assert
+        self.assertEqual(data['name'], 'changed')
+        self.assertEqual(data['children'], [Node(name='child')])
+        self.assertEqual(fields_set, {'name', 'children'})
+        self.assertEqual(node.name, 'root')
+
+    def test_validate_fields_skips_model_validators(self):
+        # Arrange
+        node = Node(name='child', parent=Node(name='root'))
+
+        # Act
+        data, _ = validate_fields(node, {'name': 'root'})
+
+        # Assert
+        self.assertEqual(data['name'], 'root')
+
+    def test_validate_fields_error(self):
+        # Act & Assert
+        with self.assertRaises(ValidationError):
+            validate_fields(Node(name='root'), {'children': 'not list'})
+
+    def test_validate_model(self):
+        # Arrange
+        node = Node.model_construct(name='root', parent=Node(name='root'), children=[])
+
+        # Act & Assert
+        with self.assertRaisesRegex(ValidationError, 'Parent must have another name'):
+            validate_model(node)
+
+    def test_model_without_model_validators(self):
+        # Act
+        validators = get_model_validators(Leaf)
+
+        # Assert
+        self.assertIsNone(validators.model)
+        validate_model(Leaf(name='leaf'))
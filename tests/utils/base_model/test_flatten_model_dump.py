@@ -3,7 +3,7 @@ from unittest import TestCase
 
 from pydantic import BaseModel
 
-from dddesign.utils.base_model import flatten_model_dump
+from dddesign.utils.base_model import flatten_model_dump, flatten_model_dump_columns, iter_flatten_model_dump
 
 
 class Headers(BaseModel):
@@ -104,3 +104,94 @@ class TestFlattenModelDump(TestCase):
         self.assertNotIn('headers.authorization', result)
         self.assertNotIn('headers.content_type', result)
         self.assertIn('body', result)
+
+    def test_flatten_lists(self):
+        # Arrange
+        request = Request(
+            headers=Headers(authorization='Bearer token', content_type='application/json'),
+            body='data',
+            tags=['a', 'b'],
+            filters=Filters(pagination=Pagination(page=1, size=10), query='test'),
+        )
+
+        # Act
+        result = flatten_model_dump(request, flatten_lists=True)
+
+        # Assert
+        self.assertEqual(result['tags.0'], 'a')
+        self.assertEqual(result['tags.1'], 'b')
+        self.assertNotIn('tags', result)
+        self.assertEqual(result['filters.pagination.size'], 10)
+
+    def test_iter_flatten_model_dump(self):
+        # Arrange
+        request = Request(headers=Headers(authorization='Bearer token', content_type='application/json'), body='data', tags=[])
+
+        # Act
+        items = list(iter_flatten_model_dump(request))
+
+        # Assert
+        self.assertEqual(
+            items,
+            [
+                ('headers.authorization', 'Bearer token'),
+                ('headers.content_type', 'application/json'),
+                ('body', 'data'),
+                ('tags', []),
+                ('filters', None),
+            ],
+        )
+
+
+class TestFlattenModelDumpColumns(TestCase):
+    def test_flat_models(self):
+        # Arrange
+        data = [Flat(a=1, b='x'), Flat(a=2, b='y')]
+
+        # Act & Assert
+        self.assertEqual(flatten_model_dump_columns(data), {'a': [1, 2], 'b': ['x', 'y']})
+
+    def test_empty_sequence(self):
+        # Act & Assert
+        self.assertEqual(flatten_model_dump_columns([]), {})
+
+    def test_columns_are_aligned_with_rows(self):
+        # Arrange
+        headers = Headers(authorization='Bearer token', content_type='application/json')
+        data = [
+            Request(headers=headers, body='first', tags=[]),
+            Request(
+                headers=headers, body='second', tags=['a'], filters=Filters(pagination=Pagination(page=1, size=10), query='q')
+            ),
+            Request(headers=headers, body='third', tags=[]),
+        ]
+
+        # Act
+        columns = flatten_model_dump_columns(data)
+
+        # Assert
+        self.assertEqual(columns['body'], ['first', 'second', 'third'])
+        self.assertEqual(columns['filters'], [None, None, None])
+        self.assertEqual(columns['filters.pagination.page'], [None, 1, None])
+        self.assertEqual(columns['filters.query'], [None, 'q', None])
+        self.assertTrue(all(len(column) == len(data) for column in columns.values()))
+
+    def test_matches_flatten_model_dump(self):
+        # Arrange
+        data = [
+            Request(
+                headers=Headers(authorization=f'token {index}', content_type='application/json'),
+                body=str(index),
+                tags=[str(index)],
+                filters=Filters(pagination=Pagination(page=index, size=10), query='q'),
+            )
+            for index in range(3)
+        ]
+
+        # Act
+        columns = flatten_model_dump_columns(data, separator='__', flatten_lists=True, exclude={'body'})
+
+        # Assert
+        for index, item in enumerate(data):
+            row = flatten_model_dump(item, separator='__', flatten_lists=True, exclude={'body'})
+            self.assertEqual({key: column[index] for key, column in columns.items()}, row)
@@ -0,0 +1,79 @@
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from parameterized import parameterized
+from pydantic import Field
+
+from dddesign.structure.domains.dto import DataTransferObject
+from dddesign.structure.domains.errors import CollectionError
+from dddesign.utils.base_model import iter_json_lines, iter_model_batches, iter_model_batches_from_file
+
+
+class UserDTO(DataTransferObject):
+    name: str
+    age: int = Field(ge=0)
+
+
+NDJSON = (
+    b'{"name": "user1", "age": 1}\n'
+    b'{"name": "user2", "age": -1}\r\n'
+    b'\n'
+    b'{"name": "user3", "age": 3}\n'
+    b'{"name": "user4", \n'
+    b'{"name": "user5", "age": 5}'
+)
+
+
+class TestIterJsonLines(TestCase):
+    @parameterized.expand(
+        (
+            ('bytes', NDJSON),
+            ('stream', io.BytesIO(NDJSON)),
+            ('chunks', (NDJSON[index : index + 7] for index in range(0, len(NDJSON), 7))),
+        )
+    )
+    def test_lines(self, _, source):
+        # Act
+        lines = [bytes(line) for line in iter_json_lines(source, read_size=5)]
+
+        # Assert
+        self.assertEqual(lines, NDJSON.split(b'\n'))
+
+
+class TestIterModelBatches(TestCase):
+    def test_batches(self):
+        # Act
+        batches = list(iter_model_batches(UserDTO, io.BytesIO(NDJSON), batch_size=2))
+
+        # Assert
+        self.assertEqual([[item.name for item in batch.items] for batch in batches], [['user1'], ['user3'], ['user5']])
+        self.assertTrue(all(isinstance(batch.errors, CollectionError) for batch in batches))
+        self.assertEqual([[error.field_name for error in batch.errors] for batch in batches], [['line.2.age'], ['line.5'], []])
+
+    def test_max_errors(self):
+        # Act
+        batches = list(iter_model_batches(UserDTO, b'{}\n{}\n', max_errors=1))
+
+        # Assert
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0].errors), 1)
+
+    def test_incorrect_batch_size(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            next(iter_model_batches(UserDTO, NDJSON, batch_size=0))
+
+    @parameterized.expand(((NDJSON, ['user1', 'user3', 'user5']), (b'', [])))
+    def test_from_file(self, content, expected_names):
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.ndjson', delete=False) as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+
+        # Act
+        batches = list(iter_model_batches_from_file(UserDTO, file.name))
+
+        # Assert
+        self.assertEqual([item.name for batch in batches for item in batch.items], expected_names)
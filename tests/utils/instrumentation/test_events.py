@@ -0,0 +1,57 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from dddesign.utils.instrumentation import Event, emit, has_observers, subscribe, unsubscribe
+
+
+class TestEvents(TestCase):
+    def test_subscribe_to_event(self):
+        # Arrange
+        observer = MagicMock()
+        event = Event(name='first', source=None)
+
+        # Act
+        subscribe(observer, 'first')
+        try:
+            emit(event)
+            emit(Event(name='second', source=None))
+        finally:
+            unsubscribe(observer)
+
+        # Assert
+        observer.assert_called_once_with(event)
+        self.assertFalse(has_observers('first'))
+
+    def test_subscribe_to_all_events(self):
+        # Arrange
+        observer = MagicMock()
+
+        # Act
+        subscribe(observer)
+        try:
+            emit(Event(name='first', source=None))
+            emit(Event(name='second', source=None))
+            has_any_observers = has_observers('third')
+        finally:
+            unsubscribe(observer)
+
+        # Assert
+        self.assertEqual(observer.call_count, 2)
+        self.assertTrue(has_any_observers)
+
+    def test_unsubscribe_from_event(self):
+        # Arrange
+        observer = MagicMock()
+        subscribe(observer, 'first', 'second')
+
+        # Act
+        unsubscribe(observer, 'first')
+        try:
+            emit(Event(name='first', source=None))
+            emit(Event(name='second', source=None))
+        finally:
+            unsubscribe(observer)
+
+        # Assert
+        observer.assert_called_once()
+        self.assertFalse(has_observers('second'))
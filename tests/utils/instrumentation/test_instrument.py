@@ -0,0 +1,119 @@
+import tracemalloc
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from dddesign.structure.domains.errors import BaseError
+from dddesign.utils.instrumentation import InMemoryMetricsSink, add_exporter, instrument_method, remove_exporter
+
+
+class NotFoundError(BaseError):
+    message = 'Object not found'
+
+
+class Handler:
+    def handle(self, value: int) -> int:
+        if value < 0:
+            raise NotFoundError
+        elif value == 0:
+            raise ValueError
+        return value
+
+    async def ahandle(self, value: int) -> int:
+        return self.handle(value)
+
+    def allocate(self) -> bytes:
+        return bytes(100_000)
+
+
+Handler.handle = instrument_method(Handler.handle)  # type: ignore[method-assign]
+Handler.ahandle = instrument_method(Handler.ahandle)  # type: ignore[method-assign]
+Handler.allocate = instrument_method(Handler.allocate, trace_memory=True)  # type: ignore[method-assign]
+
+HANDLER_NAME = f'{Handler.__module__}.Handler'
+
+
+class ChildHandler(Handler):
+    async def ahandle(self, value: int) -> int:
+        return await super().ahandle(value + 1)
+
+
+ChildHandler.ahandle = instrument_method(ChildHandler.ahandle)  # type: ignore[method-assign]
+
+
+class TestInstrumentMethod(TestCase):
+    def setUp(self):
+        self.sink = InMemoryMetricsSink()
+        add_exporter(self.sink)
+
+    def tearDown(self):
+        remove_exporter(self.sink)
+
+    def test_calls_are_recorded(self):
+        # Act
+        result = Handler().handle(1)
+        with self.assertRaises(NotFoundError):
+            Handler().handle(-1)
+        with self.assertRaises(ValueError):
+            Handler().handle(0)
+
+        # Assert
+        metrics = self.sink.get(HANDLER_NAME)
+        self.assertEqual(result, 1)
+        self.assertEqual(metrics.calls, 3)
+        self.assertEqual(dict(metrics.errors_by_code), {'not_found_error': 1, 'ValueError': 1})
+        self.assertGreater(metrics.wall_time_total, 0)
+
+    def test_nothing_is_recorded_without_exporters(self):
+        # Arrange
+        remove_exporter(self.sink)
+
+        # Act
+        Handler().handle(1)
+
+        # Assert
+        self.assertEqual(self.sink.snapshot(), {})
+
+    def test_memory_delta(self):
+        # Arrange
+        tracemalloc.start()
+
+        # Act
+        try:
+            data = Handler().allocate()
+        finally:
+            tracemalloc.stop()
+
+        # Assert
+        self.assertEqual(len(data), 100_000)
+        self.assertGreaterEqual(self.sink.get(HANDLER_NAME).memory_delta_total, 100_000)
+
+
+class TestInstrumentAsyncMethod(IsolatedAsyncioTestCase):
+    async def test_calls_are_recorded(self):
+        # Arrange
+        sink = InMemoryMetricsSink()
+        add_exporter(sink)
+
+        # Act
+        try:
+            result = await Handler().ahandle(1)
+        finally:
+            remove_exporter(sink)
+
+        # Assert
+        self.assertEqual(result, 1)
+        self.assertEqual(sink.get(HANDLER_NAME).calls, 2)  # `handle` is called by `ahandle`
+
+    async def test_super_call_is_recorded_once(self):
+        # Arrange
+        sink = InMemoryMetricsSink()
+        add_exporter(sink)
+
+        # Act
+        try:
+            result = await ChildHandler().ahandle(1)
+        finally:
+            remove_exporter(sink)
+
+        # Assert
+        self.assertEqual(result, 2)
+        self.assertEqual(sink.get(f'{ChildHandler.__module__}.ChildHandler').calls, 2)  # `ahandle` and `handle`
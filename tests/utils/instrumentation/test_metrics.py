@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from dddesign.utils.instrumentation import CallRecord, InMemoryMetricsSink
+
+
+class TestInMemoryMetricsSink(TestCase):
+    def test_export(self):
+        # Arrange
+        sink = InMemoryMetricsSink()
+
+        # Act
+        sink.export(CallRecord(name='service', wall_time=0.2, cpu_time=0.1))
+        sink.export(CallRecord(name='service', wall_time=0.4, cpu_time=0.1, error_code='not_found', memory_delta=10))
+        sink.export(CallRecord(name='service', wall_time=0.3, cpu_time=0.1, error_code='not_found'))
+
+        # Assert
+        metrics = sink.get('service')
+        self.assertEqual(metrics.calls, 3)
+        self.assertEqual(metrics.errors, 2)
+        self.assertEqual(dict(metrics.errors_by_code), {'not_found': 2})
+        self.assertAlmostEqual(metrics.wall_time_mean, 0.3)
+        self.assertEqual((metrics.wall_time_min, metrics.wall_time_max), (0.2, 0.4))
+        self.assertAlmostEqual(metrics.cpu_time_total, 0.3)
+        self.assertEqual(metrics.memory_delta_total, 10)
+
+    def test_reset(self):
+        # Arrange
+        sink = InMemoryMetricsSink()
+        sink.export(CallRecord(name='service', wall_time=0.1, cpu_time=0.1))
+        snapshot = sink.snapshot()
+
+        # Act
+        sink.reset()
+
+        # Assert
+        self.assertEqual(snapshot['service'].calls, 1)
+        self.assertEqual(sink.get('service').calls, 0)
+        self.assertEqual(sink.snapshot(), {})
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from typing import Set
+from unittest import TestCase
+
+from parameterized import parameterized
+
+import dddesign
+from dddesign.structure.domains import entities
+
+
+def get_imported_modules(statement: str) -> Set[str]:
+    # `-X importtime` reports every module imported by the statement, even ones imported by the interpreter startup
+    result = subprocess.run((sys.executable, '-X', 'importtime', '-c', statement), capture_output=True, text=True, check=True)
+    return {
+        line.rsplit('|', 1)[1].strip() for line in result.stderr.splitlines() if line.startswith('import time:') and '|' in line
+    } - {'package'}
+
+
+class TestLazyImport(TestCase):
+    @parameterized.expand(
+        (
+            ('import dddesign',),
+            ('from dddesign.structure.domains.errors import BaseError',),
+            ('from dddesign.structure.domains.constants import BaseEnum, ChoiceEnum',),
+        )
+    )
+    def test_import_does_not_build_models(self, statement):
+        # Act
+        imported_modules = get_imported_modules(statement)
+
+        # Assert
+        self.assertNotIn('pydantic', imported_modules)
+        self.assertNotIn('unittest.mock', imported_modules)
+
+    def test_import_of_one_symbol(self):
+        # Act
+        imported_modules = get_imported_modules('from dddesign.structure.domains.entities import Entity')
+
+        # Assert
+        self.assertIn('dddesign.structure.domains.entities.entity', imported_modules)
+        self.assertNotIn('dddesign.structure.applications', imported_modules)
+        self.assertNotIn('dddesign.structure.infrastructure', imported_modules)
+
+    def test_attributes(self):
+        # Act & Assert
+        self.assertIs(dddesign.structure.domains.entities.Entity, entities.Entity)
+        self.assertIn('Entity', dir(entities))
+        self.assertEqual(entities.__all__, ('Entity',))
+        with self.assertRaises(AttributeError):
+            entities.Unknown  # noqa: B018